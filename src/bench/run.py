@@ -0,0 +1,267 @@
+"""
+오프라인 종단 간(end-to-end) 벤치마크
+
+로컬 대역 서버(fixtures.KinoFixtureServer)를 띄우고 실제 크롤러를 그 주소로 돌려
+처리량과 지연, 메모리, DB 저장 시간을 측정합니다. 기준값(baseline.json)과 비교해
+성능이 허용 범위 이상 나빠지면 종료 코드 1로 끝납니다.
+
+    python src/bench/run.py --size 200 --latency 80 --jitter 40 --failure-rate 0.02
+    python src/bench/run.py --save-baseline      # 현재 결과를 기준값으로 저장
+    python src/bench/run.py --db                 # 실제 DB에 저장하며 저장 시간 측정
+
+측정 항목
+- pages_per_sec: 목록 + 상세 페이지 요청 수 / 전체 소요 시간
+- latency_ms: 상세 페이지 한 건의 처리 시간 (p50 / p95 / max)
+- peak_rss_mb: 크롤러 프로세스 최대 RSS, 종료된 하위 프로세스(브라우저) 중 최대 RSS
+- db_write_s: BatchWriter가 한 레인이라도 저장 중이던 시간 합계 (--db일 때만)
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawlers import (
+    BrowserPool,
+    ContentFrontier,
+    KinoCrawler,
+    UpcomingCrawler,
+    ExpiredCrawler,
+    RankingCrawler,
+)
+from db import AsyncSessionLocal, BatchWriter, init_db, seed_otts, close_db
+from fixtures import KinoFixtureServer
+from utils import config, get_logger
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+CRAWLERS = (UpcomingCrawler, ExpiredCrawler, RankingCrawler)
+
+# (지표 경로, 클수록 좋은지)
+CHECKS = [
+    ("pages_per_sec", True),
+    ("latency_ms.p95", False),
+    ("peak_rss_mb.crawler", False),
+    ("db_write_s", False),
+]
+
+
+class _Timed:
+    """상세 페이지 한 건의 처리 시간을 기록하는 믹스인"""
+
+    latencies: list[float]
+
+    async def _parse_single_content(self, id, page):
+        started = time.perf_counter()
+        try:
+            return await super()._parse_single_content(id, page)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+
+class _CountingSink:
+    """DB 없이 결과 수만 세는 sink"""
+
+    def __init__(self):
+        self.received = 0
+        self.write_seconds = None
+
+    async def put(self, data):
+        self.received += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class _TimedWriter(BatchWriter):
+    """저장 중이던 시간을 합산하는 BatchWriter (레인이 동시에 저장한 구간은 한 번만 셈)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = 0
+        self.write_seconds = 0.0
+        self._active = 0
+        self._busy_since = 0.0
+
+    async def put(self, data):
+        self.received += 1
+        await super().put(data)
+
+    async def _flush(self, batch):
+        if not batch:
+            return
+        if not self._active:
+            self._busy_since = time.perf_counter()
+        self._active += 1
+        try:
+            await super()._flush(batch)
+        finally:
+            self._active -= 1
+            if not self._active:
+                self.write_seconds += time.perf_counter() - self._busy_since
+
+
+def _point_at(base_url: str):
+    """크롤러의 목록/상세 주소를 대역 서버로 변경"""
+    KinoCrawler.TITLE_URL = f"{base_url}/title/"
+    UpcomingCrawler.BASE_URL = f"{base_url}/new?tab=upcoming"
+    ExpiredCrawler.BASE_URL = f"{base_url}/new?tab=expired"
+    RankingCrawler.RANKING_URL = f"{base_url}/ranking"
+
+
+def _percentile(values: list[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def _peak_rss_mb(who: int) -> float:
+    # 리눅스의 ru_maxrss 단위는 KB
+    return round(resource.getrusage(who).ru_maxrss / 1024, 1)
+
+
+async def run_bench(args) -> dict:
+    logger = get_logger(log_file_path=config.LOG_FILE_PATH, log_level=args.log_level)
+    latencies: list[float] = []
+
+    server = KinoFixtureServer(
+        size=args.size,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    with server:
+        _point_at(server.base_url)
+        if args.db:
+            await init_db()
+            await seed_otts()
+            sink = _TimedWriter(AsyncSessionLocal, logger=logger)
+        else:
+            sink = _CountingSink()
+
+        started = time.perf_counter()
+        async with sink, BrowserPool(logger=logger) as pool:
+            frontier = ContentFrontier(logger=logger)
+            crawlers = [
+                type(f"Timed{cls.__name__}", (_Timed, cls), {"latencies": latencies})(
+                    logger=logger, pool=pool, frontier=frontier, sink=sink
+                )
+                for cls in CRAWLERS
+            ]
+            await asyncio.gather(*(c.run() for c in crawlers))
+        elapsed = time.perf_counter() - started
+        hits = dict(server.hits)
+
+    if args.db:
+        await close_db()
+
+    pages = hits.get("listing", 0) + hits.get("title", 0)
+    return {
+        "scenario": {
+            "size": args.size,
+            "latency_ms": args.latency,
+            "jitter_ms": args.jitter,
+            "failure_rate": args.failure_rate,
+            "max_tabs": config.MAX_TABS,
+            "write_lanes": sink.lanes if args.db else None,
+            "extraction_mode": config.EXTRACTION_MODE,
+            "block_resources": config.BLOCK_RESOURCES,
+            "lean_browser": config.LEAN_BROWSER,
+            "db": args.db,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "titles": len(latencies),
+        "saved": sink.received,
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 1),
+            "p95": round(_percentile(latencies, 95) * 1000, 1),
+            "max": round(max(latencies, default=0) * 1000, 1),
+        },
+        "peak_rss_mb": {
+            "crawler": _peak_rss_mb(resource.RUSAGE_SELF),
+            "browser": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+        },
+        "db_write_s": (
+            round(sink.write_seconds, 3) if sink.write_seconds is not None else None
+        ),
+        "requests": hits,
+    }
+
+
+def _metric(result: dict, path: str):
+    value = result
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """기준값보다 tolerance 비율 이상 나빠진 지표 목록"""
+    regressions = []
+    for path, higher_is_better in CHECKS:
+        now, before = _metric(result, path), _metric(baseline, path)
+        if not now or not before:
+            continue
+        change = (now - before) / before
+        if (higher_is_better and change < -tolerance) or (
+            not higher_is_better and change > tolerance
+        ):
+            regressions.append(f"{path}: {before} -> {now} ({change:+.1%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크")
+    parser.add_argument("--size", type=int, default=120, help="합성 작품 수")
+    parser.add_argument("--latency", type=float, default=50, help="상세 응답 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=20, help="지연 편차(ms)")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="상세 요청 실패 비율(0~1)"
+    )
+    parser.add_argument("--db", action="store_true", help="실제 DB에 저장")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="회귀로 판단할 변화 비율"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_bench(args))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("No baseline yet, run with --save-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("scenario") != result["scenario"]:
+        print("Scenario differs from baseline, skipping comparison")
+        return 0
+
+    regressions = compare(result, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print("No regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
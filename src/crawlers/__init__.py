@@ -1,13 +1,35 @@
-from .base import Crawler
-from .kino import KinoCrawler
-from .upcoming import UpcomingCrawler
-from .expired import ExpiredCrawler
-from .ranking import RankingCrawler
-
-__all__ = [
-    "Crawler",
-    "KinoCrawler",
-    "UpcomingCrawler",
-    "ExpiredCrawler",
-    "RankingCrawler",
-]
+import importlib
+
+# 공개 이름 -> 모듈
+# Playwright를 불러오는 크롤러 모듈은 처음 사용할 때 import (통계/정리/재처리 명령은 불러오지 않음)
+_EXPORTS = {
+    "Crawler": ".base",
+    "BrowserPool": ".browser_pool",
+    "ContentFrontier": ".frontier",
+    "IncrementalFilter": ".incremental",
+    "KinoCrawler": ".kino",
+    "UpcomingCrawler": ".upcoming",
+    "ExpiredCrawler": ".expired",
+    "RankingCrawler": ".ranking",
+    "ShardedDetailCrawl": ".sharding",
+    "JobWorker": ".distributed",
+    "CrawlCoordinator": ".distributed",
+    "SnapshotReplay": ".replay",
+    "CrawlDaemon": ".daemon",
+    "parse_schedules": ".daemon",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
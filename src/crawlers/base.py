@@ -1,7 +1,44 @@
 from abc import ABC, abstractmethod
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+import asyncio
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    Page,
+    BrowserContext,
+    TimeoutError as PlaywrightTimeoutError,
+)
 import structlog
-from utils import config
+from utils import config, metrics
+from .browser_pool import BrowserPool
+from .resources import ResourceFilter, launch_options, context_options
+from .concurrency import AdaptiveLimiter, host_rate_limiter
+from .waits import WaitCondition, act_and_wait
+
+# 목록 링크의 ID를 페이지 안의 Set으로 모으는 수집기 (렌더링 순서 유지)
+_HARVEST_JS = """
+({selector, pattern}) => {
+    const re = new RegExp(pattern);
+    const state = { ids: [], seen: new Set() };
+    const add = (a) => {
+        const m = (a.getAttribute('href') || '').match(re);
+        if (m && !state.seen.has(m[1])) {
+            state.seen.add(m[1]);
+            state.ids.push(m[1]);
+        }
+    };
+    const scan = (root) => {
+        if (root.matches && root.matches(selector)) add(root);
+        if (root.querySelectorAll) root.querySelectorAll(selector).forEach(add);
+    };
+    scan(document);
+    state.observer = new MutationObserver((mutations) => {
+        for (const m of mutations) m.addedNodes.forEach(scan);
+    });
+    state.observer.observe(document.body, { childList: true, subtree: true });
+    window.__harvest = state;
+    return state.ids.length;
+}
+"""
 
 
 class Crawler(ABC):
@@ -11,97 +48,195 @@ class Crawler(ABC):
         headless: bool | None = None,
         timeout: int | None = None,
         logger: structlog.stdlib.BoundLogger | None = None,
+        pool: BrowserPool | None = None,
     ):
         self.name = name
         self.headless = headless if headless is not None else config.HEADLESS_MODE
         self.timeout = timeout if timeout is not None else config.BROWSER_TIMEOUT
         self.logger = logger
+        self.pool = pool
 
         self.playwright = None
         self.browser: Browser | None = None
         self.context: BrowserContext | None = None
         self.page: Page | None = None  # 메인 페이지 (목록 수집용)
+        self._tab_slots: AdaptiveLimiter | None = None
+        self.resource_filter: ResourceFilter | None = None
+        self.failed = False  # 단계 실패 여부 (실패한 목록 기준 정리 방지)
+
+    @property
+    def tab_slots(self) -> AdaptiveLimiter:
+        """상세 페이지 동시 탭 제한 (풀 사용 시 전역 예산 공유)"""
+        if self.pool:
+            return self.pool.tab_slots
+        if self._tab_slots is None:
+            self._tab_slots = AdaptiveLimiter(logger=self.logger)
+        return self._tab_slots
 
     async def start_browser(self):
         """브라우저 및 기본 컨텍스트 시작"""
-        self.logger.info("Starting browser", crawler=self.name)
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.logger.info("Starting browser", crawler=self.name, shared=bool(self.pool))
+        if self.pool:
+            # 공유 브라우저에서 크롤러 전용 컨텍스트만 생성
+            await self.pool.start()
+            self.playwright = self.pool.playwright
+            self.browser = self.pool.browser
+        else:
+            with metrics.stage("browser_launch"):
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(
+                    **launch_options(self.headless)
+                )
 
         # 모바일 뷰포트 설정 (Pixel 5)
-        self.context = await self.browser.new_context(
-            **self.playwright.devices["Pixel 5"]
-        )
+        options = context_options(self.playwright.devices["Pixel 5"])
+        with metrics.stage("new_context"):
+            if self.pool:
+                self.context = await self.pool.new_context(**options)
+            else:
+                self.context = await self.browser.new_context(**options)
+        if config.BLOCK_RESOURCES:
+            # 이미지, 폰트, 분석 스크립트 등 파싱에 불필요한 요청 차단
+            self.resource_filter = ResourceFilter.from_config()
+            await self.resource_filter.install(self.context)
         self.page = await self.context.new_page()
         self.page.set_default_timeout(self.timeout)
 
     async def close_browser(self):
         if self.browser:
-            self.logger.info("Closing browser", crawler=self.name)
-            await self.context.close()
-            await self.browser.close()
-            await self.playwright.stop()
+            self.logger.info(
+                "Closing browser",
+                crawler=self.name,
+                blocked_requests=(
+                    dict(self.resource_filter.blocked) if self.resource_filter else {}
+                ),
+            )
+            if self.context:
+                await self.context.close()
+            # 공유 브라우저는 풀에서 종료
+            if not self.pool:
+                await self.browser.close()
+                await self.playwright.stop()
 
     @abstractmethod
     async def crawl(self):
         pass
 
     async def run(self):
+        return await self._run_stage("crawl", self.crawl)
+
+    async def _run_stage(self, stage: str, func, *args) -> list:
+        """브라우저를 열고 단계(func)를 실행한 뒤 닫음 (실패 시 빈 목록)"""
         try:
-            self.logger.info("Starting crawl", crawler=self.name)
+            self.logger.info(f"Starting {stage}", crawler=self.name)
             await self.start_browser()
-            data = await self.crawl()
-            self.logger.info("Crawl completed", crawler=self.name, count=len(data))
+            data = await func(*args)
+            self.logger.info(
+                f"{stage.capitalize()} completed", crawler=self.name, count=len(data)
+            )
             return data
         except Exception as e:
-            self.logger.error("Crawl failed", crawler=self.name, error=str(e))
+            self.failed = True
+            self.logger.error(
+                f"{stage.capitalize()} failed", crawler=self.name, error=str(e)
+            )
             return []
         finally:
             await self.close_browser()
 
-    async def _scroll_page_until_end(self, limit: int = 100) -> None:
-        """현재 페이지(self.page)를 끝까지 스크롤"""
-        prev_height = await self.page.evaluate("document.body.scrollHeight")
+    async def _harvest_ids(
+        self,
+        selector: str,
+        pattern: str,
+        limit: int = 100,
+        target: int | None = None,
+    ) -> list[str]:
+        """
+        무한 스크롤 목록에서 ID 수집 (메인 페이지 사용)
+
+        페이지 안의 MutationObserver가 새로 렌더링된 링크의 ID를 순서대로 모으므로
+        가상화된 목록에서 요소가 사라져도 누락되지 않습니다.
+        고정 대기 대신 수집 개수가 늘어날 때까지만 기다리고,
+        더 늘지 않거나 target개를 채우면 바로 멈춥니다. (limit: 최대 스크롤 횟수, 0=무제한)
+        첫 항목이 나타나지 않아 목록이 비어 있으면 완료가 아닌 실패로 처리합니다.
+        """
+        with metrics.stage("listing_scroll"):
+            return await self._harvest_loop(selector, pattern, limit, target)
 
-        while limit > 0:
+    async def _harvest_loop(
+        self, selector: str, pattern: str, limit: int, target: int | None
+    ) -> list[str]:
+        # 첫 항목이 렌더링된 뒤부터 증가 대기 시간을 잼
+        try:
+            await self.page.wait_for_selector(selector, state="attached")
+        except PlaywrightTimeoutError:
+            raise RuntimeError("Listing is empty") from None
+        count = await self.page.evaluate(
+            _HARVEST_JS, {"selector": selector, "pattern": pattern}
+        )
+        steps = 0
+        while (limit <= 0 or steps < limit) and not (target and count >= target):
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             try:
-                await self.page.wait_for_load_state("networkidle", timeout=5000)
-            finally:
-                await self.page.wait_for_timeout(1000)
+                await self.page.wait_for_function(
+                    "n => window.__harvest.ids.length > n",
+                    arg=count,
+                    timeout=config.SCROLL_GROWTH_TIMEOUT,
+                )
+            except PlaywrightTimeoutError:
+                break  # 더 이상 새 항목이 없음
+            count = await self.page.evaluate("window.__harvest.ids.length")
+            steps += 1
 
-            new_height = await self.page.evaluate("document.body.scrollHeight")
-            if new_height == prev_height:
-                break
-            prev_height = new_height
-            limit -= 1
+        ids = await self.page.evaluate(
+            "() => { window.__harvest.observer.disconnect(); return window.__harvest.ids; }"
+        )
+        if not ids:
+            raise RuntimeError("Listing is empty")
+        return ids[:target] if target else ids
 
-    async def _get_text(self, selector: str, page: Page | None = None) -> str:
+    async def _goto(self, url: str, page: Page | None = None):
+        """호스트별 요청 속도 제한을 지키며 이동"""
         target = page or self.page
-        el = await target.query_selector(selector)
-        return (await el.text_content()).strip() if el else ""
+        await host_rate_limiter(url).acquire()
+        with metrics.stage("goto"):
+            await target.goto(url)
 
-    async def _get_attribute(
-        self, selector: str, attr: str, page: Page | None = None
-    ) -> str | None:
+    async def _click_element(self, selector: str, page: Page | None = None) -> bool:
         target = page or self.page
         el = await target.query_selector(selector)
-        return await el.get_attribute(attr) if el else None
+        if not el:
+            return False
+        try:
+            await el.click()
+        finally:
+            await el.dispose()
+        return True
 
-    async def _get_attributes(
-        self, selector: str, attr: str, page: Page | None = None
-    ) -> list[str]:
+    async def _click_and_wait(
+        self,
+        selector: str,
+        condition: WaitCondition,
+        page: Page | None = None,
+        timeout: int | None = None,
+    ) -> bool:
+        """클릭 후 완료 조건이 충족될 때까지만 대기 (요소가 없으면 바로 반환)"""
         target = page or self.page
-        elements = await target.query_selector_all(selector)
-        results = []
-        for el in elements:
-            val = await el.get_attribute(attr)
-            if val:
-                results.append(val)
-        return results
-
-    async def _click_element(self, selector: str, page: Page | None = None):
+        return await act_and_wait(
+            target,
+            lambda: self._click_element(selector, page=target),
+            condition,
+            timeout or config.ACTION_TIMEOUT,
+        )
+
+    async def _wait_for(
+        self,
+        condition: WaitCondition,
+        page: Page | None = None,
+        timeout: int | None = None,
+    ) -> bool:
+        """동작 없이 조건만 대기"""
         target = page or self.page
-        el = await target.query_selector(selector)
-        if el:
-            await el.click()
+        return await act_and_wait(
+            target, lambda: asyncio.sleep(0), condition, timeout or self.timeout
+        )
@@ -0,0 +1,119 @@
+import asyncio
+import os
+from pathlib import Path
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+import structlog
+from utils import config, metrics
+from .resources import launch_options
+from .concurrency import AdaptiveLimiter
+
+
+def _descendant_rss_mb(root_pid: int | None = None) -> float | None:
+    """
+    root_pid의 모든 하위 프로세스 RSS 합계(MB) (Playwright 드라이버 + Chromium)
+
+    /proc이 없는 환경에서는 None을 반환합니다.
+    """
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    children: dict[int, list[int]] = {}
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            # comm에 공백이나 괄호가 있을 수 있어 마지막 ')' 뒤부터 분리
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = list(children.get(root_pid or os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            total += int((proc / str(pid) / "statm").read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return round(total * page_size / (1024 * 1024), 1)
+
+
+class BrowserPool:
+    """
+    한 번의 실행에서 모든 크롤러가 공유하는 브라우저 풀
+
+    Chromium 프로세스는 하나만 띄우고, 크롤러마다 독립된 BrowserContext를 발급합니다.
+    상세 페이지 탭 수는 크롤러 구분 없이 전역 예산(tab_slots)으로 제한되며,
+    예산은 응답 지연과 오류율에 따라 MIN_TABS ~ MAX_TABS 사이에서 조절됩니다.
+    상주 실행(daemon)에서는 실행 사이에 풀을 유지하고, 메모리가 커지면 recycle()로
+    Playwright 드라이버는 둔 채 브라우저만 다시 띄웁니다.
+    """
+
+    def __init__(
+        self,
+        headless: bool | None = None,
+        max_tabs: int | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.headless = headless if headless is not None else config.HEADLESS_MODE
+        self.max_tabs = max_tabs or config.MAX_TABS
+        self.logger = logger
+
+        self.playwright: Playwright | None = None
+        self.browser: Browser | None = None
+        self.tab_slots = AdaptiveLimiter(max_limit=self.max_tabs, logger=logger)
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        """브라우저를 한 번만 실행 (여러 크롤러가 동시에 호출해도 안전)"""
+        async with self._lock:
+            if self.browser:
+                return
+            if self.logger:
+                self.logger.info("Starting shared browser", max_tabs=self.max_tabs)
+            with metrics.stage("browser_launch"):
+                if not self.playwright:
+                    self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(
+                    **launch_options(self.headless)
+                )
+
+    async def new_context(self, **kwargs) -> BrowserContext:
+        """크롤러 전용 격리 컨텍스트 생성"""
+        await self.start()
+        return await self.browser.new_context(**kwargs)
+
+    def rss_mb(self) -> float | None:
+        """드라이버와 브라우저 프로세스의 현재 RSS 합계(MB)"""
+        return _descendant_rss_mb()
+
+    async def recycle(self):
+        """브라우저만 종료 (다음 new_context에서 다시 실행, 진행 중인 컨텍스트가 없을 때 호출)"""
+        async with self._lock:
+            if not self.browser:
+                return
+            if self.logger:
+                self.logger.info("Recycling shared browser", rss_mb=self.rss_mb())
+            await self.browser.close()
+            self.browser = None
+        metrics.count("browser_recycles_total")
+
+    async def close(self):
+        async with self._lock:
+            if self.browser:
+                if self.logger:
+                    self.logger.info("Closing shared browser")
+                await self.browser.close()
+                self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
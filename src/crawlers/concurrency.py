@@ -0,0 +1,158 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+import structlog
+from utils import config
+
+
+class AdaptiveLimiter:
+    """
+    AIMD 방식으로 동시 탭 수를 조절하는 리미터
+
+    - 정상 응답(목표 지연 이하): 한도를 조금씩 늘림 (한도만큼 성공하면 +1)
+    - 오류, 타임아웃, 목표 지연 초과: 한도를 backoff 비율로 줄임 (cooldown 동안 1회)
+
+    작업 사이 재사용하려고 열어 둔 탭(parked)도 한도 안에서 자리를 차지하므로
+    열린 탭 수(in_flight + parked)는 한도를 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        min_limit: int | None = None,
+        max_limit: int | None = None,
+        initial: int | None = None,
+        target_latency: int | None = None,
+        backoff: float = 0.5,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.min_limit = min_limit or config.MIN_TABS
+        self.max_limit = max(max_limit or config.MAX_TABS, self.min_limit)
+        start = initial or config.INITIAL_TABS or self.max_limit
+        self.limit = float(min(max(start, self.min_limit), self.max_limit))
+        self.target_latency = (target_latency or config.TARGET_LATENCY_MS) / 1000
+        self.backoff = backoff
+        self.cooldown = self.target_latency
+        self.logger = logger
+
+        self.in_flight = 0
+        self.parked = 0
+        self.successes = 0
+        self.failures = 0
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    @asynccontextmanager
+    async def slot(self, reused: bool = False):
+        """
+        탭 하나를 점유 (블록 안의 예외는 실패로 집계 후 그대로 전파)
+
+        reused: reuse()로 열어 둔 탭의 자리를 이미 넘겨받은 경우 (대기 생략)
+        """
+        if not reused:
+            async with self._cond:
+                await self._cond.wait_for(
+                    lambda: self.in_flight + self.parked < self.current
+                )
+                self.in_flight += 1
+
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            latency = time.monotonic() - started
+            async with self._cond:
+                self.in_flight -= 1
+                self._adjust(latency, failed)
+                self._cond.notify_all()
+
+    def park(self) -> bool:
+        """슬롯을 반납한 뒤 탭을 다음 작업용으로 열어 둠 (한도 안일 때만 True, 아니면 탭을 닫아야 함)"""
+        if self.in_flight + self.parked < self.current:
+            self.parked += 1
+            return True
+        return False
+
+    def reuse(self) -> bool:
+        """
+        열어 둔 탭의 자리를 바로 슬롯으로 전환 (slot(reused=True)와 함께 사용)
+
+        그사이 한도가 줄어 자리가 없으면 자리만 반납하고 False (탭을 닫고 slot()으로 대기)
+        """
+        self.parked -= 1
+        if self.in_flight + self.parked < self.current:
+            self.in_flight += 1
+            return True
+        return False
+
+    async def unpark(self):
+        """열어 둔 탭을 닫은 뒤 자리 반납"""
+        async with self._cond:
+            self.parked -= 1
+            self._cond.notify_all()
+
+    def _adjust(self, latency: float, failed: bool):
+        before = self.current
+        if failed or latency > self.target_latency:
+            self.failures += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        else:
+            self.successes += 1
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+        if self.logger and self.current != before:
+            self.logger.info(
+                "Concurrency adjusted",
+                tabs=self.current,
+                latency_ms=int(latency * 1000),
+                failed=failed,
+            )
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 초당 요청 수 제한 (rate <= 0이면 제한 없음)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# 프로세스 안의 모든 크롤러가 호스트별로 공유
+_host_limiters: dict[str, RateLimiter] = {}
+
+
+def host_rate_limiter(url: str) -> RateLimiter:
+    host = urlparse(url).netloc
+    if host not in _host_limiters:
+        _host_limiters[host] = RateLimiter(config.HOST_RATE_LIMIT, config.HOST_BURST)
+    return _host_limiters[host]
@@ -0,0 +1,123 @@
+import asyncio
+import signal
+import time
+from typing import Awaitable, Callable
+import structlog
+from utils import config, metrics
+from .browser_pool import BrowserPool
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_schedules(spec: str) -> dict[str, float]:
+    """ "ranking=1h,upcoming=1d" -> {"ranking": 3600.0, "upcoming": 86400.0}"""
+    schedules = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, interval = part.partition("=")
+        interval = interval.strip().lower()
+        unit = _UNITS.get(interval[-1:]) if interval else None
+        value = interval[:-1] if unit else interval
+        try:
+            seconds = float(value) * (unit or 1)
+        except ValueError:
+            raise ValueError(f"Invalid schedule: {part.strip()!r}") from None
+        if seconds <= 0:
+            raise ValueError(f"Invalid schedule: {part.strip()!r}")
+        schedules[name.strip()] = seconds
+    return schedules
+
+
+class CrawlDaemon:
+    """
+    브라우저 풀과 DB 커넥션 풀을 유지한 채 크롤러별 주기로 실행을 반복하는 상주 스케줄러
+
+    시작 시 모든 크롤러를 한 번 실행하고, 이후 주기가 돌아온 크롤러들을 묶어 run_batch에 넘깁니다.
+    다음 실행 시각은 이전 실행의 시작 시각 기준이라 실행 시간만큼 밀리지 않습니다.
+    실행 사이 드라이버와 브라우저 메모리가 BROWSER_RECYCLE_RSS_MB를 넘으면 브라우저만 다시 띄웁니다.
+    SIGTERM/SIGINT를 받으면 진행 중인 실행을 마친 뒤 종료합니다.
+    after_run은 실행마다 (실패해도) 실행 시간 기록 뒤에 호출됩니다. (지표 내보내기 등)
+    """
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        run_batch: Callable[[list[str]], Awaitable[None]],
+        schedules: dict[str, float],
+        recycle_rss_mb: float | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+        after_run: Callable[[], None] | None = None,
+    ):
+        self.pool = pool
+        self.run_batch = run_batch
+        self.after_run = after_run
+        self.schedules = schedules
+        self.recycle_rss_mb = (
+            recycle_rss_mb
+            if recycle_rss_mb is not None
+            else config.BROWSER_RECYCLE_RSS_MB
+        )
+        self.logger = logger
+        self.runs = 0
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        next_due = {name: time.monotonic() for name in self.schedules}
+        if self.logger:
+            self.logger.info("Daemon started", schedules=self.schedules)
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due = [name for name, at in next_due.items() if at <= now]
+            if not due:
+                wait = min(next_due.values()) - now
+                if self.logger:
+                    self.logger.info(
+                        "Waiting for next crawl",
+                        crawlers=[n for n, at in next_due.items() if at - now <= wait],
+                        in_seconds=round(wait),
+                    )
+                try:
+                    await asyncio.wait_for(self._stop.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                with metrics.timer("daemon_run_seconds"):
+                    await self.run_batch(due)
+                self.runs += 1
+            except Exception as e:
+                # 한 번의 실패로 상주 프로세스가 끝나지 않도록 기록 후 다음 주기에 재시도
+                metrics.count("daemon_run_failures_total")
+                if self.logger:
+                    self.logger.error(
+                        "Scheduled crawl failed", crawlers=due, error=str(e)
+                    )
+            if self.after_run:
+                self.after_run()
+            for name in due:
+                next_due[name] = now + self.schedules[name]
+
+            await self._maybe_recycle()
+
+        if self.logger:
+            self.logger.info("Daemon stopped", runs=self.runs)
+
+    async def _maybe_recycle(self):
+        if not self.recycle_rss_mb:
+            return
+        rss = self.pool.rss_mb()
+        if rss is not None and rss > self.recycle_rss_mb:
+            await self.pool.recycle()
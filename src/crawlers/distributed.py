@@ -0,0 +1,216 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from dataclasses import replace
+from datetime import datetime
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from db import BatchWriter, JobQueue
+from db.job_queue import Job
+from models import KinoData
+from utils import config, SnapshotStore
+from .browser_pool import BrowserPool
+from .kino import KinoCrawler
+from .ranking import RankingCrawler
+from .upcoming import UpcomingCrawler
+from .expired import ExpiredCrawler
+
+
+def default_node_id() -> str:
+    return config.NODE_ID or f"{socket.gethostname()}-{os.getpid()}"
+
+
+class _JobSink:
+    """임대한 작업의 순위를 붙여 writer로 넘기고, writer가 저장을 마친 작업을 기록"""
+
+    def __init__(
+        self,
+        jobs: dict[str, Job],
+        session_factory: async_sessionmaker,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.jobs = jobs
+        self.writer = BatchWriter(
+            session_factory, logger=logger, on_saved=self.record_saved
+        )
+        self.saved: set[int] = set()
+
+    async def put(self, data: KinoData):
+        job = self.jobs.get(str(data.program.kino_id))
+        if job is None:
+            return
+        if job.ranking is not None:
+            data = replace(data, program=replace(data.program, ranking=job.ranking))
+        await self.writer.put(data)
+
+    def record_saved(self, kino_ids: list[int]):
+        for kino_id in kino_ids:
+            job = self.jobs.get(str(kino_id))
+            if job is not None:
+                self.saved.add(job.job_id)
+
+
+class JobWorker:
+    """
+    작업 큐에서 상세 페이지 작업을 임대해 수집하는 작업 노드
+
+    임대한 묶음마다 writer가 저장을 확인한 작업만 완료 처리하고,
+    결과를 얻지 못했거나 저장에 실패한 작업은 반납해 다른 노드(또는 다음 임대)에서 재시도합니다.
+    (시도 횟수를 다 쓴 작업은 failed)
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        pool: BrowserPool,
+        session_factory: async_sessionmaker,
+        node_id: str | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        idle_exit: float | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.queue = queue
+        self.pool = pool
+        self.session_factory = session_factory
+        self.node_id = node_id or default_node_id()
+        self.batch_size = batch_size or config.JOB_BATCH_SIZE
+        self.poll_interval = poll_interval or config.JOB_POLL_INTERVAL
+        self.idle_exit = config.WORKER_IDLE_EXIT if idle_exit is None else idle_exit
+        self.logger = logger
+        self.snapshots = (
+            SnapshotStore(config.SNAPSHOT_DIR) if config.SNAPSHOT_DIR else None
+        )
+        self.completed = 0
+        self.released = 0
+
+    async def run(self, run_id: str | None = None) -> int:
+        """
+        작업이 없을 때까지 반복 (run_id가 주어지면 그 실행이 모두 끝나면 종료,
+        아니면 WORKER_IDLE_EXIT초 동안 작업이 없으면 종료. 0이면 계속 대기)
+        """
+        self.logger.info("Worker started", node=self.node_id, run_id=run_id)
+        idle_since = time.monotonic()
+        while True:
+            jobs = await self.queue.lease(self.node_id, self.batch_size)
+            if jobs:
+                await self._process(jobs)
+                idle_since = time.monotonic()
+                continue
+
+            if run_id is not None:
+                if await self.queue.is_drained(run_id):
+                    break
+            elif self.idle_exit and time.monotonic() - idle_since >= self.idle_exit:
+                break
+            await asyncio.sleep(self.poll_interval)
+
+        self.logger.info(
+            "Worker finished",
+            node=self.node_id,
+            completed=self.completed,
+            released=self.released,
+        )
+        return self.completed
+
+    async def _process(self, jobs: list[Job]):
+        by_id = {str(job.crawling_id): job for job in jobs}
+        heartbeat = asyncio.create_task(self._heartbeat([j.job_id for j in jobs]))
+        try:
+            # 완료 처리 전에 결과가 DB에 저장되도록 묶음마다 writer를 닫음
+            sink = _JobSink(by_id, self.session_factory, logger=self.logger)
+            async with sink.writer:
+                crawler = KinoCrawler(
+                    url="",
+                    name=f"worker-{self.node_id}",
+                    logger=self.logger,
+                    pool=self.pool,
+                    sink=sink,
+                    snapshots=self.snapshots,
+                )
+                await crawler.run_details(list(by_id))
+        finally:
+            heartbeat.cancel()
+
+        done = [j.job_id for j in jobs if j.job_id in sink.saved]
+        failed = [j.job_id for j in jobs if j.job_id not in sink.saved]
+        self.completed += await self.queue.complete(self.node_id, done)
+        self.released += await self.queue.release(self.node_id, failed)
+
+    async def _heartbeat(self, job_ids: list[int]):
+        interval = max(self.queue.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.queue.heartbeat(self.node_id, job_ids)
+            except Exception as e:
+                self.logger.warning("Heartbeat failed", error=str(e))
+
+
+class CrawlCoordinator:
+    """
+    목록 단계를 실행해 작업 큐를 채우고, 큐가 빌 때까지 기다리는 코디네이터
+
+    COORDINATOR_WORKS가 켜져 있으면 기다리는 동안 직접 작업 노드로도 참여합니다.
+    큐가 비면 호출한 쪽에서 정리(cleanup_outdated_data)를 진행한 뒤 finish()를 호출합니다.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        pool: BrowserPool,
+        session_factory: async_sessionmaker,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.queue = queue
+        self.pool = pool
+        self.session_factory = session_factory
+        self.logger = logger
+        self.run_id = str(uuid.uuid4())
+
+    async def run(self, crawlers: list[KinoCrawler], batch_start_time: datetime):
+        await self.queue.create_run(
+            self.run_id,
+            batch_start_time,
+            cleanup_upcoming=any(isinstance(c, UpcomingCrawler) for c in crawlers),
+            cleanup_expiring=any(isinstance(c, ExpiredCrawler) for c in crawlers),
+        )
+
+        listings = await asyncio.gather(*(c.list_ids() for c in crawlers))
+        rankings: dict[str, int] = {}
+        for crawler in crawlers:
+            if isinstance(crawler, RankingCrawler):
+                for index, content_id in enumerate(crawler.ranked_ids):
+                    rankings.setdefault(content_id, index + 1)
+        pending = [
+            content_id
+            for crawler, ids in zip(crawlers, listings)
+            for content_id in ids
+            if not crawler._is_done(content_id)
+        ]
+        await self.queue.enqueue(self.run_id, pending, rankings)
+        await self.queue.set_run_status(self.run_id, "queued")
+
+        if config.COORDINATOR_WORKS:
+            worker = JobWorker(
+                self.queue,
+                self.pool,
+                self.session_factory,
+                node_id=f"{default_node_id()}-coordinator",
+                logger=self.logger,
+            )
+            await worker.run(run_id=self.run_id)
+        else:
+            while not await self.queue.is_drained(self.run_id):
+                await asyncio.sleep(config.JOB_POLL_INTERVAL)
+
+        self.logger.info(
+            "Job queue drained",
+            run_id=self.run_id,
+            jobs=await self.queue.counts(self.run_id),
+        )
+
+    async def finish(self):
+        await self.queue.set_run_status(self.run_id, "finished")
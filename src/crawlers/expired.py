@@ -1,18 +1,30 @@
 from .kino import KinoCrawler
+from .browser_pool import BrowserPool
+from .frontier import ContentFrontier
+from .incremental import IncrementalFilter
+from db import BatchWriter
 import structlog
+from utils import config, RunCheckpoint, SnapshotStore
 
 
 # 키노라이츠 종료 예정작 크롤러
 class ExpiredCrawler(KinoCrawler):
-    BASE_URL = "https://m.kinolights.com/new?tab=expired"
+    BASE_URL = f"{config.KINO_BASE_URL}/new?tab=expired"
+    LISTING = "expired"
 
     def __init__(
         self,
         headless: bool = True,
         timeout: int = 30000,
         logger: structlog.stdlib.BoundLogger | None = None,
-        action_delay: int = 300,
+        action_timeout: int = 3000,
         scroll_limit: int = 100,
+        pool: BrowserPool | None = None,
+        frontier: ContentFrontier | None = None,
+        incremental: IncrementalFilter | None = None,
+        sink: BatchWriter | None = None,
+        checkpoint: RunCheckpoint | None = None,
+        snapshots: SnapshotStore | None = None,
     ):
         super().__init__(
             url=self.BASE_URL,
@@ -20,6 +32,12 @@ class ExpiredCrawler(KinoCrawler):
             headless=headless,
             timeout=timeout,
             logger=logger,
-            action_delay=action_delay,
+            action_timeout=action_timeout,
             scroll_limit=scroll_limit,
+            pool=pool,
+            frontier=frontier,
+            incremental=incremental,
+            sink=sink,
+            checkpoint=checkpoint,
+            snapshots=snapshots,
         )
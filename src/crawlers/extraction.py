@@ -0,0 +1,159 @@
+import json
+import re
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime
+from models import KinoData, Program, Availability, OTTPlatform
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """
+    선언적 추출 규칙
+
+    - attr가 없으면 textContent(trim), 있으면 해당 속성 값
+    - fields가 있으면 selector에 맞는 모든 요소를 하위 규칙으로 추출한 객체 목록
+    """
+
+    selector: str
+    attr: str | None = None
+    fields: dict[str, "Field"] | None = None
+
+
+# 상세 페이지(/title/{id})에서 필요한 모든 값
+TITLE_PAGE_SPEC: dict[str, Field] = {
+    "title": Field(".title-kr"),
+    "synopsis": Field("div.synopsis"),
+    "thumbnail_url": Field("div.poster img", attr="src"),
+    "backdrop_style": Field("div.backdrop div", attr="style"),
+    "metadata": Field(
+        ".metadata__item",
+        fields={"key": Field(".item__title"), "value": Field(".item__body")},
+    ),
+    "ott_items": Field(
+        ".movie-price-item",
+        fields={
+            "name": Field(".name"),
+            "href": Field("a", attr="href"),
+            "date": Field(".date"),
+        },
+    ),
+}
+
+_RUNTIME_JS = """
+    const one = (root, sel, attr) => {
+        const el = root.querySelector(sel);
+        if (!el) return null;
+        return attr ? el.getAttribute(attr) : el.textContent.trim();
+    };
+    const all = (root, sel, fn) => Array.from(root.querySelectorAll(sel), fn);
+"""
+
+
+def _compile_fields(fields: dict[str, Field], root: str) -> str:
+    parts = []
+    for key, f in fields.items():
+        sel = json.dumps(f.selector)
+        if f.fields:
+            inner = _compile_fields(f.fields, "el")
+            expr = f"all({root}, {sel}, el => ({inner}))"
+        else:
+            expr = f"one({root}, {sel}, {json.dumps(f.attr)})"
+        parts.append(f"{json.dumps(key)}: {expr}")
+    return "{" + ", ".join(parts) + "}"
+
+
+def compile_spec(spec: dict[str, Field]) -> str:
+    """추출 규칙을 page.evaluate 한 번으로 실행되는 JS 함수로 변환"""
+    return f"() => {{{_RUNTIME_JS}    return {_compile_fields(spec, 'document')};\n}}"
+
+
+TITLE_PAGE_JS = compile_spec(TITLE_PAGE_SPEC)
+
+
+def parse_title_payload(content_id: str, payload: dict) -> KinoData | None:
+    """추출 결과(JSON)를 Program / Availability로 변환"""
+    title = payload.get("title") or ""
+    ott_items = payload.get("ott_items") or []
+    if not ott_items:
+        return None
+
+    style = payload.get("backdrop_style")
+    backdrop_url = (
+        m.group(1)
+        if style and (m := re.search(r"url\(['\"]?(.*?)['\"]?\)", style))
+        else None
+    )
+
+    metadata = {
+        item["key"]: item["value"]
+        for item in payload.get("metadata") or []
+        if item.get("key") and item.get("value")
+    }
+    genre = metadata.get("장르", "Unknown")
+    rt_str = metadata.get("러닝타임")
+    running_time = (
+        int(m.group(1)) if rt_str and (m := re.search(r"(\d+)", rt_str)) else None
+    )
+
+    program = Program(
+        kino_id=int(content_id),
+        title=title,
+        genre=genre,
+        description=payload.get("synopsis") or "",
+        thumbnail_url=payload.get("thumbnail_url"),
+        backdrop_url=backdrop_url,
+        running_time=running_time,
+        ranking=None,  # 랭킹은 RankingCrawler에서 후처리
+    )
+
+    return KinoData(
+        program=program, availabilities=parse_availabilities(title, ott_items)
+    )
+
+
+def parse_availabilities(title: str, ott_items: list[dict]) -> list[Availability]:
+    availabilities = []
+    for item in ott_items:
+        if item.get("name") is None:
+            continue
+
+        ott_name = OTTPlatform.from_korean(item["name"])
+
+        href = item.get("href")
+        raw_url = (
+            href
+            if href
+            else f"https://search.naver.com/search.naver?query={urllib.parse.quote(title)}"
+        )
+
+        date_text = item.get("date") or ""
+
+        release_date, expire_date = None, None
+        if m := re.search(r"종료예정일\s*:\s*(\d{4}\.\d{2}\.\d{2})", date_text):
+            expire_date = datetime.strptime(m.group(1), "%Y.%m.%d").date()
+        elif m := re.search(r"공개예정일\s*:\s*(\d{4}\.\d{2}\.\d{2})", date_text):
+            release_date = datetime.strptime(m.group(1), "%Y.%m.%d").date()
+
+        availabilities.append(
+            Availability(
+                ott_name=ott_name,
+                url=extract_original_url(raw_url),
+                release_date=release_date,
+                expire_date=expire_date,
+            )
+        )
+    return availabilities
+
+
+def extract_original_url(url: str | None) -> str | None:
+    if not url:
+        return None
+    try:
+        parsed = urllib.parse.urlparse(url)
+        qs = urllib.parse.parse_qs(parsed.query)
+        if "url" in qs:
+            return urllib.parse.unquote(qs["url"][0])
+    except:
+        pass
+    return url
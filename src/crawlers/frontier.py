@@ -0,0 +1,47 @@
+import asyncio
+import structlog
+from models import KinoData
+
+
+class ContentFrontier:
+    """
+    한 번의 실행 동안 크롤러들이 공유하는 상세 페이지 프론티어
+
+    같은 kino_id가 여러 목록(공개 예정, 종료 예정, 랭킹)에 등장해도
+    /title/{id} 페이지는 한 번만 방문하고, 파싱 결과(KinoData)를 공유합니다.
+    """
+
+    def __init__(self, logger: structlog.stdlib.BoundLogger | None = None):
+        self.logger = logger
+        self._results: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def claim(self, content_id: str) -> tuple[asyncio.Future, bool]:
+        """
+        ID의 결과 future와 수집 담당 여부를 반환
+        처음 요청한 크롤러가 담당(owner)이 되어 resolve()로 결과를 채웁니다.
+        """
+        future = self._results.get(content_id)
+        if future is not None:
+            self.hits += 1
+            return future, False
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._results[content_id] = future
+        return future, True
+
+    def resolve(self, content_id: str, result: KinoData | None):
+        future = self._results.get(content_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def log_summary(self):
+        if self.logger:
+            self.logger.info(
+                "Frontier summary",
+                unique_ids=len(self._results),
+                fetched=self.misses,
+                deduplicated=self.hits,
+            )
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from db import Repository
+from utils import config
+
+
+class IncrementalFilter:
+    """
+    증분 크롤링 대상 선정
+
+    목록에서 수집한 ID 중 상세 페이지를 다시 방문할 것만 남깁니다.
+    - DB에 없는 신규 작품
+    - 마지막 수집 후 FRESHNESS_TTL_HOURS가 지난 작품
+    - 목록 신호와 DB가 어긋난 작품 (공개 예정 목록인데 공개 예정일 정보가 없는 등)
+
+    방문을 생략한 작품은 이번 배치에서 확인한 것으로 표시해 정리 대상에서 제외합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        ttl_hours: int | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.session_factory = session_factory
+        self.ttl = timedelta(hours=ttl_hours or config.FRESHNESS_TTL_HOURS)
+        self.logger = logger
+
+    @staticmethod
+    def _changed(row, listing: str | None) -> bool:
+        if listing == "upcoming":
+            return not row.has_release
+        if listing == "expired":
+            return not row.has_expire
+        return False
+
+    async def select(self, ids: list[str], listing: str | None = None) -> list[str]:
+        try:
+            async with self.session_factory() as session:
+                repo = Repository(session, logger=self.logger)
+                freshness = await repo.load_freshness([int(i) for i in ids])
+
+                stale_before = datetime.now() - self.ttl
+                to_visit, skipped = [], []
+                for content_id in ids:
+                    row = freshness.get(int(content_id))
+                    if (
+                        row is None
+                        or row.last_seen_at < stale_before
+                        or self._changed(row, listing)
+                    ):
+                        to_visit.append(content_id)
+                    else:
+                        skipped.append(int(content_id))
+
+                await repo.mark_seen(skipped, listing)
+        except Exception as e:
+            # 신선도 확인에 실패하면 전체 방문 (정리 단계에서 누락 삭제 방지)
+            if self.logger:
+                self.logger.error("Incremental selection failed", error=str(e))
+            return ids
+
+        if self.logger:
+            self.logger.info(
+                "Incremental selection",
+                listing=listing,
+                total=len(ids),
+                visit=len(to_visit),
+                skipped=len(skipped),
+            )
+        return to_visit
@@ -1,16 +1,32 @@
-from datetime import datetime
-import urllib.parse
-import re
 import structlog
 import asyncio
 from playwright.async_api import Page
 from .base import Crawler
-from models import KinoData, Program, Availability, OTTPlatform
-from utils import config
+from .browser_pool import BrowserPool
+from .frontier import ContentFrontier
+from .incremental import IncrementalFilter
+from .extraction import TITLE_PAGE_JS, parse_title_payload
+from .network_capture import TitleResponseCapture, parse_api_payload
+from .waits import SelectorPresent, CountStable, TextChanged
+from models import KinoData
+from db import BatchWriter
+from utils import config, metrics, RunCheckpoint, SnapshotStore
+
+# 더보기 버튼이 보이는지 (줄거리를 펼치면 버튼이 사라짐)
+_SYNOPSIS_TRUNCATED_JS = """
+() => {
+    const more = document.querySelector('button.more');
+    const s = document.querySelector('div.synopsis');
+    return !!more && !!s && more.getClientRects().length > 0;
+}
+"""
 
 
 class KinoCrawler(Crawler):
-    TITLE_URL = "https://m.kinolights.com/title/"
+    TITLE_URL = f"{config.KINO_BASE_URL}/title/"
+    LISTING: str | None = None  # 증분 모드의 목록 신호 (upcoming / expired)
+    INCREMENTAL = True  # 증분 모드에서 최근 수집한 작품 방문 생략 여부
+    EMIT_SHARED = False  # 다른 크롤러가 수집한 결과도 sink로 다시 내보낼지 여부
 
     def __init__(
         self,
@@ -19,172 +35,301 @@ class KinoCrawler(Crawler):
         headless: bool | None = None,
         timeout: int | None = None,
         logger: structlog.stdlib.BoundLogger | None = None,
-        action_delay: int | None = None,
+        action_timeout: int | None = None,
         scroll_limit: int | None = None,
+        pool: BrowserPool | None = None,
+        frontier: ContentFrontier | None = None,
+        incremental: IncrementalFilter | None = None,
+        sink: BatchWriter | None = None,
+        checkpoint: RunCheckpoint | None = None,
+        snapshots: SnapshotStore | None = None,
     ):
         # 이름에 접두사 처리
         full_name = f"kinolights-{name}" if not name.startswith("kinolights-") else name
         super().__init__(
-            name=full_name, headless=headless, timeout=timeout, logger=logger
+            name=full_name,
+            headless=headless,
+            timeout=timeout,
+            logger=logger,
+            pool=pool,
         )
 
         self.url = url
-        self.action_delay = action_delay or config.ACTION_DELAY
+        self.action_timeout = action_timeout or config.ACTION_TIMEOUT
         self.scroll_limit = scroll_limit or config.SCROLL_LIMIT
+        self.frontier = frontier
+        self.incremental = incremental if self.INCREMENTAL else None
+        self.extraction_mode = config.EXTRACTION_MODE
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.snapshots = snapshots
+        self.streamed = 0
+        self.page_recycle = config.PAGE_RECYCLE_AFTER
 
     async def crawl(self) -> list[KinoData]:
-        ids = await self._get_content_ids()
+        ids = await self._collect_ids()
         if not ids:
             return []
         return await self._crawl_details(ids)
 
+    async def list_ids(self) -> list[str]:
+        """목록 단계만 실행 (상세 수집은 다른 프로세스에서 진행할 때)"""
+        return await self._run_stage("listing", self._collect_ids)
+
+    async def run_details(self, ids: list[str]) -> list[KinoData]:
+        """주어진 ID의 상세 단계만 실행"""
+        return await self._run_stage("details", self._crawl_details, ids)
+
+    async def _collect_ids(self) -> list[str]:
+        restored = self.checkpoint.listing(self.name) if self.checkpoint else None
+        if restored is not None:
+            # 이어서 실행: 중단 전에 기록한 목록을 그대로 사용 (스크롤 생략)
+            ids = self._restore_ids(restored)
+            self.logger.info("Listing restored", crawler=self.name, count=len(ids))
+        else:
+            ids = await self._get_content_ids()
+            self._snapshot(f"listing-{self.name}", "listing", ids)
+            if self.checkpoint and ids:
+                self.checkpoint.record_listing(self.name, ids)
+        if ids and self.incremental:
+            ids = await self.incremental.select(ids, self.LISTING)
+        return ids
+
+    def _restore_ids(self, ids: list[str]) -> list[str]:
+        """체크포인트에서 복원한 목록 적용 (크롤러별 상태 복원용)"""
+        return ids
+
+    def _is_done(self, content_id: str) -> bool:
+        """
+        이어서 실행할 때 이미 저장된 작품인지
+        (공유 결과에 정보를 덧붙이는 크롤러는 저장 여부와 무관하게 다시 수집)
+        """
+        return (
+            self.checkpoint is not None
+            and not self.EMIT_SHARED
+            and content_id in self.checkpoint.saved
+        )
+
     async def _get_content_ids(self) -> list[str]:
         """목록 페이지에서 ID 수집 (메인 페이지 사용)"""
-        await self.page.goto(self.url)
+        await self._goto(self.url)
         await self.page.wait_for_load_state("domcontentloaded")
 
-        await self._scroll_page_until_end(limit=self.scroll_limit)
-
         # 두 가지 선택자 모두 시도
-        items = await self._get_attributes("div.contents-wrap a", "href")
-        if not items:
-            items = await self._get_attributes("div.container__contents a", "href")
-
-        ids = [m.group() for item in items if (m := re.search(r"\d+", item))]
-        return list(set(ids))
+        return await self._harvest_ids(
+            "div.contents-wrap a, div.container__contents a",
+            r"(\d+)",
+            limit=self.scroll_limit,
+        )
 
     async def _crawl_details(self, ids: list[str]) -> list[KinoData]:
-        """병렬로 상세 페이지 크롤링"""
-        sem = asyncio.Semaphore(config.MAX_TABS)  # 동시 실행 제한 (5개)
-        total = len(ids)
-
-        async def fetch(index, content_id):
-            async with sem:
-                # 각 작업마다 독립된 페이지 생성
-                page = await self.context.new_page()
+        """
+        고정된 수의 작업자가 큐에서 ID를 꺼내 상세 페이지를 크롤링
+
+        작업자는 탭 슬롯(풀 사용 시 전역 예산)을 점유한 동안에만 탭을 엽니다.
+        탭은 작업 사이에 about:blank로 초기화해 한도 안에서만 열어 두고 재사용하며,
+        PAGE_RECYCLE_AFTER번 이동했거나 오류가 나면 새 탭으로 교체합니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        claimed, shared = [], []
+        for index, content_id in enumerate(ids):
+            if self._is_done(content_id):
+                continue
+            # 다른 크롤러가 이미 수집(중)인 ID는 탭 없이 그 결과만 기다림
+            if self.frontier:
+                future, owner = self.frontier.claim(content_id)
+                if not owner:
+                    shared.append(self._await_shared(index, future))
+                    continue
+                claimed.append(content_id)
+            queue.put_nowait((index, content_id))
+
+        results: list[tuple[int, KinoData]] = []
+        workers = min(self.tab_slots.max_limit, queue.qsize())
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    self._detail_worker(queue, len(ids), results)
+                    for _ in range(workers)
+                ),
+                *shared,
+            )
+        finally:
+            # 처리하지 못한 ID를 기다리는 다른 크롤러가 멈추지 않도록 정리
+            for content_id in claimed:
+                self.frontier.resolve(content_id, None)
+        results.extend(o for o in outcomes[workers:] if o[1] is not None)
+
+        if self.sink:
+            self.logger.info("Streamed results", crawler=self.name, count=self.streamed)
+        return [data for _, data in sorted(results, key=lambda r: r[0])]
+
+    async def _detail_worker(self, queue: asyncio.Queue, total: int, results: list):
+        page: Page | None = None
+        parked = False  # 슬롯 밖에서는 tab_slots.park()로 자리를 잡아 둔 탭만 유지
+        navigations = 0
+        try:
+            while not queue.empty():
+                index, content_id = queue.get_nowait()
+                result = None
+                # 열어 둔 탭은 한도가 줄었으면 닫고 다른 작업자처럼 슬롯을 기다림
+                reused = parked and self.tab_slots.reuse()
+                parked = False
+                if page is not None and not reused:
+                    await self._close_page(page)
+                    page = None
                 try:
-                    self.logger.info(
-                        f"Processing {index + 1}/{total}: {content_id}",
-                        crawler=self.name,
-                    )
-                    result = await self._parse_single_content(content_id, page)
-                    return result
+                    async with self.tab_slots.slot(reused=reused):
+                        try:
+                            if (
+                                page is None
+                                or page.is_closed()
+                                or navigations >= self.page_recycle
+                            ):
+                                await self._close_page(page)
+                                page = await self.context.new_page()
+                                navigations = 0
+
+                            self.logger.info(
+                                f"Processing {index + 1}/{total}: {content_id}",
+                                crawler=self.name,
+                            )
+                            navigations += 1
+                            with metrics.stage("title"):
+                                result = await self._parse_single_content(
+                                    content_id, page
+                                )
+                            metrics.count(
+                                "crawler_titles_total",
+                                result="ok" if result else "empty",
+                            )
+                            await page.goto("about:blank")
+                        except BaseException:
+                            # 크래시 등 상태를 알 수 없는 탭은 슬롯을 반납하기 전에 닫고
+                            # 다음 작업에서 새로 생성
+                            await self._close_page(page)
+                            page = None
+                            raise
                 except Exception as e:
+                    metrics.count("crawler_titles_total", result="error")
                     self.logger.error(f"Error parsing {content_id}: {e}")
-                    return None
                 finally:
-                    await page.close()
+                    if self.frontier:
+                        self.frontier.resolve(content_id, result)
 
-        tasks = [fetch(i, cid) for i, cid in enumerate(ids)]
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r is not None]
+                # 슬롯을 반납했으므로 한도 안에서만 탭을 열어 둠
+                parked = page is not None and self.tab_slots.park()
+                if page is not None and not parked:
+                    await self._close_page(page)
+                    page = None
+                if (data := await self._deliver(index, result, owner=True)) is not None:
+                    results.append((index, data))
+        finally:
+            await self._close_page(page)
+            if parked:
+                await self.tab_slots.unpark()
 
-    async def _parse_single_content(self, id: str, page: Page) -> KinoData | None:
-        """단일 페이지 파싱 (전달받은 page 객체 사용)"""
-        await page.goto(f"{self.TITLE_URL}{id}")
+    async def _await_shared(self, index: int, future: asyncio.Future):
         try:
-            await page.wait_for_selector(".title-kr", timeout=self.timeout)
-        except:
-            self.logger.warning(f"Timeout: {id}")
-            return None
-
-        title = await self._get_text(".title-kr", page=page)
-
-        # 정액제 탭
-        await self._click_element(".price-tab", page=page)
-        await page.wait_for_timeout(self.action_delay)
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            result = None
+        return index, await self._deliver(index, result, owner=False)
 
-        ott_items = await page.query_selector_all(".movie-price-item")
-        if not ott_items:
+    async def _deliver(
+        self, index: int, result: KinoData | None, owner: bool
+    ) -> KinoData | None:
+        """후처리 후 sink로 내보내거나(스트리밍) 호출자에게 반환"""
+        if result is None:
             return None
 
-        availabilities = await self._parse_availabilities(title, ott_items)
-
-        # 더보기 & 배경 이미지
-        await self._click_element("button.more", page=page)
-
-        style = await self._get_attribute("div.backdrop div", "style", page=page)
-        backdrop_url = (
-            m.group(1)
-            if style and (m := re.search(r"url\(['\"]?(.*?)['\"]?\)", style))
-            else None
-        )
+        result = self._finalize(index, result)
+        if self.sink:
+            # 저장은 sink가 담당하므로 결과를 쌓아두지 않음
+            if owner or self.EMIT_SHARED:
+                await self.sink.put(result)
+                self.streamed += 1
+            return None
+        return result
 
-        # 메타데이터 추출 (JS 실행)
-        metadata = await page.eval_on_selector_all(
-            ".metadata__item",
-            """items => {
-                const data = {};
-                items.forEach(item => {
-                    const t = item.querySelector('.item__title')?.textContent.trim();
-                    const b = item.querySelector('.item__body')?.textContent.trim();
-                    if (t && b) data[t] = b;
-                });
-                return data;
-            }""",
-        )
+    @staticmethod
+    async def _close_page(page: Page | None):
+        if page and not page.is_closed():
+            try:
+                await page.close()
+            except Exception:
+                pass
 
-        genre = metadata.get("장르", "Unknown")
-        rt_str = metadata.get("러닝타임")
-        running_time = int(re.search(r"(\d+)", rt_str).group(1)) if rt_str else None
-
-        program = Program(
-            kino_id=int(id),
-            title=title,
-            genre=genre,
-            description=(await self._get_text("div.synopsis", page=page)).strip(),
-            thumbnail_url=await self._get_attribute("div.poster img", "src", page=page),
-            backdrop_url=backdrop_url,
-            running_time=running_time,
-            ranking=None,  # 랭킹은 RankingCrawler에서 후처리
-        )
+    def _finalize(self, index: int, data: KinoData) -> KinoData:
+        """목록 순서 등 크롤러별 정보를 덧붙이는 후처리 (공유 결과는 수정하지 않음)"""
+        return data
 
-        return KinoData(program=program, availabilities=availabilities)
+    async def _parse_single_content(self, id: str, page: Page) -> KinoData | None:
+        """단일 페이지 파싱 (전달받은 page 객체 사용)"""
+        url = f"{self.TITLE_URL}{id}"
+        if self.extraction_mode == "network":
+            # SPA가 받아오는 상세 API 응답에서 바로 추출 (탭 클릭, DOM 파싱 생략)
+            async with TitleResponseCapture(page, id) as capture:
+                await self._goto(url, page=page)
+                with metrics.stage("api_capture"):
+                    data = await capture.wait()
+            if data is not None:
+                self._snapshot(id, "api", data)
+                with metrics.stage("api_parse"):
+                    try:
+                        result = parse_api_payload(id, data)
+                    except (ValueError, TypeError):
+                        # 예상과 다른 값 형식은 DOM 추출로 대체
+                        result = None
+                if result:
+                    return result
+            self.logger.info(f"API payload missing, falling back to DOM: {id}")
+        else:
+            await self._goto(url, page=page)
 
-    async def _parse_availabilities(self, title, ott_items) -> list[Availability]:
-        availabilities = []
-        for item in ott_items:
-            name_el = await item.query_selector(".name")
-            if not name_el:
-                continue
+        return await self._parse_dom(id, page)
 
-            ott_name = OTTPlatform.from_korean(await name_el.text_content())
+    async def _parse_dom(self, id: str, page: Page) -> KinoData | None:
+        """이동이 끝난 상세 페이지의 DOM에서 추출"""
+        with metrics.stage("wait_for_selector"):
+            ready = await self._wait_for(SelectorPresent(".title-kr"), page=page)
+        if not ready:
+            self.logger.warning(f"Timeout: {id}")
+            return None
 
-            url_el = await item.query_selector("a")
-            href = await url_el.get_attribute("href") if url_el else None
-            raw_url = (
-                href
-                if href
-                else f"https://search.naver.com/search.naver?query={urllib.parse.quote(title)}"
+        # 정액제 탭: OTT 목록 개수가 안정될 때까지
+        with metrics.stage("tab_click"):
+            await self._click_and_wait(
+                ".price-tab",
+                CountStable(".movie-price-item"),
+                page=page,
+                timeout=self.action_timeout,
             )
 
-            date_el = await item.query_selector(".date")
-            date_text = await date_el.text_content() if date_el else ""
-
-            release_date, expire_date = None, None
-            if m := re.search(r"종료예정일\s*:\s*(\d{4}\.\d{2}\.\d{2})", date_text):
-                expire_date = datetime.strptime(m.group(1), "%Y.%m.%d").date()
-            elif m := re.search(r"공개예정일\s*:\s*(\d{4}\.\d{2}\.\d{2})", date_text):
-                release_date = datetime.strptime(m.group(1), "%Y.%m.%d").date()
-
-            availabilities.append(
-                Availability(
-                    ott_name=ott_name,
-                    url=self._extract_original_url(raw_url),
-                    release_date=release_date,
-                    expire_date=expire_date,
+        # 더보기: 줄거리가 잘려 있을 때만 펼쳐질 때까지
+        with metrics.stage("synopsis_click"):
+            if await page.evaluate(_SYNOPSIS_TRUNCATED_JS):
+                await self._click_and_wait(
+                    "button.more",
+                    TextChanged("div.synopsis"),
+                    page=page,
+                    timeout=self.action_timeout,
                 )
-            )
-        return availabilities
 
-    def _extract_original_url(self, url: str | None) -> str | None:
-        if not url:
-            return None
+        # 제목, 메타데이터, 줄거리, 이미지, OTT 목록을 한 번의 evaluate로 추출
+        with metrics.stage("metadata_eval"):
+            payload = await page.evaluate(TITLE_PAGE_JS)
+        self._snapshot(id, "dom", payload)
+        with metrics.stage("availability_parse"):
+            return parse_title_payload(id, payload)
+
+    def _snapshot(self, key: str, kind: str, payload):
+        """추출 결과를 스냅샷 저장소에 기록 (실패해도 크롤링은 계속)"""
+        if not self.snapshots or not payload:
+            return
         try:
-            parsed = urllib.parse.urlparse(url)
-            qs = urllib.parse.parse_qs(parsed.query)
-            if "url" in qs:
-                return urllib.parse.unquote(qs["url"][0])
-        except:
-            pass
-        return url
+            self.snapshots.save(key, kind, payload)
+        except OSError as e:
+            self.logger.warning("Failed to save snapshot", key=key, error=str(e))
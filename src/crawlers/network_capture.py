@@ -0,0 +1,152 @@
+import asyncio
+import re
+from datetime import date
+from typing import TYPE_CHECKING
+from models import KinoData, Program, Availability, OTTPlatform
+from utils import config
+from .extraction import extract_original_url
+
+if TYPE_CHECKING:
+    # 스냅샷 재처리처럼 파서만 쓰는 경로에서는 Playwright를 불러오지 않음
+    from playwright.async_api import Page, Response
+
+# 상세 API 응답(JSON)에서 값을 읽을 경로 (점으로 구분)
+API_FIELD_PATHS = {
+    "program": "data",
+    "title": "titleKr",
+    "genre": "genres",
+    "description": "synopsis",
+    "thumbnail_url": "posterImage",
+    "backdrop_url": "backdropImage",
+    "running_time": "runningTime",
+    "otts": "providers",
+    "ott_name": "name",
+    "ott_url": "url",
+    "release_date": "releaseDate",
+    "expire_date": "expireDate",
+}
+
+
+def _dig(data, path: str):
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _parse_date(value) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _parse_int(value) -> int | None:
+    """정수 또는 "120분" 같은 문자열에서 숫자만 읽음 (없으면 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and (m := re.search(r"(\d+)", value)):
+        return int(m.group(1))
+    return None
+
+
+def parse_api_payload(content_id: str, data: dict) -> KinoData | None:
+    """상세 API 응답을 KinoData로 변환 (예상한 형태가 아니면 None)"""
+    p = API_FIELD_PATHS
+    item = _dig(data, p["program"])
+    if not isinstance(item, dict) or not item.get(p["title"]):
+        return None
+
+    otts = item.get(p["otts"])
+    if not isinstance(otts, list) or not otts:
+        return None
+
+    genre = item.get(p["genre"])
+    if isinstance(genre, list):
+        genre = ", ".join(str(g) for g in genre)
+
+    program = Program(
+        kino_id=int(content_id),
+        title=item[p["title"]],
+        genre=genre or "Unknown",
+        description=(item.get(p["description"]) or "").strip(),
+        thumbnail_url=item.get(p["thumbnail_url"]),
+        backdrop_url=item.get(p["backdrop_url"]),
+        running_time=_parse_int(item.get(p["running_time"])),
+        ranking=None,  # 랭킹은 RankingCrawler에서 후처리
+    )
+
+    availabilities = [
+        Availability(
+            ott_name=OTTPlatform.from_korean(ott.get(p["ott_name"])),
+            url=extract_original_url(ott.get(p["ott_url"])),
+            release_date=_parse_date(ott.get(p["release_date"])),
+            expire_date=_parse_date(ott.get(p["expire_date"])),
+        )
+        for ott in otts
+        if isinstance(ott, dict) and ott.get(p["ott_name"])
+    ]
+    return KinoData(program=program, availabilities=availabilities)
+
+
+class TitleResponseCapture:
+    """
+    상세 페이지 이동 중 SPA가 받아오는 상세 API 응답(JSON)을 가로채는 리스너
+
+        async with TitleResponseCapture(page, content_id) as capture:
+            await page.goto(url)
+            data = await capture.wait()
+    """
+
+    def __init__(self, page: "Page", content_id: str, timeout: int | None = None):
+        self.page = page
+        self.pattern = re.compile(
+            config.TITLE_API_PATTERN.replace("{id}", re.escape(content_id))
+        )
+        self.timeout = timeout or config.NETWORK_CAPTURE_TIMEOUT
+        self._future: asyncio.Future | None = None
+        # 읽는 중인 응답 (이벤트 핸들러에서 시작하므로 참조를 유지하고 종료 시 취소)
+        self._reads: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        self._future = asyncio.get_running_loop().create_future()
+        self.page.on("response", self._on_response)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.page.remove_listener("response", self._on_response)
+        for task in self._reads:
+            task.cancel()
+        self._reads.clear()
+        if not self._future.done():
+            self._future.cancel()
+
+    def _on_response(self, response: "Response"):
+        if self._future.done() or not self.pattern.search(response.url):
+            return
+        if response.ok:
+            task = asyncio.ensure_future(self._read(response))
+            self._reads.add(task)
+            task.add_done_callback(self._reads.discard)
+
+    async def _read(self, response: "Response"):
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        if not self._future.done():
+            self._future.set_result(data)
+
+    async def wait(self) -> dict | None:
+        """응답이 제한 시간 안에 오지 않으면 None"""
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(self._future), self.timeout / 1000
+            )
+        except asyncio.TimeoutError:
+            return None
@@ -1,37 +1,80 @@
 from .kino import KinoCrawler
 from models import KinoData
+from db import AsyncSessionLocal, Repository
+from dataclasses import replace
 import structlog
-import re
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from utils import config
 
 
 class RankingCrawler(KinoCrawler):
-    RANKING_URL = "https://m.kinolights.com/ranking"
+    """
+    랭킹 목록 크롤러
 
-    def __init__(self, logger: structlog.stdlib.BoundLogger | None = None, **kwargs):
+    full: 목록의 모든 작품 상세 페이지를 수집하며 목록 위치로 순위를 붙입니다.
+    fast: DB에 없는 작품만 상세 페이지를 수집합니다.
+          이미 있는 작품의 순위는 rankings 단계에서 목록 순서(ranked_ids)로 반영합니다.
+    """
+
+    RANKING_URL = f"{config.KINO_BASE_URL}/ranking"
+    INCREMENTAL = False  # 순위는 목록 순서로 매기므로 항상 전체 수집
+    EMIT_SHARED = True  # 공유 결과에도 순위를 붙여 다시 저장
+    RANKING_SIZE = config.RANKING_SIZE
+
+    def __init__(
+        self,
+        logger: structlog.stdlib.BoundLogger | None = None,
+        fast: bool | None = None,
+        session_factory: async_sessionmaker | None = None,
+        **kwargs,
+    ):
         super().__init__(url=self.RANKING_URL, name="ranking", logger=logger, **kwargs)
+        self.fast = config.RANKING_MODE == "fast" if fast is None else fast
+        self.session_factory = session_factory or AsyncSessionLocal
+        self.ranked_ids: list[str] = []
+        self._ranks: dict[str, int] = {}
 
-    async def crawl(self) -> list[KinoData]:
-        results = await super().crawl()
+    def _finalize(self, index: int, data: KinoData) -> KinoData:
+        # 순위는 목록 위치 (실패한 작품이 있거나 일부만 수집해도 다른 순위가 밀리지 않음)
+        # 다른 크롤러와 공유하는 KinoData는 그대로 두고 랭킹만 덧씌운 복사본 반환
+        ranking = self._ranks.get(str(data.program.kino_id), index + 1)
+        return replace(data, program=replace(data.program, ranking=ranking))
 
-        for rank, data in enumerate(results, start=1):
-            if data.program:
-                data.program.ranking = rank
+    def _restore_ids(self, ids: list[str]) -> list[str]:
+        self._set_ranked(ids)
+        return ids
 
-        return results
+    def _set_ranked(self, ids: list[str]):
+        self.ranked_ids = ids
+        self._ranks = {content_id: index + 1 for index, content_id in enumerate(ids)}
 
-    async def _get_content_ids(self) -> list[str]:
-        """랭킹 페이지 전용 ID 수집 로직"""
-        await self.page.goto(self.url)
-        await self.page.wait_for_load_state("networkidle", timeout=self.timeout)
-        await self._scroll_page_until_end(limit=self.scroll_limit)
+    async def _collect_ids(self) -> list[str]:
+        ids = await super()._collect_ids()
+        if not self.fast or not ids:
+            return ids
 
-        selector = ".content-ranking-list .ranking-item a[href*='/title/']"
-        items = await self._get_attributes(selector, "href")
+        # 상세 수집은 DB에 없는 작품만 (순위는 rankings 단계에서 반영)
+        try:
+            async with self.session_factory() as session:
+                known = await Repository(session, logger=self.logger).known_ids(
+                    [int(content_id) for content_id in ids]
+                )
+        except Exception as e:
+            # 조회에 실패하면 전체 상세 수집으로 대체
+            self.logger.error("Failed to load known titles", error=str(e))
+            return ids
+        return [content_id for content_id in ids if int(content_id) not in known]
 
-        ids = []
-        for item in items:
-            if m := re.search(r"/title/(\d+)", item):
-                ids.append(m.group(1))
+    async def _get_content_ids(self) -> list[str]:
+        """랭킹 페이지 전용 ID 수집 로직 (상위 RANKING_SIZE개를 채우면 중단)"""
+        await self._goto(self.url)
+        await self.page.wait_for_load_state("domcontentloaded")
 
-        unique_ids = list(dict.fromkeys(ids))
-        return unique_ids[:100]
+        ids = await self._harvest_ids(
+            ".content-ranking-list .ranking-item a[href*='/title/']",
+            r"/title/(\d+)",
+            limit=self.scroll_limit,
+            target=self.RANKING_SIZE,
+        )
+        self._set_ranked(ids)
+        return ids
@@ -0,0 +1,83 @@
+from dataclasses import replace
+from datetime import datetime
+import structlog
+from db import BatchWriter
+from utils import config, SnapshotStore
+from .extraction import parse_title_payload
+from .network_capture import parse_api_payload
+
+_PARSERS = {"dom": parse_title_payload, "api": parse_api_payload}
+
+
+class SnapshotReplay:
+    """
+    스냅샷 저장소의 추출 결과를 브라우저/네트워크 없이 다시 파싱해 저장
+
+    작품별 마지막 스냅샷(dom / api)을 크롤링과 같은 파서로 변환하고,
+    랭킹 목록 스냅샷이 있으면 목록 순서로 순위를 붙여 sink로 넘깁니다.
+    파서를 고친 뒤 재수집 없이 DB를 갱신하거나, 고정된 입력으로 파싱/저장 성능을 잴 때 사용합니다.
+    읽거나 파싱할 수 없는 스냅샷(손상, 이전 형식 등)은 기록만 하고 건너뜁니다.
+    """
+
+    RANKING_KEY = "listing-kinolights-ranking"
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        sink: BatchWriter,
+        until: datetime | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.store = store
+        self.sink = sink
+        self.until = until
+        self.logger = logger
+        self.parsed = 0
+        self.skipped = 0
+
+    def _rankings(self) -> dict[str, int]:
+        entry = self.store.latest(self.RANKING_KEY, until=self.until)
+        if entry is None:
+            return {}
+        ids = self.store.load(entry["hash"])[: config.RANKING_SIZE]
+        return {content_id: index + 1 for index, content_id in enumerate(ids)}
+
+    async def run(self, keys: list[str] | None = None) -> int:
+        rankings = self._rankings()
+        for key in keys or self.store.keys():
+            if not key.isdigit():
+                continue
+
+            entry = None
+            try:
+                entry = self.store.latest(key, until=self.until)
+                parser = _PARSERS.get(entry["kind"]) if entry else None
+                data = parser(key, self.store.load(entry["hash"])) if parser else None
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        "Failed to replay snapshot",
+                        key=key,
+                        hash=entry.get("hash") if entry else None,
+                        error=str(e),
+                    )
+                data = None
+            if data is None:
+                self.skipped += 1
+                continue
+
+            if key in rankings:
+                data = replace(
+                    data, program=replace(data.program, ranking=rankings[key])
+                )
+            await self.sink.put(data)
+            self.parsed += 1
+
+        if self.logger:
+            self.logger.info(
+                "Replay finished",
+                parsed=self.parsed,
+                skipped=self.skipped,
+                ranked=len(rankings),
+            )
+        return self.parsed
@@ -0,0 +1,84 @@
+import re
+from collections import Counter
+from playwright.async_api import BrowserContext, Route
+from utils import config
+
+# 컨테이너에서 불필요한 Chromium 기능 비활성화
+LEAN_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+
+def launch_options(headless: bool) -> dict:
+    """chromium.launch 인자 (LEAN_BROWSER 설정 반영)"""
+    options = {"headless": headless}
+    if config.LEAN_BROWSER:
+        options["args"] = LEAN_LAUNCH_ARGS
+    return options
+
+
+def context_options(device: dict) -> dict:
+    """
+    모바일 레이아웃에 필요한 값(뷰포트, UA, 터치)만 유지하고
+    고해상도 렌더링(device_scale_factor)은 1배로 낮춤
+    """
+    options = dict(device)
+    if config.LEAN_BROWSER:
+        options["device_scale_factor"] = 1
+    return options
+
+
+class ResourceFilter:
+    """
+    컨텍스트 단위 요청 차단 필터
+
+    - blocked_types: 항상 차단할 리소스 타입 (이미지, 폰트, 미디어 등)
+    - allowed_patterns: SPA 렌더링에 필요한 URL (blocked_patterns보다 우선)
+    - blocked_patterns: 분석/광고 등 차단할 URL 패턴
+    """
+
+    def __init__(
+        self,
+        blocked_types: list[str] | None = None,
+        blocked_patterns: list[str] | None = None,
+        allowed_patterns: list[str] | None = None,
+    ):
+        self.blocked_types = frozenset(blocked_types or [])
+        self.blocked_patterns = [re.compile(p) for p in blocked_patterns or []]
+        self.allowed_patterns = [re.compile(p) for p in allowed_patterns or []]
+        self.blocked = Counter()
+
+    @classmethod
+    def from_config(cls) -> "ResourceFilter":
+        return cls(
+            blocked_types=config.BLOCKED_RESOURCE_TYPES,
+            blocked_patterns=config.BLOCKED_URL_PATTERNS,
+            allowed_patterns=config.ALLOWED_URL_PATTERNS,
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_types:
+            return True
+        if any(p.search(url) for p in self.allowed_patterns):
+            return False
+        return any(p.search(url) for p in self.blocked_patterns)
+
+    async def handle(self, route: Route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def install(self, context: BrowserContext):
+        await context.route("**/*", self.handle)
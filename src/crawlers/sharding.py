@@ -0,0 +1,144 @@
+import asyncio
+import multiprocessing as mp
+import queue as queue_module
+import structlog
+from models import KinoData
+from utils import config, get_logger, SnapshotStore
+from .browser_pool import BrowserPool
+from .kino import KinoCrawler
+
+
+class _QueueSink:
+    """샤드 프로세스의 상세 결과를 부모 프로세스로 전달하는 sink"""
+
+    def __init__(self, shard: int, queue):
+        self.shard = shard
+        self.queue = queue
+
+    async def put(self, data: KinoData):
+        # 큐가 가득 차면 이벤트 루프를 막지 않고 스레드에서 대기
+        await asyncio.to_thread(self.queue.put, (self.shard, data))
+
+
+async def _run_shard(shard: int, ids: list[str], queue, max_tabs: int):
+    logger = get_logger(log_file_path=config.LOG_FILE_PATH, log_level=config.LOG_LEVEL)
+    try:
+        async with BrowserPool(max_tabs=max_tabs, logger=logger) as pool:
+            crawler = KinoCrawler(
+                url="",
+                name=f"shard-{shard}",
+                logger=logger,
+                pool=pool,
+                sink=_QueueSink(shard, queue),
+                snapshots=(
+                    SnapshotStore(config.SNAPSHOT_DIR) if config.SNAPSHOT_DIR else None
+                ),
+            )
+            await crawler.run_details(ids)
+    finally:
+        await asyncio.to_thread(queue.put, (shard, None))
+
+
+def _shard_main(shard: int, ids: list[str], queue, max_tabs: int):
+    asyncio.run(_run_shard(shard, ids, queue, max_tabs))
+
+
+class ShardedDetailCrawl:
+    """
+    중복 제거한 ID 집합을 여러 프로세스로 나눠 상세 페이지를 수집
+
+    각 샤드는 자신의 브라우저와 컨텍스트로 KinoCrawler 상세 단계를 실행하고,
+    결과는 큐로 부모에게 전달됩니다. DB 저장은 부모 프로세스의 sink만 담당합니다.
+    """
+
+    def __init__(
+        self,
+        shards: int | None = None,
+        max_tabs: int | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.shards = shards or config.SHARD_COUNT
+        self.max_tabs = max_tabs or config.SHARD_MAX_TABS or config.MAX_TABS
+        self.logger = logger
+
+    async def run(self, listings: list[tuple[KinoCrawler, list[str]]], sink) -> int:
+        """
+        listings: 크롤러별 목록 단계 결과
+        크롤러별 후처리(랭킹 등)는 부모에서 _finalize로 적용합니다.
+        """
+        positions: dict[str, list[tuple[KinoCrawler, int]]] = {}
+        for crawler, ids in listings:
+            for index, content_id in enumerate(ids):
+                positions.setdefault(content_id, []).append((crawler, index))
+        if not positions:
+            return 0
+
+        # 이어서 실행할 때 모든 소유 크롤러 기준으로 저장이 끝난 ID는 제외
+        unique_ids = [
+            content_id
+            for content_id, owners in positions.items()
+            if not all(crawler._is_done(content_id) for crawler, _ in owners)
+        ]
+        if not unique_ids:
+            return 0
+        shards = max(min(self.shards, len(unique_ids)), 1)
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue(maxsize=config.WRITE_QUEUE_SIZE)
+        processes = [
+            ctx.Process(
+                target=_shard_main,
+                args=(i, unique_ids[i::shards], queue, self.max_tabs),
+                name=f"crawler-shard-{i}",
+            )
+            for i in range(shards)
+        ]
+        for p in processes:
+            p.start()
+
+        if self.logger:
+            self.logger.info(
+                "Sharded detail crawl started",
+                ids=len(unique_ids),
+                shards=shards,
+                tabs_per_shard=self.max_tabs,
+            )
+
+        received, finished = 0, set()
+        try:
+            while len(finished) < shards:
+                try:
+                    shard, data = await asyncio.to_thread(queue.get, True, 1.0)
+                except queue_module.Empty:
+                    # 종료 신호 없이 죽은 샤드가 있으면 남은 결과만 받고 종료
+                    if not any(p.is_alive() for p in processes) and queue.empty():
+                        break
+                    continue
+
+                if data is None:
+                    finished.add(shard)
+                    continue
+
+                received += 1
+                await self._emit(
+                    data, positions.get(str(data.program.kino_id), []), sink
+                )
+        finally:
+            for p in processes:
+                await asyncio.to_thread(p.join)
+
+        failed = [p.name for p in processes if p.exitcode != 0]
+        if self.logger:
+            self.logger.info(
+                "Sharded detail crawl finished", received=received, failed=failed
+            )
+        return received
+
+    @staticmethod
+    async def _emit(data: KinoData, owners: list[tuple[KinoCrawler, int]], sink):
+        emitted = False
+        for crawler, index in owners:
+            if crawler.EMIT_SHARED:
+                await sink.put(crawler._finalize(index, data))
+                emitted = True
+        if not emitted:
+            await sink.put(data)
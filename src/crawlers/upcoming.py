@@ -1,10 +1,12 @@
 from .kino import KinoCrawler
 import structlog
+from utils import config
 
 
 # 키노라이츠 공개 예정작 크롤러
 class UpcomingCrawler(KinoCrawler):
-    BASE_URL = "https://m.kinolights.com/new?tab=upcoming"
+    BASE_URL = f"{config.KINO_BASE_URL}/new?tab=upcoming"
+    LISTING = "upcoming"
 
     def __init__(self, logger: structlog.stdlib.BoundLogger | None = None, **kwargs):
         super().__init__(url=self.BASE_URL, name="upcoming", logger=logger, **kwargs)
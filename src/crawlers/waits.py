@@ -0,0 +1,122 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+
+class WaitCondition(ABC):
+    """
+    상호작용이 끝났음을 나타내는 DOM 조건
+
+    prepare()는 동작 전에 기준 상태를 기록하고, wait()는 조건이 충족될 때까지 기다립니다.
+    """
+
+    async def prepare(self, page: Page):
+        pass
+
+    @abstractmethod
+    async def wait(self, page: Page, timeout: int):
+        pass
+
+    def discard(self):
+        """동작이 실행되지 않아 기다리지 않을 때 prepare()에서 만든 상태 정리"""
+        pass
+
+
+class SelectorPresent(WaitCondition):
+    """선택자에 맞는 요소가 생김"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    async def wait(self, page: Page, timeout: int):
+        await page.wait_for_selector(self.selector, state="attached", timeout=timeout)
+
+
+class CountStable(WaitCondition):
+    """
+    선택자에 맞는 요소 개수가 quiet_ms 동안 변하지 않음
+
+    요소가 하나도 없으면 늦게 렌더링될 수 있으므로 empty_ms 동안 0개로 유지될 때 충족됩니다.
+    """
+
+    JS = """
+    ({selector, quiet, empty}) => {
+        const n = document.querySelectorAll(selector).length;
+        const states = window.__countStable || (window.__countStable = {});
+        const now = performance.now();
+        const s = states[selector];
+        if (!s || s.n !== n) {
+            states[selector] = { n, t: now };
+            return false;
+        }
+        return now - s.t >= (n > 0 ? quiet : empty);
+    }
+    """
+
+    def __init__(self, selector: str, quiet_ms: int = 150, empty_ms: int = 500):
+        self.selector = selector
+        self.quiet_ms = quiet_ms
+        self.empty_ms = empty_ms
+
+    async def prepare(self, page: Page):
+        await page.evaluate(
+            "sel => { if (window.__countStable) delete window.__countStable[sel]; }",
+            self.selector,
+        )
+
+    async def wait(self, page: Page, timeout: int):
+        await page.wait_for_function(
+            self.JS,
+            arg={
+                "selector": self.selector,
+                "quiet": self.quiet_ms,
+                "empty": self.empty_ms,
+            },
+            timeout=timeout,
+        )
+
+
+class TextChanged(WaitCondition):
+    """선택자 요소의 텍스트가 동작 전과 달라짐"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self._before: str | None = None
+
+    async def prepare(self, page: Page):
+        self._before = await page.eval_on_selector_all(
+            self.selector, "els => els.length ? els[0].textContent : null"
+        )
+
+    async def wait(self, page: Page, timeout: int):
+        await page.wait_for_function(
+            """([sel, before]) => {
+                const el = document.querySelector(sel);
+                return !!el && el.textContent !== before;
+            }""",
+            arg=[self.selector, self._before],
+            timeout=timeout,
+        )
+
+
+async def act_and_wait(
+    page: Page,
+    action: Callable[[], Awaitable[bool | None]],
+    condition: WaitCondition,
+    timeout: int,
+) -> bool:
+    """
+    동작을 실행하고 완료 조건을 기다림 (최대 timeout ms)
+
+    동작이 False를 반환하면(대상 요소 없음 등) 기다리지 않습니다.
+    조건이 제때 충족되지 않으면 False를 반환하고 현재 상태로 계속 진행합니다.
+    """
+    await condition.prepare(page)
+    if await action() is False:
+        condition.discard()
+        return False
+    try:
+        await condition.wait(page, timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
@@ -7,8 +7,14 @@ from .models import (
     UserModel,
     SubscribeModel,
     WishlistModel,
+    CrawlRunModel,
+    CrawlJobModel,
+    SchemaMetaModel,
 )
 from .repository import Repository
+from .writer import BatchWriter
+from .job_queue import JobQueue
+from .reference import OTTReference, ott_reference
 
 __all__ = [
     "engine",
@@ -24,5 +30,12 @@ __all__ = [
     "UserModel",
     "SubscribeModel",
     "WishlistModel",
+    "CrawlRunModel",
+    "CrawlJobModel",
+    "SchemaMetaModel",
     "Repository",
+    "BatchWriter",
+    "JobQueue",
+    "OTTReference",
+    "ott_reference",
 ]
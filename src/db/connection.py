@@ -1,6 +1,13 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from utils import config
 from .models import OTTModel, Base
+from .migrations import (
+    upgrade_schema,
+    schema_fingerprint,
+    stored_fingerprint,
+    store_fingerprint,
+)
+from .reference import ott_reference
 from models.ott_enum import OTTPlatform
 from sqlalchemy.future import select
 
@@ -9,6 +16,8 @@ engine = create_async_engine(
     echo=config.LOG_LEVEL == "DEBUG",
     pool_pre_ping=True,
     pool_recycle=3600,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -26,9 +35,24 @@ async def get_db():
             await session.close()
 
 
-async def init_db():
+async def init_db(force: bool = False) -> bool:
+    """
+    테이블 생성과 컬럼/인덱스 보강
+
+    저장된 스키마 지문이 현재 모델과 같으면 조회 한 번으로 끝냅니다. (create_all의 테이블별 조회 생략)
+    스키마를 적용했으면 True를 반환합니다.
+    """
+    fingerprint = schema_fingerprint(Base.metadata, engine.dialect)
+    if not force:
+        async with engine.connect() as conn:
+            if await conn.run_sync(stored_fingerprint) == fingerprint:
+                return False
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+        await conn.run_sync(store_fingerprint, fingerprint)
+    return True
 
 
 async def close_db():
@@ -48,3 +72,5 @@ async def seed_otts():
                 session.add(new_ott)
 
         await session.commit()
+        # 이후 저장 단계에서 매번 OTT 테이블을 조회하지 않도록 한 번 적재
+        await ott_reference.refresh(session)
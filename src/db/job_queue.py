@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from datetime import datetime
+import structlog
+from sqlalchemy import select, update, func, text, case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from utils import config
+from .models import CrawlRunModel, CrawlJobModel
+
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    job_id: int
+    run_id: str
+    crawling_id: int
+    ranking: int | None
+
+
+def _lease_until(seconds: int):
+    # 노드 간 시계 차이가 없도록 만료 시각은 DB 시간 기준으로 계산
+    return func.timestampadd(text("SECOND"), seconds, func.now())
+
+
+class JobQueue:
+    """
+    Crawl_Job 테이블 기반 작업 큐
+
+    코디네이터가 목록에서 모은 ID를 실행(run) 단위로 넣으면, 여러 작업 노드가
+    SELECT ... FOR UPDATE SKIP LOCKED로 서로 겹치지 않게 작업을 임대(lease)합니다.
+    임대는 heartbeat로 연장하고, 만료된 임대는 다른 노드가 다시 가져갑니다.
+    JOB_MAX_ATTEMPTS번 임대해도 끝나지 않은 작업은 failed로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ):
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds or config.JOB_LEASE_SECONDS
+        self.max_attempts = max_attempts or config.JOB_MAX_ATTEMPTS
+        self.logger = logger
+
+    async def create_run(
+        self,
+        run_id: str,
+        started_at: datetime,
+        cleanup_upcoming: bool = False,
+        cleanup_expiring: bool = False,
+    ):
+        async with self.session_factory() as session:
+            session.add(
+                CrawlRunModel(
+                    run_id=run_id,
+                    status="listing",
+                    started_at=started_at,
+                    cleanup_upcoming=cleanup_upcoming,
+                    cleanup_expiring=cleanup_expiring,
+                )
+            )
+            await session.commit()
+
+    async def set_run_status(self, run_id: str, status: str):
+        values = {"status": status}
+        if status == "finished":
+            values["finished_at"] = func.now()
+        async with self.session_factory() as session:
+            await session.execute(
+                update(CrawlRunModel)
+                .where(CrawlRunModel.run_id == run_id)
+                .values(**values)
+            )
+            await session.commit()
+
+    async def enqueue(
+        self,
+        run_id: str,
+        ids: list[str],
+        rankings: dict[str, int] | None = None,
+    ) -> int:
+        """ID를 작업으로 등록 (같은 실행 안의 중복 ID는 한 작업으로 합치고 순위는 유지)"""
+        rankings = rankings or {}
+        values = [
+            {
+                "run_id": run_id,
+                "crawling_id": int(content_id),
+                "ranking": rankings.get(content_id),
+            }
+            for content_id in dict.fromkeys(ids)
+        ]
+        if not values:
+            return 0
+
+        stmt = mysql_insert(CrawlJobModel).values(values)
+        stmt = stmt.on_duplicate_key_update(
+            ranking=func.coalesce(stmt.inserted.ranking, CrawlJobModel.ranking)
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+        if self.logger:
+            self.logger.info("Jobs enqueued", run_id=run_id, count=len(values))
+        return len(values)
+
+    async def lease(self, owner: str, limit: int) -> list[Job]:
+        """대기 중이거나 임대가 만료된 작업을 최대 limit개 임대"""
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    CrawlJobModel.job_id,
+                    CrawlJobModel.run_id,
+                    CrawlJobModel.crawling_id,
+                    CrawlJobModel.ranking,
+                )
+                .where(
+                    (CrawlJobModel.status == PENDING)
+                    | (
+                        (CrawlJobModel.status == LEASED)
+                        & (CrawlJobModel.lease_expires_at < func.now())
+                    )
+                )
+                .where(CrawlJobModel.attempts < self.max_attempts)
+                .order_by(CrawlJobModel.job_id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = [Job(*row) for row in (await session.execute(stmt)).all()]
+            if jobs:
+                await session.execute(
+                    update(CrawlJobModel)
+                    .where(CrawlJobModel.job_id.in_([j.job_id for j in jobs]))
+                    .values(
+                        status=LEASED,
+                        lease_owner=owner,
+                        lease_expires_at=_lease_until(self.lease_seconds),
+                        attempts=CrawlJobModel.attempts + 1,
+                    )
+                )
+            await session.commit()
+        return jobs
+
+    async def heartbeat(self, owner: str, job_ids: list[int]) -> int:
+        """임대 연장 (다른 노드에 넘어간 작업은 제외하고 연장된 개수 반환)"""
+        return await self._update_owned(
+            owner,
+            job_ids,
+            lease_expires_at=_lease_until(self.lease_seconds),
+        )
+
+    async def complete(self, owner: str, job_ids: list[int]) -> int:
+        return await self._update_owned(
+            owner, job_ids, status=DONE, lease_owner=None, lease_expires_at=None
+        )
+
+    async def release(self, owner: str, job_ids: list[int]) -> int:
+        """끝내지 못한 작업 반납 (시도 횟수를 다 쓴 작업은 failed)"""
+        return await self._update_owned(
+            owner,
+            job_ids,
+            status=case(
+                (CrawlJobModel.attempts >= self.max_attempts, FAILED),
+                else_=PENDING,
+            ),
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    async def _update_owned(self, owner: str, job_ids: list[int], **values) -> int:
+        if not job_ids:
+            return 0
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(CrawlJobModel)
+                .where(CrawlJobModel.job_id.in_(job_ids))
+                .where(CrawlJobModel.status == LEASED)
+                .where(CrawlJobModel.lease_owner == owner)
+                .values(**values)
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def reap(self, run_id: str) -> int:
+        """임대가 만료됐고 더 시도할 수 없는 작업을 failed로 정리"""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(CrawlJobModel)
+                .where(CrawlJobModel.run_id == run_id)
+                .where(
+                    (CrawlJobModel.status == PENDING)
+                    | (
+                        (CrawlJobModel.status == LEASED)
+                        & (CrawlJobModel.lease_expires_at < func.now())
+                    )
+                )
+                .where(CrawlJobModel.attempts >= self.max_attempts)
+                .values(status=FAILED, lease_owner=None, lease_expires_at=None)
+            )
+            await session.commit()
+        if result.rowcount and self.logger:
+            self.logger.warning("Jobs failed", run_id=run_id, count=result.rowcount)
+        return result.rowcount
+
+    async def counts(self, run_id: str) -> dict[str, int]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(CrawlJobModel.status, func.count())
+                .where(CrawlJobModel.run_id == run_id)
+                .group_by(CrawlJobModel.status)
+            )
+            return dict(result.all())
+
+    async def is_drained(self, run_id: str) -> bool:
+        await self.reap(run_id)
+        counts = await self.counts(run_id)
+        return not counts.get(PENDING) and not counts.get(LEASED)
@@ -0,0 +1,105 @@
+import hashlib
+from sqlalchemy import MetaData, inspect, select, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex, CreateTable
+from .models import SchemaMetaModel
+
+FINGERPRINT_KEY = "schema_fingerprint"
+
+# create_all은 기존 테이블에 컬럼을 추가하지 않으므로 이후에 추가된 컬럼은 여기서 보강
+# (테이블, 컬럼, 컬럼 정의, 추가 후 채울 값)
+ADDED_COLUMNS = [
+    ("Program", "content_hash", "VARCHAR(64) NULL", None),
+    ("Program", "last_seen_at", "TIMESTAMP NULL", "updated_at"),
+    ("Program_Availability", "content_hash", "VARCHAR(64) NULL", None),
+    ("Program_Availability", "last_seen_at", "TIMESTAMP NULL", "updated_at"),
+]
+
+# create_all은 기존 테이블에 인덱스도 추가하지 않으므로 함께 보강
+# (테이블, 인덱스 이름, 컬럼)
+ADDED_INDEXES = [
+    ("Program", "ix_program_ranking", ("ranking",)),
+    (
+        "Program_Availability",
+        "ix_availability_seen_release",
+        ("last_seen_at", "release_date"),
+    ),
+    (
+        "Program_Availability",
+        "ix_availability_seen_expire",
+        ("last_seen_at", "expire_date"),
+    ),
+]
+
+
+def upgrade_schema(conn: Connection) -> list[str]:
+    """
+    기존 테이블에 빠진 컬럼과 인덱스 추가 (run_sync로 실행)
+
+    last_seen_at은 기존 updated_at으로 채워 정리 단계가 기존 행을 바로 지우지 않도록 합니다.
+    추가한 컬럼과 인덱스 목록을 반환합니다.
+    """
+    inspector = inspect(conn)
+    tables = set(inspector.get_table_names())
+    added = []
+    for table, column, ddl, backfill in ADDED_COLUMNS:
+        if table not in tables:
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table)}
+        if column in existing:
+            continue
+
+        conn.execute(text(f"ALTER TABLE `{table}` ADD COLUMN `{column}` {ddl}"))
+        if backfill:
+            # updated_at이 자동 갱신되지 않도록 자기 값으로 명시
+            conn.execute(
+                text(
+                    f"UPDATE `{table}` SET `{column}` = `{backfill}`, "
+                    f"updated_at = updated_at WHERE `{column}` IS NULL"
+                )
+            )
+        added.append(f"{table}.{column}")
+
+    for table, name, columns in ADDED_INDEXES:
+        if table not in tables:
+            continue
+        existing = {i["name"] for i in inspector.get_indexes(table)}
+        if name in existing:
+            continue
+
+        cols = ", ".join(f"`{c}`" for c in columns)
+        conn.execute(text(f"CREATE INDEX `{name}` ON `{table}` ({cols})"))
+        added.append(f"{table}.{name}")
+    return added
+
+
+def schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    """모델 DDL(테이블, 인덱스)과 보강 목록의 해시 (모델이 바뀌면 달라짐)"""
+    digest = hashlib.sha256()
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    digest.update(repr((ADDED_COLUMNS, ADDED_INDEXES)).encode())
+    return digest.hexdigest()
+
+
+def stored_fingerprint(conn: Connection) -> str | None:
+    """마지막으로 적용한 스키마 지문 (Schema_Meta가 없으면 None)"""
+    try:
+        return conn.execute(
+            select(SchemaMetaModel.meta_value).where(
+                SchemaMetaModel.meta_key == FINGERPRINT_KEY
+            )
+        ).scalar()
+    except DBAPIError:
+        return None
+
+
+def store_fingerprint(conn: Connection, fingerprint: str):
+    stmt = mysql_insert(SchemaMetaModel.__table__).values(
+        meta_key=FINGERPRINT_KEY, meta_value=fingerprint
+    )
+    conn.execute(stmt.on_duplicate_key_update(meta_value=stmt.inserted.meta_value))
@@ -8,6 +8,8 @@ from sqlalchemy import (
     UniqueConstraint,
     TIMESTAMP,
     BigInteger,
+    Boolean,
+    Index,
 )
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
@@ -63,15 +65,22 @@ class ProgramModel(Base):
     backdrop_url = Column(String(255), nullable=True)
     running_time = Column(Integer, nullable=True)
     ranking = Column(Integer, nullable=True)
+    # 순위를 제외한 수집 내용의 해시 (바뀐 행만 다시 쓰기 위함)
+    content_hash = Column(String(64), nullable=True)
+    # 마지막으로 내용이 바뀐 시각 / 마지막으로 상세 페이지에서 확인한 시각
     updated_at = Column(
         TIMESTAMP, nullable=False, default=func.now(), onupdate=func.now()
     )
+    last_seen_at = Column(TIMESTAMP, nullable=True, default=func.now())
 
     availabilities = relationship(
         "AvailabilityModel", back_populates="program", cascade="all, delete-orphan"
     )
     wishlists = relationship("WishlistModel", back_populates="program")
 
+    # 순위 초기화(ranking IS NOT NULL) 대상 조회용
+    __table_args__ = (Index("ix_program_ranking", "ranking"),)
+
 
 class AvailabilityModel(Base):
     __tablename__ = "Program_Availability"
@@ -82,14 +91,22 @@ class AvailabilityModel(Base):
     url = Column(String(255), nullable=False)
     release_date = Column(Date, nullable=True)
     expire_date = Column(Date, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    # 마지막으로 내용이 바뀐 시각 / 마지막으로 목록이나 상세 페이지에서 확인한 시각
     updated_at = Column(
         TIMESTAMP, nullable=False, default=func.now(), onupdate=func.now()
     )
+    last_seen_at = Column(TIMESTAMP, nullable=True, default=func.now())
 
     program = relationship("ProgramModel", back_populates="availabilities")
     ott = relationship("OTTModel", back_populates="availabilities")
 
-    __table_args__ = (UniqueConstraint("program_id", "ott_id", name="uix_program_ott"),)
+    __table_args__ = (
+        UniqueConstraint("program_id", "ott_id", name="uix_program_ott"),
+        # 정리 단계의 last_seen_at 범위 + 공개/종료 예정 조건 조회용
+        Index("ix_availability_seen_release", "last_seen_at", "release_date"),
+        Index("ix_availability_seen_expire", "last_seen_at", "expire_date"),
+    )
 
 
 class WishlistModel(Base):
@@ -102,113 +119,49 @@ class WishlistModel(Base):
     user = relationship("UserModel", back_populates="wishlists")
     program = relationship("ProgramModel", back_populates="wishlists")
 
-    # filepath: /Users/mingyu/SE-MoaBom-crawler/src/db/models.py
-
-
-from sqlalchemy import (
-    Column,
-    Integer,
-    String,
-    Date,
-    ForeignKey,
-    Text,
-    UniqueConstraint,
-    TIMESTAMP,
-    BigInteger,
-)
-from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.sql import func
-
-Base = declarative_base()
-
-
-class UserModel(Base):
-    __tablename__ = "User"
-
-    user_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    email = Column(String(50), nullable=False, unique=True)
-    password = Column(String(255), nullable=False)
-
-    subscribes = relationship("SubscribeModel", back_populates="user")
-    wishlists = relationship("WishlistModel", back_populates="user")
-
+    __table_args__ = (
+        UniqueConstraint("user_id", "program_id", name="uix_user_program"),
+    )
 
-class OTTModel(Base):
-    __tablename__ = "OTT"
 
-    ott_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    name = Column(String(100), nullable=False)
-    price = Column(Integer, nullable=False)
-    logo_url = Column(String(255), nullable=False)
+class CrawlRunModel(Base):
+    __tablename__ = "Crawl_Run"
 
-    subscribes = relationship("SubscribeModel", back_populates="ott")
-    availabilities = relationship("AvailabilityModel", back_populates="ott")
+    run_id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False, default="listing")
+    started_at = Column(TIMESTAMP, nullable=False)
+    cleanup_upcoming = Column(Boolean, nullable=False, default=False)
+    cleanup_expiring = Column(Boolean, nullable=False, default=False)
+    finished_at = Column(TIMESTAMP, nullable=True)
 
 
-class SubscribeModel(Base):
-    __tablename__ = "Subscribe"
+class CrawlJobModel(Base):
+    __tablename__ = "Crawl_Job"
 
-    subscribe_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(BigInteger, ForeignKey("User.user_id"), nullable=False)
-    ott_id = Column(BigInteger, ForeignKey("OTT.ott_id"), nullable=False)
-    start_date = Column(Date, nullable=False)
-    end_date = Column(Date, nullable=True)
-
-    user = relationship("UserModel", back_populates="subscribes")
-    ott = relationship("OTTModel", back_populates="subscribes")
-
-
-class ProgramModel(Base):
-    __tablename__ = "Program"
-
-    program_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    crawling_id = Column(BigInteger, unique=True, nullable=False)
-    title = Column(String(100), nullable=False)
-    genre = Column(String(50), nullable=False)
-    description = Column(Text, nullable=False)
-    thumbnail_url = Column(String(255), nullable=False)
-    backdrop_url = Column(String(255), nullable=True)
-    running_time = Column(Integer, nullable=True)
+    job_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(String(36), ForeignKey("Crawl_Run.run_id"), nullable=False)
+    crawling_id = Column(BigInteger, nullable=False)
     ranking = Column(Integer, nullable=True)
+    status = Column(String(20), nullable=False, default="pending")
+    lease_owner = Column(String(100), nullable=True)
+    lease_expires_at = Column(TIMESTAMP, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
     updated_at = Column(
         TIMESTAMP, nullable=False, default=func.now(), onupdate=func.now()
     )
 
-    availabilities = relationship(
-        "AvailabilityModel", back_populates="program", cascade="all, delete-orphan"
+    __table_args__ = (
+        UniqueConstraint("run_id", "crawling_id", name="uix_run_crawling"),
+        Index("ix_job_status_lease", "status", "lease_expires_at"),
     )
-    wishlists = relationship("WishlistModel", back_populates="program")
 
 
-class AvailabilityModel(Base):
-    __tablename__ = "Program_Availability"
+class SchemaMetaModel(Base):
+    __tablename__ = "Schema_Meta"
 
-    availability_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    program_id = Column(BigInteger, ForeignKey("Program.program_id"), nullable=False)
-    ott_id = Column(BigInteger, ForeignKey("OTT.ott_id"), nullable=False)
-    url = Column(String(255), nullable=False)
-    release_date = Column(Date, nullable=True)
-    expire_date = Column(Date, nullable=True)
+    # 예: schema_fingerprint -> 마지막으로 적용한 모델 DDL의 해시
+    meta_key = Column(String(64), primary_key=True)
+    meta_value = Column(String(255), nullable=False)
     updated_at = Column(
         TIMESTAMP, nullable=False, default=func.now(), onupdate=func.now()
     )
-
-    program = relationship("ProgramModel", back_populates="availabilities")
-    ott = relationship("OTTModel", back_populates="availabilities")
-
-    __table_args__ = (UniqueConstraint("program_id", "ott_id", name="uix_program_ott"),)
-
-
-class WishlistModel(Base):
-    __tablename__ = "Wishlist"
-
-    wishlist_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(BigInteger, ForeignKey("User.user_id"), nullable=False)
-    program_id = Column(BigInteger, ForeignKey("Program.program_id"), nullable=False)
-
-    user = relationship("UserModel", back_populates="wishlists")
-    program = relationship("ProgramModel", back_populates="wishlists")
-
-    __table_args__ = (
-        UniqueConstraint("user_id", "program_id", name="uix_user_program"),
-    )
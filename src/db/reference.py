@@ -0,0 +1,38 @@
+from types import MappingProxyType
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from .models import OTTModel
+
+
+class OTTReference:
+    """
+    OTT 이름 -> ott_id 참조 데이터
+
+    OTT 테이블은 seed_otts 이후 바뀌지 않으므로 시작 시 한 번 읽어 읽기 전용 매핑으로 보관합니다.
+    seed_otts를 거치지 않은 경로에서는 처음 필요할 때 한 번 조회합니다.
+    """
+
+    def __init__(self):
+        self._ids: MappingProxyType = MappingProxyType({})
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._ids)
+
+    def load(self, rows) -> MappingProxyType:
+        """(name, ott_id) 목록으로 매핑 교체"""
+        self._ids = MappingProxyType({name: ott_id for name, ott_id in rows})
+        return self._ids
+
+    async def refresh(self, session: AsyncSession) -> MappingProxyType:
+        result = await session.execute(select(OTTModel.name, OTTModel.ott_id))
+        return self.load(result.all())
+
+    async def ensure(self, session: AsyncSession) -> MappingProxyType:
+        if not self.loaded:
+            await self.refresh(session)
+        return self._ids
+
+
+# 프로세스 안의 모든 Repository가 공유
+ott_reference = OTTReference()
@@ -1,15 +1,72 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.mysql import insert as mysql_insert
-from sqlalchemy import select, exists, func
-from .models import ProgramModel, AvailabilityModel, OTTModel
+from sqlalchemy import select, exists, func, update, case, delete
+from .models import ProgramModel, AvailabilityModel
+from .reference import ott_reference
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type,
 )
+import asyncio
 import structlog
-from datetime import timedelta
+import hashlib
+import json
+from dataclasses import dataclass, field, asdict
+from utils import config, metrics
+from datetime import datetime, timedelta
+from typing import Callable
+
+
+def _content_hash(row: dict) -> str:
+    """비교할 컬럼 값의 해시 (키 순서와 무관)"""
+    body = json.dumps(row, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _row_size(row: dict) -> int:
+    """행 하나가 SQL 문에서 차지하는 대략적인 바이트 수 (값 + 따옴표/구분자)"""
+    return sum(len(str(v).encode("utf-8")) + 4 for v in row.values()) + 4
+
+
+def _chunk_rows(rows: list[dict], max_bytes: int, max_rows: int):
+    """max_allowed_packet을 넘지 않도록 바이트/행 수 기준으로 나눈 (묶음, 크기)"""
+    chunk, size = [], 0
+    for row in rows:
+        row_size = _row_size(row)
+        if chunk and (size + row_size > max_bytes or len(chunk) >= max_rows):
+            yield chunk, size
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk, size
+
+
+@dataclass(slots=True)
+class ChunkResult:
+    table: str
+    rows: int
+    bytes: int
+    inserted: int | None = None
+    updated: int | None = None
+    failed: bool = False
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class SaveReport:
+    """save_crawl_results 결과 (묶음별 삽입/갱신 수, 테이블별 변경 없는 행 수, 모든 묶음 성공 여부)"""
+
+    chunks: list[ChunkResult] = field(default_factory=list)
+    unchanged: dict[str, int] = field(default_factory=dict)
+    ok: bool = True
+
+    def __bool__(self) -> bool:
+        return self.ok
 
 
 class Repository:
@@ -19,71 +76,107 @@ class Repository:
         self.session = session
         self.logger = logger
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True,
-    )
-    async def save_crawl_results(self, results):
+    async def save_crawl_results(self, results) -> "SaveReport":
         """
         크롤링 결과를 DB에 저장합니다. (Bulk Upsert)
+
+        기존 행의 content_hash를 한 번에 읽어 새 행이나 내용이 바뀐 행만 upsert하고,
+        그대로인 행은 last_seen_at만 한 문장으로 갱신합니다.
+        행을 DB_CHUNK_BYTES / DB_CHUNK_ROWS 이하의 묶음(chunk)으로 나눠 executemany로 upsert하고,
+        묶음마다 따로 커밋과 재시도를 합니다. (upsert라 같은 묶음을 다시 실행해도 안전)
+        일부 묶음이 끝내 실패해도 나머지는 저장하고, 반환값의 ok가 False가 됩니다.
         """
+        report = SaveReport()
         if not results:
-            return
+            return report
 
         try:
             # 1. Program 데이터 준비
             program_values = []
             for data in results:
                 p = data.program
-                program_values.append(
-                    {
-                        "crawling_id": p.kino_id,
-                        "title": p.title,
-                        "genre": p.genre,
-                        "description": p.description,
-                        "thumbnail_url": p.thumbnail_url,
-                        "backdrop_url": p.backdrop_url,
-                        "running_time": p.running_time,
-                        "ranking": p.ranking,
-                    }
-                )
-
-            # 2. Program Bulk Upsert
-            if program_values:
-                stmt = mysql_insert(ProgramModel).values(program_values)
-                update_dict = {
-                    col.name: col
-                    for col in stmt.inserted
-                    if col.name not in ["program_id", "crawling_id", "created_at"]
+                row = {
+                    "crawling_id": p.kino_id,
+                    "title": p.title,
+                    "genre": p.genre,
+                    "description": p.description,
+                    "thumbnail_url": p.thumbnail_url,
+                    "backdrop_url": p.backdrop_url,
+                    "running_time": p.running_time,
                 }
-                update_dict["updated_at"] = func.now()
-                await self.session.execute(stmt.on_duplicate_key_update(update_dict))
-                await self.session.commit()
+                # 순위는 별도 비교 (순위 없는 결과가 기존 순위를 지우지 않으므로)
+                row["content_hash"] = _content_hash(row)
+                row["ranking"] = p.ranking
+                program_values.append(row)
 
-            # 3. ID 매핑 (crawling_id -> program_id)
-            kino_ids = [data.program.kino_id for data in results]
-            stmt_prog = select(ProgramModel.crawling_id, ProgramModel.program_id).where(
-                ProgramModel.crawling_id.in_(kino_ids)
+            # 2. 기존 Program 해시 조회 후 바뀐 행만 Upsert
+            kino_ids = [row["crawling_id"] for row in program_values]
+            existing = {
+                r.crawling_id: r
+                for r in (
+                    await self.session.execute(
+                        select(
+                            ProgramModel.crawling_id,
+                            ProgramModel.program_id,
+                            ProgramModel.content_hash,
+                            ProgramModel.ranking,
+                        ).where(ProgramModel.crawling_id.in_(kino_ids))
+                    )
+                ).all()
+            }
+            # 내용이 바뀐 행만 upsert, 순위만 바뀐 행은 updated_at을 유지한 채 순위만 갱신
+            changed, unchanged, reranked = [], [], {}
+            for row in program_values:
+                old = existing.get(row["crawling_id"])
+                if old is None or old.content_hash != row["content_hash"]:
+                    changed.append(row)
+                elif row["ranking"] is not None and row["ranking"] != old.ranking:
+                    reranked[old.program_id] = row["ranking"]
+                else:
+                    unchanged.append(old.program_id)
+
+            stmt = mysql_insert(ProgramModel.__table__)
+            update_dict = {
+                col.name: col
+                for col in stmt.inserted
+                if col.name not in ["program_id", "crawling_id", "created_at"]
+            }
+            # 랭킹 정보가 없는 결과가 기존 순위를 지우지 않도록 유지
+            update_dict["ranking"] = func.coalesce(
+                stmt.inserted.ranking, ProgramModel.ranking
             )
-            result_prog = await self.session.execute(stmt_prog)
-            kino_id_map = {row.crawling_id: row.program_id for row in result_prog.all()}
-
-            # 4. OTT ID 매핑 (name -> ott_id)
-            all_ott_names = set(
-                avail.ott_name.value
-                for data in results
-                for avail in data.availabilities
-                if avail.ott_name
+            # 여러 세션이 동시에 저장할 때 잠금 순서가 엇갈리지 않도록 키 순서로 정렬
+            changed.sort(key=lambda row: row["crawling_id"])
+            await self._upsert_chunks(
+                stmt.on_duplicate_key_update(update_dict),
+                changed,
+                report,
+                is_new=lambda row: row["crawling_id"] not in existing,
             )
-            ott_map = {}
-            if all_ott_names:
-                stmt_ott = select(OTTModel.name, OTTModel.ott_id).where(
-                    OTTModel.name.in_(all_ott_names)
+            await self._touch(ProgramModel, ProgramModel.program_id, unchanged, report)
+            if reranked:
+                await self._touch(
+                    ProgramModel,
+                    ProgramModel.program_id,
+                    sorted(reranked),
+                    report,
+                    ranking=case(reranked, value=ProgramModel.program_id),
                 )
-                result_ott = await self.session.execute(stmt_ott)
-                ott_map = {row.name: row.ott_id for row in result_ott.all()}
+
+            # 3. ID 매핑 (crawling_id -> program_id, 새로 추가된 작품만 조회)
+            kino_id_map = {cid: r.program_id for cid, r in existing.items()}
+            new_ids = [cid for cid in kino_ids if cid not in kino_id_map]
+            if new_ids:
+                stmt_prog = select(
+                    ProgramModel.crawling_id, ProgramModel.program_id
+                ).where(ProgramModel.crawling_id.in_(new_ids))
+                result_prog = await self.session.execute(stmt_prog)
+                kino_id_map.update(
+                    {row.crawling_id: row.program_id for row in result_prog.all()}
+                )
+
+            # 4. OTT ID 매핑 (name -> ott_id, 시작 시 seed_otts에서 채운 참조 데이터)
+            ott_map = await ott_reference.ensure(self.session)
 
             # 5. Availability 데이터 준비
             avail_values = []
@@ -100,79 +193,388 @@ class Repository:
                     if not ott_id:
                         continue
 
-                    avail_values.append(
-                        {
-                            "program_id": program_id,
-                            "ott_id": ott_id,
-                            "url": avail.url,
-                            "release_date": avail.release_date,
-                            "expire_date": avail.expire_date,
-                        }
-                    )
+                    row = {
+                        "program_id": program_id,
+                        "ott_id": ott_id,
+                        "url": avail.url,
+                        "release_date": avail.release_date,
+                        "expire_date": avail.expire_date,
+                    }
+                    row["content_hash"] = _content_hash(row)
+                    avail_values.append(row)
 
-            # 6. Availability Bulk Upsert
+            # 6. 기존 Availability 해시 조회 후 바뀐 행만 Upsert
+            existing_avail = {}
             if avail_values:
-                stmt = mysql_insert(AvailabilityModel).values(avail_values)
-                update_dict = {
-                    "url": stmt.inserted.url,
-                    "release_date": stmt.inserted.release_date,
-                    "expire_date": stmt.inserted.expire_date,
-                    "updated_at": func.now(),
+                program_ids = {row["program_id"] for row in avail_values}
+                existing_avail = {
+                    (r.program_id, r.ott_id): r
+                    for r in (
+                        await self.session.execute(
+                            select(
+                                AvailabilityModel.availability_id,
+                                AvailabilityModel.program_id,
+                                AvailabilityModel.ott_id,
+                                AvailabilityModel.content_hash,
+                            ).where(AvailabilityModel.program_id.in_(program_ids))
+                        )
+                    ).all()
                 }
-                await self.session.execute(stmt.on_duplicate_key_update(update_dict))
-                await self.session.commit()
+            changed, unchanged = [], []
+            for row in avail_values:
+                old = existing_avail.get((row["program_id"], row["ott_id"]))
+                if old is None or old.content_hash != row["content_hash"]:
+                    changed.append(row)
+                else:
+                    unchanged.append(old.availability_id)
 
-            if self.logger:
-                self.logger.info(f"Saved {len(results)} items to database.")
+            stmt = mysql_insert(AvailabilityModel.__table__)
+            update_dict = {
+                "url": stmt.inserted.url,
+                "release_date": stmt.inserted.release_date,
+                "expire_date": stmt.inserted.expire_date,
+                "content_hash": stmt.inserted.content_hash,
+                "updated_at": stmt.inserted.updated_at,
+                "last_seen_at": stmt.inserted.last_seen_at,
+            }
+            changed.sort(key=lambda row: (row["program_id"], row["ott_id"]))
+            await self._upsert_chunks(
+                stmt.on_duplicate_key_update(update_dict),
+                changed,
+                report,
+                is_new=lambda row: (row["program_id"], row["ott_id"])
+                not in existing_avail,
+            )
+            await self._touch(
+                AvailabilityModel, AvailabilityModel.availability_id, unchanged, report
+            )
 
         except Exception as e:
             if self.logger:
                 self.logger.error("Failed to save crawl results", error=str(e))
             await self.session.rollback()
+            report.ok = False
+            return report
+
+        if self.logger:
+            self.logger.info(
+                f"Saved {len(results)} items to database.",
+                ok=report.ok,
+                unchanged=report.unchanged,
+                chunks=[c.as_dict() for c in report.chunks],
+            )
+        return report
+
+    async def _touch(self, model, key, ids: list[int], report: "SaveReport", **values):
+        """내용이 그대로인 행은 last_seen_at(과 순위 등 values)만 갱신 (updated_at은 유지)"""
+        table = model.__tablename__
+        report.unchanged[table] = report.unchanged.get(table, 0) + len(ids)
+        if not ids:
+            return
+        stmt = (
+            update(model)
+            .where(key.in_(ids))
+            .values(last_seen_at=func.now(), updated_at=model.updated_at, **values)
+        )
+        try:
+            with metrics.db(f"{table.lower()}_touch"):
+                await self._execute_chunk(stmt)
+        except Exception as e:
+            report.ok = False
+            if self.logger:
+                self.logger.error(
+                    "Failed to touch unchanged rows", table=table, error=str(e)
+                )
+            return
+        metrics.count("db_rows_touched_total", len(ids), table=table)
+
+    async def _upsert_chunks(
+        self,
+        stmt,
+        rows: list[dict],
+        report: "SaveReport",
+        is_new: Callable[[dict], bool],
+    ):
+        """
+        행을 크기 제한 묶음으로 나눠 저장 (실패한 묶음은 기록만 하고 다음 묶음 진행)
+
+        VALUES에 SQL 함수가 섞이면 드라이버가 executemany를 다중 VALUES 한 문장으로 바꾸지 못하므로
+        updated_at/last_seen_at도 묶음마다 같은 시각을 파라미터로 넘깁니다.
+        삽입/갱신 수는 영향 행 수(CLIENT_FLAGS에 따라 달라짐) 대신 미리 조회한 기존 키(is_new)로 셉니다.
+        """
+        table = stmt.table.name
+        for chunk, size in _chunk_rows(
+            rows, config.DB_CHUNK_BYTES, config.DB_CHUNK_ROWS
+        ):
+            now = datetime.now()
+            params = [{**row, "updated_at": now, "last_seen_at": now} for row in chunk]
+            try:
+                with metrics.db(f"{table.lower()}_upsert"):
+                    await self._execute_chunk(stmt, params)
+            except Exception as e:
+                report.ok = False
+                report.chunks.append(ChunkResult(table, len(chunk), size, failed=True))
+                if self.logger:
+                    self.logger.error(
+                        "Failed to upsert chunk",
+                        table=table,
+                        rows=len(chunk),
+                        error=str(e),
+                    )
+                continue
+
+            inserted = sum(1 for row in chunk if is_new(row))
+            report.chunks.append(
+                ChunkResult(
+                    table,
+                    len(chunk),
+                    size,
+                    inserted=inserted,
+                    updated=len(chunk) - inserted,
+                )
+            )
+            metrics.count("db_rows_written_total", len(chunk), table=table)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((Exception,)),
+        reraise=True,
+    )
+    async def _execute_chunk(self, stmt, params: list[dict] | None = None) -> int:
+        """문장 하나를 (params가 있으면 executemany로) 실행하고 커밋 (실패 시 롤백 후 재시도)"""
+        try:
+            result = await self.session.execute(stmt, params)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
+
+    async def load_freshness(self, kino_ids: list[int]) -> dict:
+        """
+        crawling_id별 마지막 상세 수집 시각(last_seen_at)과 공개/종료 예정 정보 보유 여부를 한 번에 조회
+        (증분 크롤링에서 방문 대상 선정용)
+        """
+        if not kino_ids:
+            return {}
+
+        last_seen_at = func.coalesce(ProgramModel.last_seen_at, ProgramModel.updated_at)
+        stmt = (
+            select(
+                ProgramModel.crawling_id,
+                last_seen_at.label("last_seen_at"),
+                func.max(
+                    case((AvailabilityModel.release_date.is_not(None), 1), else_=0)
+                ).label("has_release"),
+                func.max(
+                    case((AvailabilityModel.expire_date.is_not(None), 1), else_=0)
+                ).label("has_expire"),
+            )
+            .outerjoin(
+                AvailabilityModel,
+                AvailabilityModel.program_id == ProgramModel.program_id,
+            )
+            .where(ProgramModel.crawling_id.in_(kino_ids))
+            .group_by(ProgramModel.crawling_id, last_seen_at)
+        )
+        result = await self.session.execute(stmt)
+        return {row.crawling_id: row for row in result.all()}
+
+    async def mark_seen(self, kino_ids: list[int], listing: str | None = None):
+        """
+        방문을 생략한 작품의 Availability를 이번 배치에서 확인한 것으로 갱신
+        (cleanup_outdated_data에서 삭제되지 않도록)
+        """
+        if not kino_ids:
+            return
+
+        program_ids = select(ProgramModel.program_id).where(
+            ProgramModel.crawling_id.in_(kino_ids)
+        )
+        stmt = (
+            update(AvailabilityModel)
+            .where(AvailabilityModel.program_id.in_(program_ids))
+            .values(last_seen_at=func.now(), updated_at=AvailabilityModel.updated_at)
+        )
+        if listing == "upcoming":
+            stmt = stmt.where(AvailabilityModel.release_date.is_not(None))
+        elif listing == "expired":
+            stmt = stmt.where(AvailabilityModel.expire_date.is_not(None))
+
+        try:
+            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Failed to mark skipped items as seen", error=str(e))
+            await self.session.rollback()
+            raise
+
+    async def known_ids(self, kino_ids: list[int]) -> set[int]:
+        """DB에 이미 있는 작품의 crawling_id"""
+        if not kino_ids:
+            return set()
+        result = await self.session.execute(
+            select(ProgramModel.crawling_id).where(
+                ProgramModel.crawling_id.in_(kino_ids)
+            )
+        )
+        return set(result.scalars())
+
+    async def apply_rankings(self, rankings: dict[int, int]) -> list[int] | None:
+        """
+        랭킹 목록만으로 순위 갱신 (상세 페이지 방문 없음)
+
+        이미 있는 작품은 CASE 한 문장으로 순위를 바꾸고, 목록에서 빠진 작품의 순위는 비웁니다.
+        rankings: crawling_id -> 순위
+        DB에 없는 작품의 crawling_id를 순위 순으로 반환합니다. (실패하면 None)
+        """
+        if not rankings:
+            return []
+
+        try:
+            with metrics.db("rankings"):
+                known = await self.known_ids(list(rankings))
+                if known:
+                    # 순위는 내용 변경이 아니므로 updated_at 유지
+                    await self.session.execute(
+                        update(ProgramModel)
+                        .where(ProgramModel.crawling_id.in_(known))
+                        .values(
+                            ranking=case(
+                                {cid: rankings[cid] for cid in known},
+                                value=ProgramModel.crawling_id,
+                            ),
+                            updated_at=ProgramModel.updated_at,
+                        )
+                    )
+                cleared = await self.session.execute(
+                    update(ProgramModel)
+                    .where(ProgramModel.ranking.is_not(None))
+                    .where(ProgramModel.crawling_id.not_in(list(rankings)))
+                    .values(ranking=None, updated_at=ProgramModel.updated_at)
+                )
+                await self.session.commit()
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Failed to apply rankings", error=str(e))
+            await self.session.rollback()
+            return None
+
+        unknown = sorted(
+            (cid for cid in rankings if cid not in known), key=rankings.__getitem__
+        )
+        if self.logger:
+            self.logger.info(
+                "Rankings applied",
+                updated=len(known),
+                cleared=cleared.rowcount,
+                unknown=len(unknown),
+            )
+        return unknown
 
     async def cleanup_outdated_data(
         self,
         batch_start_time,
         cleanup_expiring: bool = False,
         cleanup_upcoming: bool = False,
-    ):
+    ) -> dict[str, int | None]:
+        """
+        이번 배치에서 확인되지 않은 공개/종료 예정 정보와 고아 Program 삭제
+
+        각 단계는 CLEANUP_BATCH_SIZE개씩 나눠 삭제하고 묶음마다 커밋해
+        잠금을 오래 잡지 않습니다. 단계별 삭제 행 수를 반환합니다. (실패한 단계는 None)
+        """
         if self.logger:
             self.logger.info("Starting cleanup of outdated data...")
 
-        try:
-            threshold_time = batch_start_time - timedelta(hours=12)
+        threshold_time = batch_start_time - timedelta(hours=12)
+        batch_size = config.CLEANUP_BATCH_SIZE
+        report: dict[str, int | None] = {}
 
+        with metrics.db("cleanup"):
             # 1. 공개 예정작 정보 삭제
             if cleanup_upcoming:
                 stmt_upcoming = (
-                    AvailabilityModel.__table__.delete()
+                    delete(AvailabilityModel)
+                    .where(AvailabilityModel.last_seen_at < threshold_time)
                     .where(AvailabilityModel.release_date.is_not(None))
-                    .where(AvailabilityModel.updated_at < threshold_time)
+                    .with_dialect_options(mysql_limit=batch_size)
+                )
+                report["upcoming"] = await self._delete_in_batches(
+                    "upcoming", stmt_upcoming, batch_size
                 )
-                await self.session.execute(stmt_upcoming)
 
             # 2. 종료 예정작 정보 삭제
             if cleanup_expiring:
                 stmt_expiring = (
-                    AvailabilityModel.__table__.delete()
+                    delete(AvailabilityModel)
+                    .where(AvailabilityModel.last_seen_at < threshold_time)
                     .where(AvailabilityModel.expire_date.is_not(None))
-                    .where(AvailabilityModel.updated_at < threshold_time)
+                    .with_dialect_options(mysql_limit=batch_size)
+                )
+                report["expiring"] = await self._delete_in_batches(
+                    "expiring", stmt_expiring, batch_size
                 )
-                await self.session.execute(stmt_expiring)
 
             # 3. 고아 데이터 삭제 (Availability가 없는 Program)
-            subq = select(AvailabilityModel.availability_id).where(
+            # 대상 ID를 먼저 나눠 조회하고, 그 사이 Availability가 생긴 작품은 삭제 시 다시 제외
+            has_availability = exists().where(
                 AvailabilityModel.program_id == ProgramModel.program_id
             )
-            stmt_orphaned = ProgramModel.__table__.delete().where(~exists(subq))
-            await self.session.execute(stmt_orphaned)
+            report["orphaned_programs"] = await self._delete_in_batches(
+                "orphaned_programs",
+                select(ProgramModel.program_id)
+                .where(~has_availability)
+                .limit(batch_size),
+                batch_size,
+                delete_by_id=lambda ids: delete(ProgramModel)
+                .where(ProgramModel.program_id.in_(ids))
+                .where(~has_availability),
+            )
 
-            await self.session.commit()
+        if self.logger:
+            self.logger.info("Cleanup finished", removed=report)
+        return report
 
-        except Exception as e:
-            if self.logger:
-                self.logger.error("Failed to cleanup outdated data", error=str(e))
-            await self.session.rollback()
+    async def _delete_in_batches(
+        self, step: str, stmt, batch_size: int, delete_by_id=None
+    ) -> int | None:
+        """
+        한 묶음씩 삭제하고 커밋 (삭제 수가 batch_size보다 적으면 종료)
+        delete_by_id가 있으면 stmt로 ID를 조회한 뒤 delete_by_id(ids)로 삭제
+        """
+        removed = 0
+        while True:
+            try:
+                if delete_by_id is None:
+                    count = (await self.session.execute(stmt)).rowcount
+                    fetched = count
+                else:
+                    ids = (await self.session.execute(stmt)).scalars().all()
+                    fetched = len(ids)
+                    count = 0
+                    if ids:
+                        result = await self.session.execute(delete_by_id(ids))
+                        count = result.rowcount
+                await self.session.commit()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        "Failed to cleanup outdated data",
+                        step=step,
+                        removed=removed,
+                        error=str(e),
+                    )
+                await self.session.rollback()
+                return None
+
+            removed += count
+            if fetched < batch_size:
+                return removed
+            # 묶음 사이에 다른 트랜잭션(백엔드 조회 등)이 끼어들 수 있도록 양보
+            await asyncio.sleep(0)
 
     async def log_statistics(self):
         try:
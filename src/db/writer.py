@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import Callable
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from models import KinoData
+from utils import config, metrics, RunCheckpoint
+from .repository import Repository
+
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    상세 수집 결과를 받아 작은 묶음(micro-batch) 단위로 DB에 저장하는 소비자
+
+    크롤러는 put()으로 KinoData를 넘기고, 큐가 가득 차면 저장이 따라올 때까지 대기합니다.
+    묶음은 WRITE_BATCH_SIZE개가 모이거나 WRITE_BATCH_MAX_AGE초가 지나면 저장됩니다.
+
+    결과는 kino_id 기준으로 여러 레인(lane)에 나눠 담기고, 레인마다 풀에서 따로 세션을 받아
+    동시에 저장합니다. 같은 작품은 항상 같은 레인에서 순서대로 저장되므로
+    같은 program_id에 대한 쓰기가 서로 다른 세션에서 겹치지 않습니다.
+
+    on_saved가 주어지면 저장에 성공한 묶음의 kino_id 목록을 넘겨 호출합니다.
+    (저장에 실패한 묶음은 넘기지 않음)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        batch_size: int | None = None,
+        max_age: float | None = None,
+        queue_size: int | None = None,
+        logger: structlog.stdlib.BoundLogger | None = None,
+        checkpoint: RunCheckpoint | None = None,
+        lanes: int | None = None,
+        on_saved: Callable[[list[int]], None] | None = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or config.WRITE_BATCH_SIZE
+        self.max_age = max_age or config.WRITE_BATCH_MAX_AGE
+        self.lanes = max(lanes or config.WRITE_LANES or config.DB_POOL_SIZE, 1)
+        # 전체 대기 수는 WRITE_QUEUE_SIZE 정도로 유지
+        lane_size = max((queue_size or config.WRITE_QUEUE_SIZE) // self.lanes, 1)
+        self.queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=lane_size) for _ in range(self.lanes)
+        ]
+        self.logger = logger
+        self.checkpoint = checkpoint
+        self.on_saved = on_saved
+        self.saved = 0
+        self.batches = 0
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        self._tasks = [asyncio.create_task(self._consume(q)) for q in self.queues]
+
+    async def put(self, data: KinoData):
+        await self.queues[data.program.kino_id % self.lanes].put(data)
+
+    async def close(self):
+        """남은 결과를 모두 저장하고 종료"""
+        if not self._tasks:
+            return
+        for queue in self.queues:
+            await queue.put(_STOP)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        if self.logger:
+            self.logger.info(
+                "Writer finished",
+                saved=self.saved,
+                batches=self.batches,
+                lanes=self.lanes,
+            )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _consume(self, queue: asyncio.Queue):
+        batch: list[KinoData] = []
+        deadline = None
+        while True:
+            timeout = max(deadline - time.monotonic(), 0) if batch else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self._flush(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                await self._flush(batch)
+                return
+
+            if not batch:
+                deadline = time.monotonic() + self.max_age
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+    async def _flush(self, batch: list[KinoData]):
+        if not batch:
+            return
+
+        # 같은 작품이 여러 크롤러에서 들어오면 한 번만 저장 (랭킹이 있는 쪽 우선)
+        merged: dict[int, KinoData] = {}
+        for data in batch:
+            kino_id = data.program.kino_id
+            if kino_id not in merged or data.program.ranking is not None:
+                merged[kino_id] = data
+
+        try:
+            with metrics.db("flush"):
+                async with self.session_factory() as session:
+                    repo = Repository(session, logger=self.logger)
+                    if not await repo.save_crawl_results(list(merged.values())):
+                        return
+            self.saved += len(merged)
+            self.batches += 1
+            if self.checkpoint:
+                # 재시작 시 건너뛸 수 있도록 저장이 끝난 ID 기록
+                self.checkpoint.record_saved(list(merged))
+            if self.on_saved:
+                self.on_saved(list(merged))
+        except Exception as e:
+            # 한 묶음 실패가 이후 저장을 막지 않도록 기록만 남김
+            if self.logger:
+                self.logger.error(
+                    "Failed to flush batch", size=len(merged), error=str(e)
+                )
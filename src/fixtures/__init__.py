@@ -0,0 +1,3 @@
+from .kino_server import KinoFixtureServer, FixtureCatalog
+
+__all__ = ["KinoFixtureServer", "FixtureCatalog"]
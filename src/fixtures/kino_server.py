@@ -0,0 +1,332 @@
+"""
+키노라이츠 로컬 대역(stand-in) 서버
+
+크롤러를 실제 사이트 없이 검증하기 위한 합성 목록/상세 페이지를 제공합니다.
+KINO_BASE_URL을 이 서버 주소로 지정하고 크롤러를 실행하면 됩니다.
+
+    python src/fixtures/kino_server.py --port 8000
+    KINO_BASE_URL=http://127.0.0.1:8000 python src/main.py
+"""
+
+import argparse
+import html
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+OTT_LABELS = ["넷플릭스", "티빙", "쿠팡플레이", "웨이브", "디즈니+", "왓챠"]
+GENRES = ["드라마", "영화", "애니메이션", "예능", "다큐멘터리"]
+
+STATIC_ASSETS = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".jpg": "image/jpeg",
+    ".woff2": "font/woff2",
+    ".mp4": "video/mp4",
+}
+
+# SPA 흉내: 상세 API 호출, 정액제 탭 클릭 시 OTT 목록 렌더링, 더보기 클릭 시 줄거리 확장
+APP_JS = """
+const match = location.pathname.match(/\\/title\\/(\\d+)/);
+if (match) fetch('/api/v1/titles/' + match[1]).then(r => r.json());
+document.addEventListener('click', (e) => {
+  if (e.target.closest('.price-tab')) {
+    const list = document.querySelector('.price-list');
+    list.innerHTML = document.getElementById('price-template').innerHTML;
+  }
+  if (e.target.closest('button.more')) {
+    const s = document.querySelector('div.synopsis');
+    s.textContent = s.dataset.full;
+    e.target.closest('button.more').hidden = true;
+  }
+});
+"""
+
+APP_CSS = """
+@font-face { font-family: Pretendard; src: url('/static/font.woff2'); }
+body { font-family: Pretendard, sans-serif; }
+.contents-wrap a, .ranking-item { display: block; height: 120px; }
+"""
+
+
+class FixtureCatalog:
+    """ID 기반으로 결정적인 합성 작품 데이터를 생성"""
+
+    def __init__(self, size: int = 60, start_id: int = 1000, seed: int = 42):
+        self.ids = [start_id + i for i in range(size)]
+        rng = random.Random(seed)
+        third = max(size // 3, 1)
+        # 목록 간 일부러 겹치도록 구성 (중복 제거 검증용)
+        self.upcoming = self.ids[: third * 2]
+        self.expired = self.ids[third:]
+        self.ranking = rng.sample(self.ids, min(size, 100))
+
+    def title(self, kino_id: int) -> dict:
+        rng = random.Random(kino_id)
+        base = date(2026, 1, 1) + timedelta(days=kino_id % 300)
+        otts = rng.sample(OTT_LABELS, rng.randint(1, 3))
+        kind = "공개예정일" if kino_id in self.upcoming else "종료예정일"
+        return {
+            "kino_id": kino_id,
+            "title": f"작품 {kino_id}",
+            "genre": rng.choice(GENRES),
+            "running_time": rng.randint(60, 180),
+            "synopsis": f"작품 {kino_id}의 줄거리입니다. " * rng.randint(2, 8),
+            "poster": f"/static/poster/{kino_id}.jpg",
+            "backdrop": f"/static/backdrop/{kino_id}.jpg",
+            "otts": [
+                {
+                    "name": label,
+                    "url": f"https://ott.example.com/{i}/{kino_id}",
+                    "date": f"{kind} : {base:%Y.%m.%d}",
+                }
+                for i, label in enumerate(otts)
+            ],
+        }
+
+
+def render_api(data: dict) -> str:
+    """상세 API 응답 (network 추출 모드의 API_FIELD_PATHS와 같은 형태)"""
+    otts = []
+    for o in data["otts"]:
+        kind, _, day = o["date"].partition(" : ")
+        iso = day.replace(".", "-")
+        otts.append(
+            {
+                "name": o["name"],
+                "url": o["url"],
+                "releaseDate": iso if kind == "공개예정일" else None,
+                "expireDate": iso if kind == "종료예정일" else None,
+            }
+        )
+    return json.dumps(
+        {
+            "data": {
+                "id": data["kino_id"],
+                "titleKr": data["title"],
+                "genres": [data["genre"]],
+                "runningTime": data["running_time"],
+                "synopsis": data["synopsis"],
+                "posterImage": data["poster"],
+                "backdropImage": data["backdrop"],
+                "providers": otts,
+            }
+        },
+        ensure_ascii=False,
+    )
+
+
+def render_listing(ids: list[int], ranking: bool = False) -> str:
+    if ranking:
+        items = "".join(
+            f'<div class="ranking-item"><span>{rank}</span>'
+            f'<a href="/title/{i}"><img src="/static/poster/{i}.jpg"></a></div>'
+            for rank, i in enumerate(ids, start=1)
+        )
+        body = f'<div class="content-ranking-list">{items}</div>'
+    else:
+        items = "".join(
+            f'<a href="/title/{i}"><img src="/static/poster/{i}.jpg"></a>' for i in ids
+        )
+        body = f'<div class="contents-wrap">{items}</div>'
+    return _document(body)
+
+
+def render_title(data: dict) -> str:
+    e = html.escape
+    price_items = "".join(
+        f'<div class="movie-price-item"><span class="name">\u200b{e(o["name"])}</span>'
+        f'<a href="https://link.example.com/out?url={e(o["url"])}">보기</a>'
+        f'<span class="date">{e(o["date"])}</span></div>'
+        for o in data["otts"]
+    )
+    body = f"""
+    <div class="backdrop"><div style="background-image: url('{data["backdrop"]}')"></div></div>
+    <div class="poster"><img src="{data["poster"]}"></div>
+    <h2 class="title-kr">{e(data["title"])}</h2>
+    <div class="metadata">
+      <div class="metadata__item"><span class="item__title">장르</span><span class="item__body">{e(data["genre"])}</span></div>
+      <div class="metadata__item"><span class="item__title">러닝타임</span><span class="item__body">{data["running_time"]}분</span></div>
+    </div>
+    <div class="synopsis" data-full="{e(data["synopsis"])}">{e(data["synopsis"][:20])}</div>
+    <button class="more">더보기</button>
+    <button class="price-tab">정액제</button>
+    <div class="price-list"></div>
+    <template id="price-template">{price_items}</template>
+    <video src="/static/trailer.mp4" autoplay muted></video>
+    """
+    return _document(body)
+
+
+def _document(body: str) -> str:
+    return (
+        '<!doctype html><html><head><meta charset="utf-8">'
+        '<link rel="stylesheet" href="/static/app.css">'
+        '<script src="/analytics/collect.js"></script>'
+        '<script src="/static/app.js" defer></script>'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+class KinoFixtureServer:
+    """
+    스레드에서 동작하는 로컬 HTTP 서버 (경로 종류별 요청 수 기록)
+
+    상세 페이지와 상세 API에는 지연(latency_ms ± jitter_ms)과
+    실패(failure_rate 비율로 503 응답)를 주입할 수 있습니다.
+    """
+
+    INJECTED = ("title", "api")
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        size: int = 60,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        failure_rate: float = 0,
+        seed: int = 42,
+    ):
+        self.catalog = FixtureCatalog(size=size)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.hits = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, kind: str):
+        with self._lock:
+            self.hits[kind] += 1
+
+    def inject(self, kind: str) -> bool:
+        """지연을 적용하고 이번 요청을 실패시킬지 반환"""
+        if kind not in self.INJECTED:
+            return False
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(-1, 1) * self.jitter_ms
+            failed = self._rng.random() < self.failure_rate
+            if failed:
+                self.hits["failed"] += 1
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return failed
+
+    def start(self) -> "KinoFixtureServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def route(self, path: str, query: dict) -> tuple[int, str, bytes]:
+        catalog = self.catalog
+        if path == "/new":
+            tab = query.get("tab", ["upcoming"])[0]
+            ids = catalog.expired if tab == "expired" else catalog.upcoming
+            self.record("listing")
+            return 200, "text/html; charset=utf-8", render_listing(ids).encode()
+        if path == "/ranking":
+            self.record("listing")
+            page = render_listing(catalog.ranking, ranking=True)
+            return 200, "text/html; charset=utf-8", page.encode()
+        if path.startswith("/title/"):
+            kino_id = int(path.rsplit("/", 1)[-1])
+            if kino_id not in catalog.ids:
+                return 404, "text/plain", b"not found"
+            self.record("title")
+            if self.inject("title"):
+                return 503, "text/plain", b"injected failure"
+            page = render_title(catalog.title(kino_id))
+            return 200, "text/html; charset=utf-8", page.encode()
+        if path.startswith("/api/v1/titles/"):
+            kino_id = int(path.rsplit("/", 1)[-1])
+            if kino_id not in catalog.ids:
+                return 404, "application/json", b"{}"
+            self.record("api")
+            if self.inject("api"):
+                return 503, "application/json", b"{}"
+            body = render_api(catalog.title(kino_id))
+            return 200, "application/json; charset=utf-8", body.encode()
+        if path == "/static/app.js":
+            self.record("script")
+            return 200, STATIC_ASSETS[".js"], APP_JS.encode()
+        if path == "/static/app.css":
+            self.record("stylesheet")
+            return 200, STATIC_ASSETS[".css"], APP_CSS.encode()
+        if path.startswith("/analytics/"):
+            self.record("analytics")
+            return 200, STATIC_ASSETS[".js"], b""
+        for ext, content_type in STATIC_ASSETS.items():
+            if path.endswith(ext):
+                self.record(ext.lstrip("."))
+                return 200, content_type, b"\0" * 2048
+        return 404, "text/plain", b"not found"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                status, content_type, body = server.route(
+                    parsed.path, parse_qs(parsed.query)
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="키노라이츠 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=60, help="합성 작품 수")
+    parser.add_argument("--latency", type=float, default=0, help="상세 응답 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="지연 편차(ms)")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0, help="상세 요청 실패 비율(0~1)"
+    )
+    args = parser.parse_args()
+
+    server = KinoFixtureServer(
+        args.host,
+        args.port,
+        args.size,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    print(f"Serving kinolights fixtures at {server.base_url}")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
@@ -1,53 +1,478 @@
+import argparse
 import asyncio
-from utils import get_logger, config
-from crawlers import UpcomingCrawler, ExpiredCrawler, RankingCrawler, Crawler
+import sys
 from datetime import datetime
-from db import init_db, AsyncSessionLocal, Repository, seed_otts, close_db
+from typing import TYPE_CHECKING
+from utils import get_logger, config, metrics, RunCheckpoint, SnapshotStore
+from models import OTTPlatform
+from db import (
+    init_db,
+    AsyncSessionLocal,
+    Repository,
+    BatchWriter,
+    JobQueue,
+    seed_otts,
+    close_db,
+)
 
+if TYPE_CHECKING:
+    from crawlers import BrowserPool
 
-async def main():
-    logger = get_logger(log_file_path=config.LOG_FILE_PATH, log_level=config.LOG_LEVEL)
-    logger.info("Application started.")
+# 목록 크롤러 이름 (--crawlers, DAEMON_SCHEDULES에서 사용)
+CRAWLER_NAMES = ("upcoming", "expired", "ranking")
+# crawl 명령의 실행 단계 (--stages)
+STAGES = ("crawl", "rankings", "cleanup", "stats")
+
+
+def crawler_classes() -> dict:
+    """이름 -> 크롤러 클래스 (Playwright는 크롤링할 때만 불러옴)"""
+    from crawlers import UpcomingCrawler, ExpiredCrawler, RankingCrawler
+
+    return {
+        "upcoming": UpcomingCrawler,
+        "expired": ExpiredCrawler,
+        "ranking": RankingCrawler,
+    }
+
+
+def write_metrics(logger, reset: bool = False):
+    """
+    지금까지의 단계별 소요 시간과 횟수를 파일로 내보내기
+
+    reset이면 내보낸 뒤 실행 단위 값을 비웁니다. (상주 실행의 daemon_* 값은 유지)
+    """
+    unknown = OTTPlatform.unknown_labels
+    if unknown:
+        metrics.count("ott_unknown_labels_total", sum(unknown.values()))
+        logger.warning("Unknown OTT platform labels", labels=dict(unknown))
+        # 상주 실행에서 다음 실행 때 같은 표기를 다시 세지 않도록 비움
+        unknown.clear()
+    metrics.finish_run()
+    try:
+        metrics.write(config.METRICS_PROM_PATH, config.METRICS_JSON_PATH)
+    except OSError as e:
+        logger.warning("Failed to write metrics", error=str(e))
+    if reset:
+        metrics.reset(keep=("daemon_",))
+
+
+async def finish(logger, export_metrics: bool = True):
+    """단계별 소요 시간을 내보내고 DB 연결 정리"""
+    if export_metrics:
+        write_metrics(logger)
+        logger.info("Application finished.", metrics=metrics.summary()["histograms"])
+    else:
+        logger.info("Application finished.")
+    await close_db()
 
-    batch_start_time = datetime.now()
 
+async def prepare(logger, seed: bool = True, force_schema: bool = False) -> bool:
+    """스키마 확인(지문이 같으면 생략)과 OTT 기본 데이터 준비"""
     try:
-        await init_db()
-        await seed_otts()
-        logger.info("Database initialized and OTT platforms seeded.")
+        applied = await init_db(force=force_schema)
+        if seed:
+            await seed_otts()
+        logger.info("Database ready", schema_applied=applied, seeded=seed)
     except Exception as e:
         logger.error("Failed to initialize database", error=str(e))
-        return
+        await close_db()
+        return False
+    return True
 
-    crawlers: list[Crawler] = [
-        UpcomingCrawler(logger=logger),
-        ExpiredCrawler(logger=logger),
-        RankingCrawler(logger=logger),
-    ]
 
-    cleanup_upcoming = any(isinstance(c, UpcomingCrawler) for c in crawlers)
-    cleanup_expiring = any(isinstance(c, ExpiredCrawler) for c in crawlers)
+async def cleanup_listings(
+    logger,
+    repo: Repository,
+    names: list[str],
+    crawled: list[str] | None = None,
+    batch_start_time: datetime | None = None,
+):
+    """
+    목록에서 빠진 공개/종료 예정 정보와 고아 작품 정리
+
+    목록(names) 중 수집에 성공한 것(crawled)만 batch_start_time 기준으로 정리합니다.
+    crawled가 없으면(수집 없이 정리만 할 때) 체크포인트에 기록된 마지막 정상 실행의
+    배치 시작 시각과 수집한 목록을 사용하고, 기록이 없으면 정리하지 않습니다.
+    """
+    if crawled is None and names:
+        recorded = (
+            RunCheckpoint(config.CHECKPOINT_PATH, logger=logger).last_finished()
+            if config.CHECKPOINT_PATH
+            else None
+        )
+        if recorded is None:
+            logger.error("No finished crawl run recorded, skipping cleanup")
+            return
+        batch_start_time, crawled = recorded
+        logger.info(
+            "Cleaning up against recorded run",
+            batch_start_time=batch_start_time.isoformat(),
+            crawled=crawled,
+        )
+    crawled = crawled or []
+    skipped = [name for name in names if name not in crawled]
+    if skipped:
+        logger.warning("Listings not crawled, skipping their cleanup", crawlers=skipped)
+    await repo.cleanup_outdated_data(
+        batch_start_time=batch_start_time or datetime.now(),
+        cleanup_upcoming="upcoming" in names and "upcoming" in crawled,
+        cleanup_expiring="expired" in names and "expired" in crawled,
+    )
+
+
+async def run_batch(
+    logger,
+    pool: "BrowserPool | None",
+    names: list[str],
+    snapshots: SnapshotStore | None = None,
+    resume: bool = False,
+    stages: tuple[str, ...] | list[str] = STAGES,
+    ranking_mode: str | None = None,
+):
+    """
+    목록 크롤러(names)를 한 번 실행하고 순위 초기화와 오래된 데이터 정리까지 진행
+
+    브라우저 풀과 DB 커넥션 풀은 호출한 쪽에서 유지합니다. (상주 실행에서 재사용)
+    stages에 없는 단계는 건너뜁니다. (crawl이 없으면 pool은 None이어도 됨)
+    crawl 없이 cleanup만 하면 마지막으로 기록된 실행을 기준으로 정리합니다. (cleanup_listings)
+    ranking_mode가 없으면 RANKING_MODE를 따릅니다.
+    """
+    batch_start_time = datetime.now()
+    crawlers = []
+    crawled = None
+    checkpoint = None
+    coordinator = None
+
+    if "crawl" in stages:
+        from crawlers import (
+            RankingCrawler,
+            ContentFrontier,
+            IncrementalFilter,
+            ShardedDetailCrawl,
+            CrawlCoordinator,
+        )
 
-    results = await asyncio.gather(*(crawler.run() for crawler in crawlers))
+        classes = crawler_classes()
+
+        # 중단된 실행을 이어가면 목록과 저장된 작품은 건너뛰고 배치 시작 시각도 그대로 사용
+        # (정리 단계가 중단 전에 저장한 데이터를 오래된 것으로 지우지 않도록)
+        if config.CHECKPOINT_PATH:
+            checkpoint = RunCheckpoint(config.CHECKPOINT_PATH, logger=logger)
+            batch_start_time = checkpoint.start(batch_start_time, resume=resume)
+
+        # 브라우저는 하나만 띄우고 크롤러별 컨텍스트로 격리
+        # 상세 페이지는 목록 간 중복 없이 한 번만 방문
+        frontier = ContentFrontier(logger=logger)
+        # 증분 모드: 최근에 수집한 작품은 상세 페이지 방문 생략
+        incremental = (
+            IncrementalFilter(AsyncSessionLocal, logger=logger)
+            if config.INCREMENTAL_MODE
+            else None
+        )
+        # 상세 수집 결과는 크롤링 도중 묶음 단위로 바로 저장
+        writer = BatchWriter(AsyncSessionLocal, logger=logger, checkpoint=checkpoint)
+        async with writer:
+            options = dict(
+                logger=logger,
+                pool=pool,
+                frontier=frontier,
+                sink=writer,
+                checkpoint=checkpoint,
+                snapshots=snapshots,
+            )
+            crawlers = [
+                (
+                    RankingCrawler(
+                        **options,
+                        fast=(ranking_mode or config.RANKING_MODE) == "fast",
+                        session_factory=AsyncSessionLocal,
+                    )
+                    if classes[name] is RankingCrawler
+                    else classes[name](**options, incremental=incremental)
+                )
+                for name in names
+            ]
+
+            if config.NODE_ROLE == "coordinator":
+                # 목록 ID를 작업 큐에 넣고 여러 작업 노드가 나눠 수집할 때까지 대기
+                queue = JobQueue(AsyncSessionLocal, logger=logger)
+                coordinator = CrawlCoordinator(
+                    queue, pool, AsyncSessionLocal, logger=logger
+                )
+                await coordinator.run(crawlers, batch_start_time)
+            elif config.SHARD_COUNT > 1:
+                # 목록은 이 프로세스에서, 상세 페이지는 여러 프로세스로 나눠 수집
+                listings = await asyncio.gather(*(c.list_ids() for c in crawlers))
+                await ShardedDetailCrawl(logger=logger).run(
+                    list(zip(crawlers, listings)), writer
+                )
+            else:
+                await asyncio.gather(*(crawler.run() for crawler in crawlers))
+
+        frontier.log_summary()
+        # 목록 수집에 실패한 크롤러의 데이터는 정리하지 않음
+        crawled = [name for name, c in zip(names, crawlers) if not c.failed]
 
     async with AsyncSessionLocal() as session:
         repo = Repository(session, logger=logger)
-        for crawler_result in results:
-            if crawler_result:
-                await repo.save_crawl_results(crawler_result)
-                logger.info(f"Saved {len(crawler_result)} items to database.")
-
-        await repo.cleanup_outdated_data(
-            batch_start_time=batch_start_time,
-            cleanup_upcoming=cleanup_upcoming,
-            cleanup_expiring=cleanup_expiring,
+
+        # 이번 랭킹 목록 순서로 순위를 반영하고 목록에서 빠진 작품의 순위 초기화
+        rankings = {
+            int(kino_id): index + 1
+            for c in crawlers
+            for index, kino_id in enumerate(getattr(c, "ranked_ids", ()))
+        }
+        if "rankings" in stages and rankings:
+            await repo.apply_rankings(rankings)
+
+        if "cleanup" in stages:
+            await cleanup_listings(logger, repo, names, crawled, batch_start_time)
+
+        if "stats" in stages:
+            await repo.log_statistics()
+
+    if coordinator:
+        await coordinator.finish()
+    if checkpoint:
+        checkpoint.finish(crawled)
+
+
+async def run_worker(logger):
+    """작업 노드: 목록/정리 없이 큐의 상세 페이지 작업만 처리"""
+    from crawlers import BrowserPool, JobWorker
+
+    async with BrowserPool(logger=logger) as pool:
+        queue = JobQueue(AsyncSessionLocal, logger=logger)
+        await JobWorker(queue, pool, AsyncSessionLocal, logger=logger).run()
+
+
+async def cmd_crawl(args, logger):
+    if not await prepare(logger):
+        return
+    if config.NODE_ROLE == "worker":
+        await run_worker(logger)
+        await finish(logger)
+        return
+
+    snapshots = SnapshotStore(config.SNAPSHOT_DIR) if config.SNAPSHOT_DIR else None
+    if "crawl" in args.stages:
+        from crawlers import BrowserPool
+
+        async with BrowserPool(logger=logger) as pool:
+            await run_batch(
+                logger,
+                pool,
+                args.crawlers,
+                snapshots,
+                args.resume,
+                args.stages,
+                args.ranking_mode,
+            )
+    else:
+        await run_batch(
+            logger, None, args.crawlers, snapshots, args.resume, args.stages
         )
+    await finish(logger, export_metrics="crawl" in args.stages)
 
-        await repo.log_statistics()
 
-    logger.info("Application finished.")
-    await close_db()
+async def cmd_daemon(args, logger):
+    """상주 실행: 브라우저와 DB 커넥션 풀을 유지한 채 크롤러별 주기로 반복"""
+    from crawlers import BrowserPool, CrawlDaemon, parse_schedules
+
+    try:
+        schedules = parse_schedules(config.DAEMON_SCHEDULES)
+        unknown = set(schedules) - set(CRAWLER_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown crawlers in schedule: {sorted(unknown)}")
+    except ValueError as e:
+        logger.error("Invalid DAEMON_SCHEDULES", error=str(e))
+        return
+
+    if not await prepare(logger):
+        return
+    snapshots = SnapshotStore(config.SNAPSHOT_DIR) if config.SNAPSHOT_DIR else None
+    resume = args.resume
+
+    async def scheduled(names: list[str]):
+        nonlocal resume
+        # 재시작으로 중단된 실행은 첫 실행에서만 이어감
+        try:
+            await run_batch(
+                logger,
+                pool,
+                names,
+                snapshots,
+                resume=resume,
+                ranking_mode=config.DAEMON_RANKING_MODE,
+            )
+        finally:
+            resume = False
+
+    async with BrowserPool(logger=logger) as pool:
+        await CrawlDaemon(
+            pool,
+            scheduled,
+            schedules,
+            logger=logger,
+            after_run=lambda: write_metrics(logger, reset=True),
+        ).run()
+    # 지표는 실행마다 내보냈으므로 종료 시 빈 값으로 덮어쓰지 않음
+    await finish(logger, export_metrics=False)
+
+
+async def cmd_worker(args, logger):
+    if not await prepare(logger):
+        return
+    await run_worker(logger)
+    await finish(logger)
+
+
+async def cmd_replay(args, logger):
+    """저장된 스냅샷만 다시 파싱해 저장 (브라우저 없음, 전체 목록이 아니므로 정리 생략)"""
+    if not config.SNAPSHOT_DIR:
+        logger.error("SNAPSHOT_DIR is not set, nothing to replay")
+        return
+    if not await prepare(logger):
+        return
+
+    from crawlers import SnapshotReplay
+
+    snapshots = SnapshotStore(config.SNAPSHOT_DIR)
+    async with BatchWriter(AsyncSessionLocal, logger=logger) as writer:
+        replay = SnapshotReplay(snapshots, writer, until=args.until, logger=logger)
+        await replay.run(args.keys or None)
+    async with AsyncSessionLocal() as session:
+        await Repository(session, logger=logger).log_statistics()
+    await finish(logger)
+
+
+async def cmd_cleanup(args, logger):
+    """마지막으로 기록된 실행 기준으로 오래된 공개/종료 예정 정보와 고아 작품 정리"""
+    if not await prepare(logger, seed=False):
+        return
+    names = [
+        name
+        for name, selected in (("upcoming", args.upcoming), ("expired", args.expiring))
+        if selected
+    ]
+    async with AsyncSessionLocal() as session:
+        await cleanup_listings(logger, Repository(session, logger=logger), names)
+    await finish(logger, export_metrics=False)
+
+
+async def cmd_stats(args, logger):
+    if not await prepare(logger, seed=False):
+        return
+    async with AsyncSessionLocal() as session:
+        await Repository(session, logger=logger).log_statistics()
+    await finish(logger, export_metrics=False)
+
+
+async def cmd_schema(args, logger):
+    """저장된 지문과 관계없이 스키마 생성/보강 후 지문 저장"""
+    if not await prepare(logger, force_schema=True):
+        return
+    await finish(logger, export_metrics=False)
+
+
+COMMANDS = {
+    "crawl": cmd_crawl,
+    "daemon": cmd_daemon,
+    "worker": cmd_worker,
+    "replay": cmd_replay,
+    "cleanup": cmd_cleanup,
+    "stats": cmd_stats,
+    "schema": cmd_schema,
+}
+
+
+async def main(args):
+    logger = get_logger(log_file_path=config.LOG_FILE_PATH, log_level=config.LOG_LEVEL)
+    logger.info("Application started.", command=args.command)
+    await COMMANDS[args.command](args, logger)
+
+
+def _names(allowed: tuple[str, ...]):
+    """쉼표로 구분한 이름 목록 (allowed 안에서만)"""
+
+    def parse(value: str) -> list[str]:
+        names = [v.strip() for v in value.split(",") if v.strip()]
+        if not names or any(name not in allowed for name in names):
+            raise argparse.ArgumentTypeError(f"choose from {','.join(allowed)}")
+        return names
+
+    return parse
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Kinolights OTT crawler")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    crawl = commands.add_parser(
+        "crawl", help="목록/상세 수집 후 순위 초기화와 정리 (기본 명령)"
+    )
+    crawl.add_argument(
+        "--crawlers",
+        type=_names(CRAWLER_NAMES),
+        default=list(CRAWLER_NAMES),
+        help=f"실행할 목록 크롤러 (쉼표 구분, 기본 {','.join(CRAWLER_NAMES)})",
+    )
+    crawl.add_argument(
+        "--stages",
+        type=_names(STAGES),
+        default=list(STAGES),
+        help=f"실행할 단계 (쉼표 구분, 기본 {','.join(STAGES)})",
+    )
+    crawl.add_argument(
+        "--ranking-mode",
+        choices=("full", "fast"),
+        default=None,
+        help="랭킹 수집 방식 (fast: 목록 순위만 반영하고 새 작품만 상세 수집, 기본 RANKING_MODE)",
+    )
+    crawl.add_argument(
+        "--resume", action="store_true", help="중단된 마지막 실행을 이어서 진행"
+    )
+
+    daemon = commands.add_parser(
+        "daemon",
+        help="브라우저와 DB 연결을 유지한 채 DAEMON_SCHEDULES 주기로 반복 실행",
+    )
+    daemon.add_argument(
+        "--resume", action="store_true", help="첫 실행에서 중단된 실행을 이어서 진행"
+    )
+
+    commands.add_parser("worker", help="작업 큐의 상세 페이지 작업만 처리")
+
+    replay = commands.add_parser(
+        "replay", help="SNAPSHOT_DIR의 스냅샷을 브라우저 없이 다시 파싱해 저장"
+    )
+    replay.add_argument("keys", nargs="*", help="재처리할 작품 ID (비우면 전체)")
+    replay.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        help="이 시각(ISO 형식) 이전의 마지막 스냅샷 사용",
+    )
+
+    cleanup = commands.add_parser(
+        "cleanup", help="오래된 공개/종료 예정 정보와 고아 작품만 정리"
+    )
+    cleanup.add_argument(
+        "--upcoming", action="store_true", help="공개 예정 정보도 정리"
+    )
+    cleanup.add_argument(
+        "--expiring", action="store_true", help="종료 예정 정보도 정리"
+    )
+
+    commands.add_parser("stats", help="DB 통계만 출력")
+    commands.add_parser(
+        "schema", help="저장된 지문과 관계없이 스키마 생성/보강 후 지문 저장"
+    )
+
+    # 명령 없이 실행하면 crawl (기존 cron의 `main.py`, `main.py --resume` 호환)
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv = ["crawl", *argv]
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parse_args(sys.argv[1:])))
@@ -1,3 +1,20 @@
+import re
+import unicodedata
+from collections import Counter
+from types import MappingProxyType
+
+# 페이지에 섞여 들어오는 폭 없는 문자 (ZWSP, ZWNJ, ZWJ, WORD JOINER, BOM)
+_INVISIBLE = re.compile("[\u200b-\u200d\u2060\ufeff]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_label(label: str) -> str:
+    """플랫폼 표기 비교용 정규화 (NFC, 폭 없는 문자/공백 제거, 대소문자 무시)"""
+    text = unicodedata.normalize("NFC", label)
+    text = _INVISIBLE.sub("", text)
+    return _SPACES.sub("", text).casefold()
+
+
 class OTTPlatformMeta(type):
     def __iter__(cls):
         for key in cls._DATA.keys():
@@ -58,6 +75,19 @@ class OTTPlatform(metaclass=OTTPlatformMeta):
         ),
     }
 
+    # 한글 이름과 키 외에 목록/API에서 보이는 다른 표기 (정규화 후 비교)
+    _ALIASES = {
+        "COUPANG_PLAY": ("Coupang Play",),
+        "DISNEY_PLUS": ("디즈니플러스", "디즈니 플러스", "Disney+"),
+        "U_PLUS_MOBILE_TV": ("U+모바일TV", "유플러스모바일tv"),
+        "AMAZON_PRIME_VIDEO": ("프라임 비디오", "Prime Video"),
+    }
+
+    # 정규화한 표기 -> 인스턴스 (모듈 로드 시 한 번 생성, 읽기 전용)
+    _BY_LABEL: MappingProxyType = MappingProxyType({})
+    # 알 수 없는 표기별 등장 횟수 (실행 종료 시 지표로 기록)
+    unknown_labels: Counter = Counter()
+
     def __init__(self, name, price, logo_url):
         self.name = name
         self.price = price
@@ -70,20 +100,29 @@ class OTTPlatform(metaclass=OTTPlatformMeta):
     def __repr__(self):
         return f"<OTTPlatform: {self.name}>"
 
+    def __reduce__(self):
+        # 프로세스 간 전달 후에도 같은 인스턴스로 복원
+        return (OTTPlatform.from_korean, (self.name,))
+
     @classmethod
     def from_korean(cls, name: str):
         if not name:
             return None
 
-        clean_name = name.replace("\u200b", "").strip()
+        instance = cls._BY_LABEL.get(normalize_label(name))
+        if instance is None:
+            cls.unknown_labels[name.strip()] += 1
+        return instance
 
-        for key in cls._DATA.keys():
-            instance = getattr(cls, key)
-            if instance.name == clean_name:
-                return instance
 
-        return None
+def _build_label_index() -> MappingProxyType:
+    index = {}
+    for key, (name, price, url) in OTTPlatform._DATA.items():
+        instance = OTTPlatform(name, price, url)
+        setattr(OTTPlatform, key, instance)
+        for label in (name, key, *OTTPlatform._ALIASES.get(key, ())):
+            index[normalize_label(label)] = instance
+    return MappingProxyType(index)
 
 
-for key, (name, price, url) in OTTPlatform._DATA.items():
-    setattr(OTTPlatform, key, OTTPlatform(name, price, url))
+OTTPlatform._BY_LABEL = _build_label_index()
@@ -1,4 +1,15 @@
 from .logger import get_logger
 from .config import Config, config
+from .checkpoint import RunCheckpoint
+from .snapshot_store import SnapshotStore
+from .metrics import Metrics, metrics
 
-__all__ = ["get_logger", "Config", "config"]
+__all__ = [
+    "get_logger",
+    "Config",
+    "config",
+    "RunCheckpoint",
+    "SnapshotStore",
+    "Metrics",
+    "metrics",
+]
@@ -0,0 +1,129 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+import structlog
+
+
+class RunCheckpoint:
+    """
+    실행 단위 체크포인트 (추가 전용 JSONL 파일)
+
+    한 줄에 이벤트 하나를 기록합니다.
+    - run_start: 배치 시작 시각
+    - listing: 크롤러별 목록 ID (목록 순서 유지)
+    - saved: DB 저장이 끝난 작품 ID
+    - run_end: 정리까지 끝난 정상 종료 (목록 수집에 성공한 크롤러 포함)
+
+    run_end 없이 끝난 실행은 resume으로 이어서 진행할 수 있습니다.
+    마지막 줄이 쓰다 만 상태여도 그 줄만 무시합니다.
+    """
+
+    def __init__(self, path: str, logger: structlog.stdlib.BoundLogger | None = None):
+        self.path = Path(path)
+        self.logger = logger
+        self.batch_start_time: datetime | None = None
+        self.listings: dict[str, list[str]] = {}
+        self.saved: set[str] = set()
+        self.resumed = False
+
+    def start(self, batch_start_time: datetime, resume: bool = False) -> datetime:
+        """
+        새 실행을 시작하거나 중단된 실행을 이어받고, 이번 실행의 배치 시작 시각 반환
+        """
+        if resume and self._load():
+            self.resumed = True
+            if self.logger:
+                self.logger.info(
+                    "Resuming interrupted run",
+                    batch_start_time=self.batch_start_time.isoformat(),
+                    listings={k: len(v) for k, v in self.listings.items()},
+                    saved=len(self.saved),
+                )
+            return self.batch_start_time
+
+        if resume and self.logger:
+            self.logger.info("No interrupted run to resume, starting fresh")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+        self.batch_start_time = batch_start_time
+        self.listings, self.saved = {}, set()
+        self._append(event="run_start", batch_start_time=batch_start_time.isoformat())
+        return batch_start_time
+
+    def listing(self, crawler: str) -> list[str] | None:
+        """이전 실행에서 기록한 목록 (없으면 None)"""
+        return self.listings.get(crawler)
+
+    def record_listing(self, crawler: str, ids: list[str]):
+        self.listings[crawler] = list(ids)
+        self._append(event="listing", crawler=crawler, ids=list(ids))
+
+    def record_saved(self, ids: list[str]):
+        ids = [str(i) for i in ids if str(i) not in self.saved]
+        if not ids:
+            return
+        self.saved.update(ids)
+        self._append(event="saved", ids=ids)
+
+    def finish(self, crawled: list[str] | None = None):
+        """정상 종료 기록 (crawled: 목록 수집에 성공한 크롤러, 정리만 실행할 때 기준으로 사용)"""
+        self._append(event="run_end", crawled=list(crawled or ()))
+
+    def last_finished(self) -> tuple[datetime, list[str]] | None:
+        """마지막으로 정상 종료된 실행의 (배치 시작 시각, 목록 수집에 성공한 크롤러)"""
+        if not self.path.exists():
+            return None
+        started, finished = None, None
+        for event in self._events(self.path.read_text(encoding="utf-8")):
+            kind = event.get("event")
+            if kind == "run_start":
+                started = datetime.fromisoformat(event["batch_start_time"])
+            elif kind == "run_end" and started is not None:
+                finished = (started, event.get("crawled", []))
+        return finished
+
+    def _append(self, **event):
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load(self) -> bool:
+        """마지막 실행이 정상 종료되지 않았으면 상태를 복원하고 True"""
+        if not self.path.exists():
+            return False
+
+        text = self.path.read_text(encoding="utf-8")
+        if text and not text.endswith("\n"):
+            # 기록 도중 중단된 마지막 줄은 버리고 다음 이벤트가 새 줄에서 시작되도록 정리
+            text = text[: text.rfind("\n") + 1]
+            self.path.write_text(text, encoding="utf-8")
+
+        batch_start_time, listings, saved = None, {}, set()
+        for event in self._events(text):
+            kind = event.get("event")
+            if kind == "run_start":
+                batch_start_time = datetime.fromisoformat(event["batch_start_time"])
+                listings, saved = {}, set()
+            elif kind == "listing":
+                listings[event["crawler"]] = event["ids"]
+            elif kind == "saved":
+                saved.update(event["ids"])
+            elif kind == "run_end":
+                batch_start_time = None
+
+        if batch_start_time is None:
+            return False
+        self.batch_start_time = batch_start_time
+        self.listings, self.saved = listings, saved
+        return True
+
+    @staticmethod
+    def _events(text: str):
+        for line in text.splitlines():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
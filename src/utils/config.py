@@ -6,6 +6,10 @@ root = Path(__file__).parent.parent.parent
 load_dotenv(dotenv_path=root / ".env", verbose=True)
 
 
+def _csv(name: str, default: str) -> list[str]:
+    return [v.strip() for v in os.getenv(name, default).split(",") if v.strip()]
+
+
 class Config:
     # Database Configuration
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
@@ -22,12 +26,95 @@ class Config:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE_PATH: str = os.getenv("LOG_FILE_PATH", "logs/app.log")
 
+    # Metrics Configuration (실행 종료 시 단계별 소요 시간 기록, 비우면 생략)
+    METRICS_PROM_PATH: str = os.getenv("METRICS_PROM_PATH", "logs/crawler.prom")
+    METRICS_JSON_PATH: str = os.getenv("METRICS_JSON_PATH", "logs/metrics.json")
+
+    # Checkpoint Configuration (비우면 체크포인트 기록 안 함)
+    CHECKPOINT_PATH: str = os.getenv("CHECKPOINT_PATH", "logs/checkpoint.jsonl")
+
+    # Snapshot Configuration (비우면 스냅샷 저장 안 함)
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "")
+
     # Crawler Configuration
     HEADLESS_MODE: bool = os.getenv("HEADLESS_MODE", "true").lower() == "true"
     BROWSER_TIMEOUT: int = int(os.getenv("BROWSER_TIMEOUT", "30000"))
-    ACTION_DELAY: int = int(os.getenv("ACTION_DELAY", "300"))
+    ACTION_TIMEOUT: int = int(os.getenv("ACTION_TIMEOUT", "3000"))
+    # 목록 최대 스크롤 횟수 (0=무제한, 새 항목이 더 늘지 않을 때까지 스크롤)
     SCROLL_LIMIT: int = int(os.getenv("SCROLL_LIMIT", "100"))
+    SCROLL_GROWTH_TIMEOUT: int = int(os.getenv("SCROLL_GROWTH_TIMEOUT", "3000"))
     MAX_TABS: int = int(os.getenv("MAX_TABS", "5"))
+    PAGE_RECYCLE_AFTER: int = int(os.getenv("PAGE_RECYCLE_AFTER", "50"))
+    MIN_TABS: int = int(os.getenv("MIN_TABS", "1"))
+    INITIAL_TABS: int = int(os.getenv("INITIAL_TABS", "0"))
+    TARGET_LATENCY_MS: int = int(os.getenv("TARGET_LATENCY_MS", "8000"))
+    HOST_RATE_LIMIT: float = float(os.getenv("HOST_RATE_LIMIT", "0"))
+    HOST_BURST: int = int(os.getenv("HOST_BURST", "5"))
+    KINO_BASE_URL: str = os.getenv("KINO_BASE_URL", "https://m.kinolights.com")
+    RANKING_SIZE: int = int(os.getenv("RANKING_SIZE", "100"))
+    # full: 랭킹 작품 상세 페이지 모두 수집, fast: 목록 순위만 DB에 반영하고 새 작품만 상세 수집
+    RANKING_MODE: str = os.getenv("RANKING_MODE", "full").lower()
+    # dom: 상세 페이지 DOM 파싱, network: 상세 API 응답(JSON) 캡처 후 실패 시 DOM
+    EXTRACTION_MODE: str = os.getenv("EXTRACTION_MODE", "dom").lower()
+    TITLE_API_PATTERN: str = os.getenv("TITLE_API_PATTERN", r"/api/v1/titles/{id}\b")
+    NETWORK_CAPTURE_TIMEOUT: int = int(os.getenv("NETWORK_CAPTURE_TIMEOUT", "5000"))
+
+    # Sharding Configuration
+    SHARD_COUNT: int = int(os.getenv("SHARD_COUNT", "0"))
+    SHARD_MAX_TABS: int = int(os.getenv("SHARD_MAX_TABS", "0"))
+
+    # Distributed Configuration
+    # standalone: 단독 실행, coordinator: 목록 수집 후 작업 큐 분배, worker: 큐 작업만 처리
+    NODE_ROLE: str = os.getenv("NODE_ROLE", "standalone").lower()
+    NODE_ID: str = os.getenv("NODE_ID", "")
+    JOB_BATCH_SIZE: int = int(os.getenv("JOB_BATCH_SIZE", "20"))
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_POLL_INTERVAL: float = float(os.getenv("JOB_POLL_INTERVAL", "5"))
+    WORKER_IDLE_EXIT: float = float(os.getenv("WORKER_IDLE_EXIT", "300"))
+    COORDINATOR_WORKS: bool = os.getenv("COORDINATOR_WORKS", "true").lower() == "true"
+
+    # Daemon Configuration
+    # 크롤러별 실행 주기 (이름=주기, 단위 s/m/h/d)
+    DAEMON_SCHEDULES: str = os.getenv(
+        "DAEMON_SCHEDULES", "ranking=1h,upcoming=1d,expired=1d"
+    )
+    # 상주 실행에서 랭킹 크롤러의 RANKING_MODE
+    DAEMON_RANKING_MODE: str = os.getenv("DAEMON_RANKING_MODE", "fast").lower()
+    # 실행 사이 드라이버+브라우저 RSS가 이 값(MB)을 넘으면 브라우저 재시작 (0=사용 안 함)
+    BROWSER_RECYCLE_RSS_MB: float = float(os.getenv("BROWSER_RECYCLE_RSS_MB", "1500"))
+
+    # DB Write Configuration
+    WRITE_BATCH_SIZE: int = int(os.getenv("WRITE_BATCH_SIZE", "50"))
+    WRITE_BATCH_MAX_AGE: float = float(os.getenv("WRITE_BATCH_MAX_AGE", "5"))
+    WRITE_QUEUE_SIZE: int = int(os.getenv("WRITE_QUEUE_SIZE", "200"))
+    # 한 번의 upsert 문에 담을 최대 바이트/행 수 (max_allowed_packet보다 작게)
+    DB_CHUNK_BYTES: int = int(os.getenv("DB_CHUNK_BYTES", str(1024 * 1024)))
+    DB_CHUNK_ROWS: int = int(os.getenv("DB_CHUNK_ROWS", "500"))
+    # 커넥션 풀 크기 / 풀을 넘어 잠시 더 열 수 있는 연결 수
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    # 동시에 저장하는 세션(레인) 수 (0이면 DB_POOL_SIZE)
+    WRITE_LANES: int = int(os.getenv("WRITE_LANES", "0"))
+    # 정리 단계에서 한 번에 삭제하고 커밋할 최대 행 수
+    CLEANUP_BATCH_SIZE: int = int(os.getenv("CLEANUP_BATCH_SIZE", "1000"))
+
+    # Incremental Crawl Configuration
+    INCREMENTAL_MODE: bool = os.getenv("INCREMENTAL_MODE", "false").lower() == "true"
+    FRESHNESS_TTL_HOURS: int = int(os.getenv("FRESHNESS_TTL_HOURS", "72"))
+
+    # Browser Profile Configuration
+    LEAN_BROWSER: bool = os.getenv("LEAN_BROWSER", "true").lower() == "true"
+    BLOCK_RESOURCES: bool = os.getenv("BLOCK_RESOURCES", "true").lower() == "true"
+    BLOCKED_RESOURCE_TYPES: list[str] = _csv(
+        "BLOCKED_RESOURCE_TYPES", "image,media,font"
+    )
+    BLOCKED_URL_PATTERNS: list[str] = _csv(
+        "BLOCKED_URL_PATTERNS",
+        r"google-analytics\.com,googletagmanager\.com,doubleclick\.net,"
+        r"facebook\.(net|com),criteo\.,adservice\.,/analytics/",
+    )
+    ALLOWED_URL_PATTERNS: list[str] = _csv("ALLOWED_URL_PATTERNS", r"kinolights\.com")
 
 
 config = Config()
@@ -0,0 +1,203 @@
+import json
+import math
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+# 초 단위 버킷 (탭 클릭 수 ms부터 전체 단계 수 분까지)
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    math.inf,
+)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (관측값 하나당 이분 탐색 한 번)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "min", "max")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """버킷 안에서 선형 보간한 근사 분위수"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen, lower = 0, 0.0
+        for bound, n in zip(self.buckets, self.counts):
+            if n and seen + n >= rank:
+                upper = min(bound, self.max)
+                lower = max(lower, self.min)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = bound
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "mean": round(self.sum / self.count, 4) if self.count else 0.0,
+            "min": round(self.min, 4) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.max, 4),
+        }
+
+
+def _labels(labels: tuple[tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metrics:
+    """
+    실행 중 단계별 소요 시간과 횟수를 메모리에 모으는 수집기
+
+    실행이 끝나면 Prometheus textfile(node_exporter textfile collector용)과
+    JSON 요약으로 내보냅니다. 상주 실행에서는 실행마다 finish_run()으로 종료 시각을 남기고
+    내보낸 뒤 reset()으로 실행 단위 값을 비웁니다.
+    """
+
+    def __init__(self):
+        self.histograms: dict[tuple[str, tuple], Histogram] = {}
+        self.counters: dict[tuple[str, tuple], float] = {}
+        self.started = time.time()
+        self.finished: float | None = None
+
+    def finish_run(self):
+        """실행 종료 시각 기록 (crawler_last_run_timestamp_seconds)"""
+        self.finished = time.time()
+
+    def reset(self, keep: tuple[str, ...] = ()):
+        """keep 접두사로 시작하는 프로세스 단위 값만 남기고 비움"""
+        self.histograms = {
+            k: h for k, h in self.histograms.items() if k[0].startswith(keep)
+        }
+        self.counters = {
+            k: v for k, v in self.counters.items() if k[0].startswith(keep)
+        }
+        self.started = time.time()
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """블록 실행 시간을 초 단위로 기록 (async 함수 안에서도 await 구간 포함)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def stage(self, stage: str):
+        """크롤링 단계 소요 시간 (브라우저 실행, 이동, 대기, 추출 등)"""
+        return self.timer("crawler_stage_seconds", stage=stage)
+
+    def db(self, operation: str):
+        """DB 작업 소요 시간 (upsert, 정리 등)"""
+        return self.timer("db_operation_seconds", operation=operation)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for name in sorted({n for n, _ in self.histograms}):
+            lines.append(f"# TYPE {name} histogram")
+            for (n, labels), h in sorted(self.histograms.items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, c in zip(h.buckets, h.counts):
+                    cumulative += c
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    bucket = _labels(labels, f'le="{le}"')
+                    lines.append(f"{name}_bucket{bucket} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {h.sum}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+        for name in sorted({n for n, _ in self.counters}):
+            lines.append(f"# TYPE {name} counter")
+            for (n, labels), value in sorted(self.counters.items()):
+                if n == name:
+                    lines.append(f"{name}{_labels(labels)} {value}")
+        if self.finished is not None:
+            lines.append("# TYPE crawler_last_run_timestamp_seconds gauge")
+            lines.append(f"crawler_last_run_timestamp_seconds {self.finished}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        def key(name, labels):
+            return name + _labels(labels)
+
+        return {
+            "started_at": self.started,
+            "finished_at": self.finished,
+            "duration_s": round((self.finished or time.time()) - self.started, 3),
+            "histograms": {
+                key(n, labels): h.summary()
+                for (n, labels), h in sorted(self.histograms.items())
+            },
+            "counters": {
+                key(n, labels): v for (n, labels), v in sorted(self.counters.items())
+            },
+        }
+
+    def write(self, prometheus_path: str = "", json_path: str = ""):
+        if prometheus_path:
+            _write_atomic(Path(prometheus_path), self.to_prometheus())
+        if json_path:
+            _write_atomic(
+                Path(json_path),
+                json.dumps(self.summary(), ensure_ascii=False, indent=2) + "\n",
+            )
+
+
+def _write_atomic(path: Path, text: str):
+    # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# 프로세스 안의 모든 크롤러와 저장 단계가 공유
+metrics = Metrics()
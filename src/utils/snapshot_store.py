@@ -0,0 +1,76 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+
+class SnapshotStore:
+    """
+    추출 결과(payload)를 압축해 저장하는 내용 주소 기반(content-addressed) 저장소
+
+    root/
+      blobs/ab/abcdef....json.gz   payload 본문 (sha256, 같은 내용은 한 번만 저장)
+      index/<key>.jsonl            key별 스냅샷 기록 (시각, 종류, 해시)
+
+    key는 작품 ID(kino_id) 또는 "listing-<크롤러 이름>"입니다.
+    """
+
+    def __init__(self, root: str, compresslevel: int = 6):
+        self.root = Path(root)
+        self.compresslevel = compresslevel
+        self.blobs = self.root / "blobs"
+        self.index = self.root / "index"
+
+    def save(self, key: str, kind: str, payload) -> str:
+        """payload 저장 후 해시 반환 (kind: dom / api / listing)"""
+        body = json.dumps(
+            payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 동시에 같은 내용을 쓰더라도 완성된 파일만 보이도록 임시 파일 후 교체
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(gzip.compress(body, self.compresslevel))
+            os.replace(tmp, path)
+
+        self.index.mkdir(parents=True, exist_ok=True)
+        entry = {"ts": datetime.now().isoformat(), "kind": kind, "hash": digest}
+        with (self.index / f"{key}.jsonl").open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return digest
+
+    def load(self, digest: str):
+        return json.loads(gzip.decompress(self._blob_path(digest).read_bytes()))
+
+    def history(self, key: str) -> list[dict]:
+        """key의 스냅샷 기록 (오래된 순)"""
+        path = self.index / f"{key}.jsonl"
+        if not path.exists():
+            return []
+        entries = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return entries
+
+    def latest(self, key: str, until: datetime | None = None) -> dict | None:
+        """key의 마지막 스냅샷 기록 (until이 있으면 그 시각 이전 것 중에서)"""
+        entries = self.history(key)
+        if until is not None:
+            entries = [e for e in entries if datetime.fromisoformat(e["ts"]) <= until]
+        return entries[-1] if entries else None
+
+    def keys(self) -> list[str]:
+        if not self.index.exists():
+            return []
+        return sorted(p.stem for p in self.index.glob("*.jsonl"))
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs / digest[:2] / f"{digest}.json.gz"
@@ -8,9 +8,9 @@ echo "Current time: $(date)"
 # Cron 서비스 시작
 service cron start
 
-# 컨테이너 시작 시 1회 즉시 실행 (테스트용)
+# 컨테이너 시작 시 1회 즉시 실행 (재시작으로 중단된 실행이 있으면 이어서 진행)
 echo "Running crawler immediately..."
-/usr/local/bin/python /app/src/main.py
+/usr/local/bin/python /app/src/main.py crawl --resume
 
 # Cron 로그를 실시간으로 출력 (컨테이너가 종료되지 않도록)
 tail -f /var/log/cron.log
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 애플리케이션은 src를 작업 디렉터리로 실행하므로 테스트도 같은 import 경로 사용
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
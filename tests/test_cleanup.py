@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+import structlog
+import main
+from utils import config, RunCheckpoint
+
+
+class FakeRepository:
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    async def cleanup_outdated_data(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def cleanup(names, crawled=None, batch_start_time=None) -> list[dict]:
+    repo = FakeRepository()
+    asyncio.run(
+        main.cleanup_listings(
+            structlog.get_logger(), repo, names, crawled, batch_start_time
+        )
+    )
+    return repo.calls
+
+
+def test_cleans_only_listings_crawled_in_the_same_run():
+    started = datetime(2026, 10, 1, 3, 0)
+    [call] = cleanup(["upcoming", "expired"], ["upcoming"], started)
+    assert call == {
+        "batch_start_time": started,
+        "cleanup_upcoming": True,
+        "cleanup_expiring": False,
+    }
+
+
+def test_cleanup_without_crawl_refuses_when_no_run_is_recorded(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "CHECKPOINT_PATH", str(tmp_path / "checkpoint.jsonl"))
+    assert cleanup(["upcoming", "expired"]) == []
+
+    # 정상 종료되지 않은 실행도 기준으로 쓰지 않음
+    RunCheckpoint(config.CHECKPOINT_PATH).start(datetime(2026, 10, 1, 3, 0))
+    assert cleanup(["upcoming", "expired"]) == []
+
+
+def test_cleanup_without_crawl_uses_recorded_run(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "CHECKPOINT_PATH", str(tmp_path / "checkpoint.jsonl"))
+    started = datetime(2026, 10, 1, 3, 0)
+    checkpoint = RunCheckpoint(config.CHECKPOINT_PATH)
+    checkpoint.start(started)
+    checkpoint.finish(["expired", "ranking"])
+
+    [call] = cleanup(["upcoming", "expired"])
+    assert call == {
+        "batch_start_time": started,
+        "cleanup_upcoming": False,
+        "cleanup_expiring": True,
+    }
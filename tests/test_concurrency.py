@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+import structlog
+from crawlers.concurrency import AdaptiveLimiter
+from crawlers.kino import KinoCrawler
+
+
+class FakePage:
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def goto(self, url: str):
+        await asyncio.sleep(0)
+
+    async def close(self):
+        if not self.closed:
+            self.closed = True
+            self.context.open -= 1
+
+
+class FakeContext:
+    """모든 크롤러의 열린 탭 수를 함께 셈"""
+
+    def __init__(self, tabs: dict):
+        self.tabs = tabs
+
+    @property
+    def open(self) -> int:
+        return self.tabs["open"]
+
+    @open.setter
+    def open(self, value: int):
+        self.tabs["open"] = value
+        self.tabs["peak"] = max(self.tabs["peak"], value)
+
+    async def new_page(self) -> FakePage:
+        self.open += 1
+        return FakePage(self)
+
+
+def crawler(name: str, limiter: AdaptiveLimiter, tabs: dict) -> KinoCrawler:
+    c = KinoCrawler(
+        url="",
+        name=name,
+        logger=structlog.get_logger(),
+        pool=SimpleNamespace(tab_slots=limiter),
+    )
+    c.context = FakeContext(tabs)
+
+    async def parse(content_id, page):
+        await asyncio.sleep(0.001)
+        return None
+
+    c._parse_single_content = parse
+    return c
+
+
+def test_crawlers_sharing_a_pool_stay_within_the_tab_budget():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=2, target_latency=60000)
+    tabs = {"open": 0, "peak": 0}
+    crawlers = [crawler(name, limiter, tabs) for name in ("a", "b", "c")]
+    ids = [str(i) for i in range(20)]
+
+    async def run():
+        await asyncio.gather(*(c._crawl_details(ids) for c in crawlers))
+
+    asyncio.run(run())
+    assert tabs["peak"] <= 2
+    assert tabs["open"] == 0
+    assert limiter.in_flight == 0 and limiter.parked == 0
+
+
+def test_parked_tab_gives_up_its_place_when_the_limit_shrinks():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=2, target_latency=60000)
+
+    async def run():
+        async with limiter.slot():
+            pass
+        assert limiter.park()
+        async with limiter.slot():
+            # 다른 작업자가 탭을 쓰는 동안 한도가 줄면 열어 둔 탭은 자리를 반납해야 함
+            limiter.limit = 1.0
+            assert not limiter.reuse()
+            assert limiter.parked == 0
+            assert not limiter.park()
+
+    asyncio.run(run())
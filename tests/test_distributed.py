@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import asynccontextmanager
+import structlog
+from crawlers import distributed
+from crawlers.distributed import JobWorker
+from db import writer as writer_module
+from db.job_queue import Job
+from models import KinoData, Program
+from utils import config
+
+
+class FakeQueue:
+    lease_seconds = 60
+
+    def __init__(self, jobs: list[Job]):
+        self.pending = list(jobs)
+        self.completed: list[int] = []
+        self.released: list[int] = []
+
+    async def lease(self, owner: str, limit: int) -> list[Job]:
+        jobs, self.pending = self.pending[:limit], self.pending[limit:]
+        return jobs
+
+    async def complete(self, owner: str, job_ids: list[int]) -> int:
+        self.completed += job_ids
+        return len(job_ids)
+
+    async def release(self, owner: str, job_ids: list[int]) -> int:
+        self.released += job_ids
+        return len(job_ids)
+
+    async def heartbeat(self, owner: str, job_ids: list[int]) -> int:
+        return len(job_ids)
+
+
+class FakeRepository:
+    """FAILING에 든 작품이 포함된 묶음은 저장 실패"""
+
+    FAILING = {102}
+    saved: list[int] = []
+
+    def __init__(self, session, logger=None):
+        pass
+
+    async def save_crawl_results(self, results):
+        ids = [data.program.kino_id for data in results]
+        if self.FAILING & set(ids):
+            raise RuntimeError("flush failed")
+        FakeRepository.saved += ids
+        return True
+
+
+class FakeCrawler:
+    """103번은 결과를 얻지 못한 것으로 처리"""
+
+    def __init__(self, sink, **kwargs):
+        self.sink = sink
+
+    async def run_details(self, ids: list[str]):
+        for content_id in ids:
+            if content_id != "103":
+                program = Program(int(content_id), f"작품 {content_id}", "", "", "")
+                await self.sink.put(KinoData(program))
+        return []
+
+
+@asynccontextmanager
+async def fake_session():
+    yield None
+
+
+def test_completes_only_jobs_the_writer_saved(monkeypatch):
+    monkeypatch.setattr(config, "WRITE_BATCH_SIZE", 1)
+    monkeypatch.setattr(writer_module, "Repository", FakeRepository)
+    monkeypatch.setattr(distributed, "KinoCrawler", FakeCrawler)
+    FakeRepository.saved = []
+
+    queue = FakeQueue(
+        [Job(1, "run", 101, None), Job(2, "run", 102, None), Job(3, "run", 103, 1)]
+    )
+    worker = JobWorker(
+        queue,
+        None,
+        fake_session,
+        poll_interval=0.01,
+        idle_exit=0.01,
+        logger=structlog.get_logger(),
+    )
+
+    assert asyncio.run(worker.run()) == 1
+
+    assert FakeRepository.saved == [101]
+    assert queue.completed == [1]
+    assert sorted(queue.released) == [2, 3]
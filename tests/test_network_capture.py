@@ -0,0 +1,83 @@
+import asyncio
+import json
+from datetime import date
+from crawlers.network_capture import TitleResponseCapture, parse_api_payload
+from fixtures.kino_server import FixtureCatalog, render_api
+
+
+def fixture_payload(kino_id: int = 1000) -> dict:
+    catalog = FixtureCatalog(size=30)
+    return json.loads(render_api(catalog.title(kino_id)))
+
+
+def test_parses_fixture_api_payload():
+    payload = fixture_payload(1000)
+    data = parse_api_payload("1000", payload)
+
+    item = payload["data"]
+    assert data.program.kino_id == 1000
+    assert data.program.title == item["titleKr"]
+    assert data.program.genre == item["genres"][0]
+    assert data.program.running_time == item["runningTime"]
+    assert data.program.ranking is None
+    assert len(data.availabilities) == len(item["providers"])
+    for availability, provider in zip(data.availabilities, item["providers"]):
+        assert availability.ott_name is not None
+        assert availability.url == provider["url"]
+        expected = provider["releaseDate"] or provider["expireDate"]
+        assert date.fromisoformat(expected) in (
+            availability.release_date,
+            availability.expire_date,
+        )
+
+
+def test_running_time_string_is_parsed_defensively():
+    payload = fixture_payload()
+    payload["data"]["runningTime"] = "120분"
+    assert parse_api_payload("1000", payload).program.running_time == 120
+
+    payload["data"]["runningTime"] = "정보 없음"
+    assert parse_api_payload("1000", payload).program.running_time is None
+
+
+def test_unexpected_shape_returns_none():
+    assert parse_api_payload("1000", {}) is None
+    assert parse_api_payload("1000", {"data": {"titleKr": "x"}}) is None
+    payload = fixture_payload()
+    payload["data"]["providers"] = []
+    assert parse_api_payload("1000", payload) is None
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+
+class SlowResponse:
+    url = "https://m.kinolights.com/api/v1/titles/1000"
+    ok = True
+
+    async def json(self):
+        await asyncio.sleep(10)
+
+
+def test_pending_reads_are_cancelled_on_exit():
+    async def run():
+        page = FakePage()
+        async with TitleResponseCapture(page, "1000", timeout=10) as capture:
+            page.listeners[0](SlowResponse())
+            assert await capture.wait() is None
+            tasks = set(capture._reads)
+        await asyncio.sleep(0)
+        return tasks, capture, page
+
+    tasks, capture, page = asyncio.run(run())
+    assert tasks and all(t.cancelled() for t in tasks)
+    assert not capture._reads
+    assert not page.listeners
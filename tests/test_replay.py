@@ -0,0 +1,42 @@
+import asyncio
+import json
+import structlog
+from crawlers.replay import SnapshotReplay
+from fixtures.kino_server import FixtureCatalog, render_api
+from utils import SnapshotStore
+
+
+class ListSink:
+    def __init__(self):
+        self.items = []
+
+    async def put(self, data):
+        self.items.append(data)
+
+
+def test_bad_snapshots_are_skipped_without_aborting_replay(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    catalog = FixtureCatalog(size=30)
+    store.save("1000", "api", json.loads(render_api(catalog.title(1000))))
+    # 이전 형식(파서가 예상하지 않은 구조)의 스냅샷
+    store.save(
+        "1001",
+        "api",
+        {
+            "data": {
+                "titleKr": "작품",
+                "synopsis": {"text": "줄거리"},
+                "providers": [{"name": "넷플릭스"}],
+            }
+        },
+    )
+    # 손상된 본문
+    digest = store.save("1002", "api", {"data": {}})
+    store._blob_path(digest).write_bytes(b"not gzip")
+
+    sink = ListSink()
+    replay = SnapshotReplay(store, sink, logger=structlog.get_logger())
+    assert asyncio.run(replay.run()) == 1
+
+    assert [data.program.kino_id for data in sink.items] == [1000]
+    assert replay.skipped == 2
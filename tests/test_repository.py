@@ -0,0 +1,126 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from aiomysql.cursors import RE_INSERT_VALUES
+from sqlalchemy.dialects.mysql.aiomysql import dialect as aiomysql_dialect
+from sqlalchemy.sql import Select, Update
+from db.reference import ott_reference
+from db.repository import Repository, _content_hash
+from models import Availability, KinoData, OTTPlatform, Program
+
+
+class FakeResult:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.rowcount = len(self.rows)
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """실행한 문장을 기록하고, 조회는 선택한 컬럼 이름으로 미리 정한 행을 반환"""
+
+    def __init__(self, rows: dict[tuple[str, ...], list]):
+        self.rows = rows
+        self.executed: list[tuple] = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        if isinstance(stmt, Select):
+            names = tuple(c.name for c in stmt.selected_columns)
+            return FakeResult(self.rows.get(names, ()))
+        return FakeResult()
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def mapping(*pairs):
+    return [SimpleNamespace(crawling_id=c, program_id=p) for c, p in pairs]
+
+
+def kino_data(kino_id: int) -> KinoData:
+    program = Program(kino_id, f"작품 {kino_id}", "드라마", "", "")
+    availability = Availability(
+        OTTPlatform.NETFLIX, "https://example.com", release_date=date(2026, 1, 1)
+    )
+    return KinoData(program, [availability])
+
+
+def save(monkeypatch, session: FakeSession, results: list[KinoData]):
+    monkeypatch.setattr(ott_reference, "_ids", {})
+    ott_reference.load([(OTTPlatform.NETFLIX.value, 1)])
+    return asyncio.run(Repository(session).save_crawl_results(results))
+
+
+def test_upsert_chunks_use_driver_multi_values_rewrite(monkeypatch):
+    session = FakeSession({("crawling_id", "program_id"): mapping((1, 10), (2, 20))})
+    assert save(monkeypatch, session, [kino_data(1), kino_data(2)])
+
+    upserts = [(stmt, params) for stmt, params in session.executed if params]
+    assert {stmt.table.name for stmt, _ in upserts} == {
+        "Program",
+        "Program_Availability",
+    }
+    for stmt, params in upserts:
+        sql = str(stmt.compile(dialect=aiomysql_dialect(), column_keys=list(params[0])))
+        assert "now()" not in sql.split(" ON DUPLICATE")[0].lower()
+        assert RE_INSERT_VALUES.match(sql), sql
+        # 한 묶음의 행은 같은 시각을 파라미터로 받음
+        assert len({row["updated_at"] for row in params}) == 1
+
+
+def test_chunk_counts_come_from_existing_keys(monkeypatch):
+    old = SimpleNamespace(
+        crawling_id=1, program_id=10, content_hash="old", ranking=None
+    )
+    session = FakeSession(
+        {
+            ("crawling_id", "program_id", "content_hash", "ranking"): [old],
+            ("crawling_id", "program_id"): mapping((2, 20)),
+        }
+    )
+    report = save(monkeypatch, session, [kino_data(1), kino_data(2)])
+
+    programs = [c for c in report.chunks if c.table == "Program"]
+    assert [(c.rows, c.inserted, c.updated) for c in programs] == [(2, 1, 1)]
+    availabilities = [c for c in report.chunks if c.table == "Program_Availability"]
+    assert [(c.rows, c.inserted, c.updated) for c in availabilities] == [(2, 2, 0)]
+
+
+def test_ranking_only_change_keeps_updated_at(monkeypatch):
+    data = kino_data(1)
+    data.program.ranking = 3
+    p = data.program
+    content_hash = _content_hash(
+        {
+            "crawling_id": p.kino_id,
+            "title": p.title,
+            "genre": p.genre,
+            "description": p.description,
+            "thumbnail_url": p.thumbnail_url,
+            "backdrop_url": p.backdrop_url,
+            "running_time": p.running_time,
+        }
+    )
+    old = SimpleNamespace(
+        crawling_id=1, program_id=10, content_hash=content_hash, ranking=7
+    )
+    session = FakeSession(
+        {("crawling_id", "program_id", "content_hash", "ranking"): [old]}
+    )
+    report = save(monkeypatch, session, [data])
+
+    assert not [c for c in report.chunks if c.table == "Program"]
+    [stmt] = [
+        stmt
+        for stmt, _ in session.executed
+        if isinstance(stmt, Update) and stmt.table.name == "Program"
+    ]
+    sql = str(stmt.compile(dialect=aiomysql_dialect()))
+    assert "updated_at=`Program`.updated_at" in sql
+    assert "ranking=CASE" in sql
@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+from crawlers.resources import ResourceFilter, context_options
+from utils import config
+
+
+def make_filter():
+    return ResourceFilter(
+        blocked_types=["image", "media", "font"],
+        blocked_patterns=[r"google-analytics\.com", r"/analytics/"],
+        allowed_patterns=[r"kinolights\.com"],
+    )
+
+
+def test_blocks_resource_types_even_when_allowed():
+    f = make_filter()
+    assert f.should_block("image", "https://static.kinolights.com/poster.jpg")
+    assert f.should_block("font", "https://fonts.example.com/a.woff2")
+
+
+def test_blocks_matching_url_patterns():
+    f = make_filter()
+    assert f.should_block("script", "https://www.google-analytics.com/ga.js")
+    assert f.should_block("xhr", "https://cdn.example.com/analytics/collect")
+
+
+def test_allow_pattern_wins_over_block_pattern():
+    f = make_filter()
+    assert not f.should_block("xhr", "https://m.kinolights.com/analytics/ping")
+
+
+def test_passes_unmatched_requests():
+    f = make_filter()
+    assert not f.should_block("document", "https://m.kinolights.com/title/1")
+    assert not f.should_block("script", "https://cdn.example.com/app.js")
+
+
+def test_default_config_keeps_first_party_api():
+    f = ResourceFilter.from_config()
+    assert not f.should_block("fetch", f"{config.KINO_BASE_URL}/api/v1/titles/1")
+    assert f.should_block("image", f"{config.KINO_BASE_URL}/poster.png")
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.action = None
+
+    async def abort(self):
+        self.action = "abort"
+
+    async def continue_(self):
+        self.action = "continue"
+
+
+def test_handle_aborts_and_counts_blocked_requests():
+    f = make_filter()
+    routes = [
+        FakeRoute("image", "https://a.com/x.png"),
+        FakeRoute("image", "https://a.com/y.png"),
+        FakeRoute("document", "https://m.kinolights.com/"),
+    ]
+
+    async def run():
+        for route in routes:
+            await f.handle(route)
+
+    asyncio.run(run())
+    assert [r.action for r in routes] == ["abort", "abort", "continue"]
+    assert f.blocked == {"image": 2}
+
+
+def test_context_options_lowers_scale_factor(monkeypatch):
+    device = {"viewport": {"width": 393, "height": 727}, "device_scale_factor": 2.75}
+    monkeypatch.setattr(config, "LEAN_BROWSER", True)
+    assert context_options(device)["device_scale_factor"] == 1
+    assert device["device_scale_factor"] == 2.75
+    monkeypatch.setattr(config, "LEAN_BROWSER", False)
+    assert context_options(device)["device_scale_factor"] == 2.75